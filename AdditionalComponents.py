@@ -1,5 +1,7 @@
-import math
 import queue
+import threading
+import numpy as np
+from collections import OrderedDict
 
 
 class Polygon:
@@ -8,11 +10,16 @@ class Polygon:
         Popis
         ----------------------------------------------------------------------------------------------------------------
         Trieda slúžiaca na vytvorenie priestrorovej mriežky. Trieda definuje súradnice vrcholov a hrany tejto mriežky.
+        Mriežka môže mať ľubovoľný počet rozmerov. Vrcholy aj hrany sú vytvorené vektorovo pomocou knižnice numpy,
+        preto je možné aj veľmi jemné delenie hrán.
 
         Atribúty
         ----------------------------------------------------------------------------------------------------------------
-        :var self.Peaks: obsahuje v sebe zoznamy držiace súradnice vrcholov na jednotlivých osiach X, Y prípadne Z.
-        :var self.Edges: zoznam hrán. Je tvorený dvojicami inexov na začiatočný a koncový vrchol v poli vrcholov.
+        :var self.Peaks: numpy array typu float32 s rozmerom (počet osí, počet vrcholov). Riadky obsahujú súradnice
+                         vrcholov na jednotlivých osiach X, Y, Z, ... Vrcholy sú zoradené tak, že najrýchlejšie sa mení
+                         súradnica na osi X.
+        :var self.Edges: numpy array typu int32 s rozmerom (počet hrán, 2). Každá hrana je tvorená dvojicou indexov na
+                         začiatočný a koncový vrchol v poli vrcholov.
 
         Parametre
         ----------------------------------------------------------------------------------------------------------------
@@ -21,70 +28,44 @@ class Polygon:
         :param divide_list: zoznam obsahujúci, na koľko častí majú byť hrany v jednotlivých smeroch rozdelené.
         """
         # Podľa minimálneho počtu zadaných súradníc v zoznamoch poskytnutých ako parameter je určený počet súradnic, čo
-        # zároveň predstavuje aj dimenziu mriežky, ktorá má byť vytvorená. Do atribútu Peaks je priradený zoznam
-        # obsahujúci vnorené listy, ktorých počet je rovný hodnote v premennej number_of_cords. Sú definované
-        # pomocné zoznamy. Do zoznamu cord_sign bude pre každú os pridelené znamienko pomocou ktorého bude.
-        # Do zoznamu max_size je uložený rozsah medzi maximálnou a minimálnou hodnotou súradnice pre každú
-        # z osí.
+        # zároveň predstavuje aj dimenziu mriežky, ktorá má byť vytvorená.
         number_of_cords = min(len(lower_list), len(upper_list))
-        self.Peaks = [[] for _ in range(number_of_cords)]
-        self.Edges = []
-        cord_sign = []
-        max_size = []
-        for i in range(number_of_cords):
-            max_size.append(math.fabs(lower_list[i] - upper_list[i]))
-            cord_sign.append(1 if lower_list[i] < upper_list[i] else -1)
+        lower = np.asarray(lower_list[:number_of_cords], dtype=np.float64)
+        upper = np.asarray(upper_list[:number_of_cords], dtype=np.float64)
 
         # Je vytvorená pomocná premenná new divide, ktorá bude držať ifnormáciu o tom, ako majú byť hrany v jednotlivých
-        # smeroch rozdelené.
-        new_divide = []
-        if len(divide_list) != number_of_cords:
-            # Najskôr je zistené či je dĺžka zoznamu totožná s počtom osí, na ktorých bude polygón vytvorený.
-            number_of_divide = min(len(divide_list), number_of_cords)
-            for i in range(number_of_divide):
-                # Následne sa testuje, či hodnota zadaná v zozname je valídna. Ak nie, je nastavená defaultná hodnota
-                # ktorá značí, že hrana nebude rozdelená.
-                new_divide.append(divide_list[i])
-                if new_divide[i] < 1:
-                    new_divide[i] = 1
-            # Ak by náhodou nebol poskytnutý dostatočný počet v zozname na delenie hrán na jednotlivých osiach, bude
-            # tento zoznam palnený defaultnými hodnotami, čo znamená, že hrany na osiach nebudú delené.
-            for i in range(number_of_cords - number_of_divide):
-                new_divide.append(1)
-        else:
-            new_divide = divide_list
-
-        # Je definoaná pomocná premenná, ktorá obsahuje offset, o ktorý sa budú posúvať vytvarané nové vrcholy v smeroch
-        # osí.
-        offset_list = []
-        for i in range(number_of_cords):
-            offset_list.append(cord_sign[i] * (max_size[i] / new_divide[i]))
-
-        # Podľa toho, či je požadovaná 2D alebo 3D mriežka sú definované vrcholy a hrany, ktoré tieto vrcholy spájajú.
-        if number_of_cords == 3:
-            for z in range(new_divide[2] + 1):
-                for y in range(new_divide[1] + 1):
-                    for x in range(new_divide[0] + 1):
-                        point_number = z * ((new_divide[1] + 1) * (new_divide[0] + 1)) + y * (new_divide[0] + 1) + x
-                        self.Peaks[0].append(lower_list[0] + x * offset_list[0])
-                        self.Peaks[1].append(lower_list[1] + y * offset_list[1])
-                        self.Peaks[2].append(lower_list[2] + z * offset_list[2])
-                        if x != new_divide[0]:
-                            self.Edges.append([point_number, point_number + 1])
-                        if y != new_divide[1]:
-                            self.Edges.append([point_number, point_number + (new_divide[0] + 1)])
-                        if z != new_divide[2]:
-                            self.Edges.append([point_number, point_number + (new_divide[1] + 1) * (new_divide[0] + 1)])
+        # smeroch rozdelené. Nevalídne hodnoty sú nahradené hodnotou 1, ktorá značí, že hrana nebude rozdelená. Ak by
+        # nebol poskytnutý dostatočný počet hodnôt, je zoznam doplnený taktiež hodnotami 1.
+        new_divide = [max(int(divide), 1) for divide in divide_list[:number_of_cords]]
+        new_divide += [1] * (number_of_cords - len(new_divide))
+
+        # Počet vrcholov na každej osi je o jeden väčší ako počet častí, na ktoré je hrana rozdelená. Index vrcholu je
+        # určený tak, že os X má krok 1, os Y krok rovný počtu vrcholov na osi X a podobne pre ďalšie osi. Pole
+        # indexov vrcholov je preto tvarované v opačnom poradí osí, teda posledný rozmer poľa zodpovedá osi X.
+        peaks_per_axis = [divide + 1 for divide in new_divide]
+        grid_shape = peaks_per_axis[::-1]
+        peak_ids = np.arange(int(np.prod(grid_shape)), dtype=np.int32).reshape(grid_shape)
+
+        # Pomocou funkcie indices sú pre každý vrchol získané jeho poradové čísla na jednotlivých osiach. Súradnice
+        # vrcholov sú vypočítané ako najnižšia hodnota na osi posunutá o násobok veľkosti jedného dielu hrany.
+        # Poradie osí je otočené späť, aby prvý riadok zodpovedal osi X.
+        offset = (upper - lower) / np.asarray(new_divide, dtype=np.float64)
+        axis_indices = np.indices(grid_shape).reshape(number_of_cords, -1)[::-1]
+        self.Peaks = (lower[:, np.newaxis] + axis_indices * offset[:, np.newaxis]).astype(np.float32)
+
+        # Hrany v smere určitej osi spájajú každý vrchol, ktorý nie je posledný na tejto osi, s nasledujúcim vrcholom.
+        # Začiatočné vrcholy sú teda všetky vrcholy okrem poslednej vrstvy na danej osi a koncové vrcholy všetky
+        # vrcholy okrem prvej vrstvy. Hrany všetkých osí sú spojené do jedného poľa.
+        edges = []
+        for axis in range(number_of_cords):
+            array_axis = number_of_cords - 1 - axis
+            start_ids = np.delete(peak_ids, -1, axis=array_axis).ravel()
+            end_ids = np.delete(peak_ids, 0, axis=array_axis).ravel()
+            edges.append(np.stack([start_ids, end_ids], axis=1))
+        if edges:
+            self.Edges = np.concatenate(edges).astype(np.int32, copy=False)
         else:
-            for y in range(new_divide[1] + 1):
-                for x in range(new_divide[0] + 1):
-                    point_number = y * (new_divide[0] + 1) + x
-                    self.Peaks[0].append(lower_list[0] + x * offset_list[0])
-                    self.Peaks[1].append(lower_list[1] + y * offset_list[1])
-                    if x != new_divide[0]:
-                        self.Edges.append([point_number, point_number + 1])
-                    if y != new_divide[1]:
-                        self.Edges.append([point_number, point_number + (new_divide[0] + 1)])
+            self.Edges = np.empty((0, 2), dtype=np.int32)
 
 
 class QueueSet:
@@ -187,3 +168,160 @@ class QueueSet:
         Metóda vracia počet prvkov v štruktúre.
         """
         return len(self.set)
+
+
+class StaleComputationError(Exception):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Výnimka signalizujúca, že prebiehajúci výpočet patrí k zastaranému stavu váh. Počas výpočtu došlo k ďalšej zmene
+    váh, preto nemá zmysel výpočet dokončiť ani zobraziť jeho výsledok.
+    """
+    pass
+
+
+def get_value_size(value):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Odhadne veľkosť hodnoty v pamäti. Započítané sú numpy polia a pandas štruktúry, aj ak sú vnorené v slovníkoch,
+    listoch alebo n-ticiach.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param value: hodnota, ktorej veľkosť má byť určená.
+
+    Návratová hodnota
+    --------------------------------------------------------------------------------------------------------------------
+    :return: odhadovaná veľkosť hodnoty v bajtoch.
+    """
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if hasattr(value, 'to_numpy'):
+        return value.to_numpy().nbytes
+    if isinstance(value, dict):
+        return sum(get_value_size(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(get_value_size(item) for item in value)
+    return 0
+
+
+class LRUCache:
+    def __init__(self, max_entries=None, max_bytes=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Ohraničená vyrovnávacia pamäť, ktorá si pamätá posledne použité hodnoty. Ak je prekročený maximálny počet
+        záznamov alebo maximálna veľkosť záznamov v pamäti, sú odstránené záznamy, ktoré boli najdlhšie nepoužité.
+        Prístup k štruktúre je chránený zámkom, takže ju je možné používať z viacerých vlákien.
+
+        Atribúty
+        ----------------------------------------------------------------------------------------------------------------
+        :var self.__entries:     usporiadaný slovník záznamov. Ku každému záznamu je uložená aj jeho veľkosť. Posledne
+                                 použitý záznam je na konci slovníka.
+        :var self.__max_entries: maximálny počet záznamov alebo None, ak počet nie je obmedzený.
+        :var self.__max_bytes:   maximálna veľkosť všetkých záznamov v bajtoch alebo None, ak nie je obmedzená.
+        :var self.__size:        aktuálna veľkosť všetkých záznamov v bajtoch.
+        :var self.__lock:        zámok chrániaci prístup k záznamom.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param max_entries: maximálny počet záznamov.
+        :param max_bytes:   maximálna veľkosť všetkých záznamov v bajtoch.
+        """
+        self.__entries = OrderedDict()
+        self.__max_entries = max_entries
+        self.__max_bytes = max_bytes
+        self.__size = 0
+        self.__lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vráti hodnotu uloženú pod zadaným kľúčom a označí ju ako posledne použitú.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param key:     kľúč hľadaného záznamu.
+        :param default: hodnota vrátená v prípade, ak záznam neexistuje.
+        """
+        with self.__lock:
+            if key not in self.__entries:
+                return default
+            self.__entries.move_to_end(key)
+            return self.__entries[key][0]
+
+    def put(self, key, value):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Uloží hodnotu pod zadaný kľúč. Ak je prekročený maximálny počet záznamov, sú odstránené najdlhšie nepoužité
+        záznamy.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param key:   kľúč záznamu.
+        :param value: ukladaná hodnota.
+        """
+        with self.__lock:
+            if key in self.__entries:
+                self.__size -= self.__entries.pop(key)[1]
+            value_size = get_value_size(value)
+            self.__entries[key] = (value, value_size)
+            self.__size += value_size
+            self.evict()
+
+    def evict(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Odstráni najdlhšie nepoužité záznamy, kým nie sú splnené obmedzenia počtu a veľkosti záznamov. Metóda je volaná
+        pri uzamknutom zámku.
+        """
+        while self.__entries and (
+                (self.__max_entries is not None and len(self.__entries) > self.__max_entries) or
+                (self.__max_bytes is not None and self.__size > self.__max_bytes)):
+            self.__size -= self.__entries.popitem(last=False)[1][1]
+
+    def clear(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Metóda odstráni všetky záznamy.
+        """
+        with self.__lock:
+            self.__entries.clear()
+            self.__size = 0
+
+    def __contains__(self, key):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Metóda vracia informáciu o tom, či sa záznam so zadaným kľúčom nachádza v štruktúre.
+        """
+        with self.__lock:
+            return key in self.__entries
+
+    def __len__(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Metóda vracia počet záznamov v štruktúre.
+        """
+        return len(self.__entries)
+
+    ############################### GETTERS AND SETTERS ################################
+    @property
+    def size(self):
+        return self.__size
+
+    @property
+    def max_bytes(self):
+        return self.__max_bytes
+
+    @max_bytes.setter
+    def max_bytes(self, value):
+        with self.__lock:
+            self.__max_bytes = value
+            self.evict()
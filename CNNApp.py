@@ -141,6 +141,11 @@ class GraphPage(QWidget):
         save_btn.clicked.connect(self.save_model)
         save_layout.addWidget(save_btn, alignment=QtCore.Qt.AlignRight)
 
+        # Inicializácia checkboxu, ktorým je možné zapnúť výpočet výstupov vrstiev v samostatnom procese.
+        inference_process_cb = QCheckBox('Separate inference process', group_wrapper_save)
+        inference_process_cb.toggled.connect(self.on_inference_process_check)
+        save_layout.insertWidget(0, inference_process_cb)
+
 
 
         # Pridanie wrappera skupiny načítacích elementov do rozmiestnenia. Nachádza sa na ľavej strane a je taktiež
@@ -154,6 +159,18 @@ class GraphPage(QWidget):
         # Pridanie hlavného okna do rozmiestnenia stránky.
         vertical_layout.addWidget(self.__mg_frame)
 
+    def on_inference_process_check(self, checked):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Zapne alebo vypne výpočet výstupov vrstiev pomocou keras modelu v samostatnom procese.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param checked: stav checkboxu.
+        """
+        self.__logic_layer.use_inference_worker = checked
+
     def try_open_model(self):
         """
         Popis
@@ -340,6 +357,7 @@ class GraphPage(QWidget):
             # následne je model uložený na zvolené miesto.
             if file_path != '':
                 self.__file_path, self.__file_name = ntpath.split(file_path)
+                self.__logic_layer.synchronize_keras_weights()
                 self.__keras_model.save(file_path)
             self.__save_ilabel.hide()
         else:
@@ -354,9 +372,12 @@ def except_hook(cls, exception, traceback):
     sys.__excepthook__(cls, exception, traceback)
 
 
-sys.excepthook = except_hook
-app = QApplication(sys.argv)
-window = VisualizationApp()
-window.showMaximized()
+# Aplikácia je spustená len pri priamom spustení skriptu. Procesy skupiny procesov na výpočet metód na redukciu
+# priestoru tento skript načítavajú tiež, no nesmú pri tom vytvoriť ďalšie okno aplikácie.
+if __name__ == '__main__':
+    sys.excepthook = except_hook
+    app = QApplication(sys.argv)
+    window = VisualizationApp()
+    window.showMaximized()
 
-app.exec_()
+    app.exec_()
@@ -0,0 +1,1680 @@
+import os
+import atexit
+import hashlib
+import inspect
+import weakref
+import threading
+import multiprocessing
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from sklearn import preprocessing
+from sklearn.decomposition import PCA
+from sklearn.manifold import TSNE
+from sklearn.neighbors import NearestNeighbors
+
+# Vlastný výpočet metódy t-SNE využíva pomocné funkcie knižnice sklearn, ktoré nie sú súčasťou jej verejného rozhrania.
+# Ak by v nainštalovanej verzií neboli dostupné alebo by sa zmenili ich parametre, je metóda počítaná pomocou triedy
+# TSNE bez uchovávania afinít.
+try:
+    from sklearn.manifold._t_sne import _joint_probabilities_nn, _kl_divergence_bh
+except ImportError:
+    _joint_probabilities_nn = _kl_divergence_bh = None
+
+# Novšie verzie knižnice sklearn dokážu gradient metódy Barnes-Hut počítať vo viacerých vláknach.
+try:
+    from sklearn.utils._openmp_helpers import _openmp_effective_n_threads
+    T_SNE_GRADIENT_OPTIONS = {'num_threads': _openmp_effective_n_threads()}
+except ImportError:
+    T_SNE_GRADIENT_OPTIONS = {}
+
+SELU_ALPHA = 1.6732632423543772
+SELU_SCALE = 1.0507009873554805
+MAX_INCREMENTAL_CHANGES = 64
+INCREMENTAL_REFRESH_LIMIT = 1000
+PROCESS_POOL_THRESHOLD = 100000
+RESULT_POLL_INTERVAL = 0.05
+INFERENCE_BATCH_SIZE = 1024
+TRUNCATED_PCA_COMPONENTS = 10
+WARM_START_ITERATION_RATIO = 0.25
+MIN_T_SNE_ITERATIONS = 250
+T_SNE_EXPLORATION_ITERATIONS = 250
+T_SNE_CHECK_INTERVAL = 50
+T_SNE_MIN_GRAD_NORM = 1e-7
+LANDMARK_NEIGHBORS = 10
+
+
+def sigmoid(x):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Numericky stabilný výpočet sigmoidy. Pre veľké záporné hodnoty nedochádza k pretečeniu exponenciály.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param x: pole vstupných hodnôt.
+    """
+    return np.exp(-np.logaddexp(0, -x))
+
+
+def softmax(x, axis=-1):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Výpočet funkcie softmax pozdĺž zadanej osi. Od hodnôt je pred výpočtom exponenciály odčítané maximum, aby nedošlo
+    k pretečeniu.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param x:    pole vstupných hodnôt.
+    :param axis: os, pozdĺž ktorej je softmax počítaný.
+    """
+    exp_x = np.exp(x - np.max(x, axis=axis, keepdims=True))
+    return exp_x / np.sum(exp_x, axis=axis, keepdims=True)
+
+
+# Slovník aktivačných funkcií, ktoré je možné vypočítať bez knižnice tensorflow. Kľúčom je názov aktivačnej funkcie tak,
+# ako je uvedený v konfigurácií keras vrstvy.
+ACTIVATION_FUNCTIONS = {
+    'linear': lambda x: x,
+    'relu': lambda x: np.maximum(x, 0),
+    'sigmoid': sigmoid,
+    'tanh': np.tanh,
+    'softmax': softmax,
+    'softplus': lambda x: np.logaddexp(0, x),
+    'softsign': lambda x: x / (1 + np.abs(x)),
+    'elu': lambda x: np.where(x > 0, x, np.expm1(np.minimum(x, 0))),
+    'selu': lambda x: SELU_SCALE * np.where(x > 0, x, SELU_ALPHA * np.expm1(np.minimum(x, 0))),
+    'exponential': np.exp,
+    'swish': lambda x: x * sigmoid(x),
+    'silu': lambda x: x * sigmoid(x)
+}
+
+# Aktivačné funkcie, ktorých výstup pre jeden prvok závisí aj od ostatných prvkov. Pri ich použití nie je možné
+# prepočítať len zmenené výstupy vrstvy.
+NON_ELEMENTWISE_ACTIVATIONS = {'softmax'}
+
+# Vrstvy, ktoré sa pri predikcií správajú ako identita.
+IDENTITY_LAYERS = {'InputLayer', 'Dropout', 'GaussianNoise', 'GaussianDropout', 'AlphaDropout', 'SpatialDropout1D',
+                   'SpatialDropout2D', 'SpatialDropout3D', 'ActivityRegularization'}
+
+
+def get_activation_function(name):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Vráti aktivačnú funkciu podľa jej názvu v konfigurácií keras vrstvy.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param name: názov aktivačnej funkcie.
+
+    Návratová hodnota
+    --------------------------------------------------------------------------------------------------------------------
+    :return: funkcia pracujúca s numpy poľami alebo None, ak aktivačná funkcia nie je podporovaná.
+    """
+    if not isinstance(name, str):
+        return None
+    return ACTIVATION_FUNCTIONS.get(name)
+
+
+def relu_layer_function(config):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Vytvorí funkciu zodpovedajúcu vrstve ReLU s nastaveniami podľa konfigurácie keras vrstvy.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param config: konfigurácia keras vrstvy.
+    """
+    max_value = config.get('max_value')
+    negative_slope = float(config.get('negative_slope') or 0)
+    threshold = float(config.get('threshold') or 0)
+
+    def relu_function(x):
+        output = np.where(x >= threshold, x, negative_slope * (x - threshold))
+        if max_value is not None:
+            output = np.minimum(output, max_value)
+        return output
+    return relu_function
+
+
+class DenseOperations:
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Trieda definuje výpočet výstupu hustej vrstvy pred aplikovaním aktivačnej funkcie a jeho úpravu pri zmene váh.
+    """
+    def prepare_input(self, state):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Hustá vrstva nepotrebuje vstup nijako upravovať.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param state: stav vrstvy obsahujúci jej vstup.
+        """
+        state['prepared_input'] = state['input']
+
+    def pre_activation(self, state, weights):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Výstup hustej vrstvy bez biasov je súčin vstupu s maticou váh.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param state:   stav vrstvy obsahujúci jej vstup.
+        :param weights: matica váh vrstvy.
+        """
+        return np.matmul(state['prepared_input'], weights)
+
+    def apply_weights_change(self, state, weights_change, changed):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Zmena váhy w_ij o hodnotu delta zmení výstup pred aplikovaním aktivačnej funkcie pre každý vstup o x_i * delta
+        v stĺpci j. Ide teda o úpravu hodnosti jedna, ktorej zložitosť závisí len od počtu vstupov.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param state:          stav vrstvy.
+        :param weights_change: rozdiel aktuálnych a uložených váh.
+        :param changed:        indexy zmenených váh v sploštenom poli váh.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: indexy zmenených neurónov.
+        """
+        rows, columns = np.unravel_index(changed, weights_change.shape)
+        layer_input = state['prepared_input']
+        pre_activation = state['pre_activation']
+        for row, column in zip(rows, columns):
+            pre_activation[..., column] += layer_input[..., row] * weights_change[row, column]
+        return columns
+
+
+class ConvolutionOperations:
+    def __init__(self, strides, dilation_rate, padding):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Trieda definuje výpočet výstupu 2D konvolučnej vrstvy pred aplikovaním aktivačnej funkcie a jeho úpravu pri
+        zmene váh. Konvolúcia je počítaná ako súčet príspevkov jednotlivých pozícií jadra. Príspevok pozície
+        (riadok, stĺpec) je súčin posunutého výrezu vstupu s maticou váh tejto pozície.
+
+        Atribúty
+        ----------------------------------------------------------------------------------------------------------------
+        :var self.__strides:  krok konvolúcie vo výške a šírke.
+        :var self.__dilation: rozostup prvkov jadra vo výške a šírke.
+        :var self.__padding:  spôsob doplnenia vstupu, 'valid' alebo 'same'.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param strides:       krok konvolúcie z konfigurácie keras vrstvy.
+        :param dilation_rate: rozostup prvkov jadra z konfigurácie keras vrstvy.
+        :param padding:       spôsob doplnenia vstupu z konfigurácie keras vrstvy.
+        """
+        self.__strides = tuple(strides)
+        self.__dilation = tuple(dilation_rate)
+        self.__padding = padding
+
+    def prepare_input(self, state):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Doplní vstup nulami podľa nastavenia vrstvy a určí výšku a šírku výstupu. Pri doplnení 'same' je rovnako ako v
+        knižnici tensorflow prípadný nepárny prvok doplnený na koniec.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param state: stav vrstvy obsahujúci jej vstup a váhy.
+        """
+        layer_input = state['input']
+        kernel_shape = state['weights'].shape[:2]
+        output_shape = []
+        pad_width = [(0, 0)]
+        for axis in range(2):
+            input_size = layer_input.shape[axis + 1]
+            effective_kernel = (kernel_shape[axis] - 1) * self.__dilation[axis] + 1
+            if self.__padding == 'same':
+                output_size = -(-input_size // self.__strides[axis])
+                pad_total = max((output_size - 1) * self.__strides[axis] + effective_kernel - input_size, 0)
+                pad_width.append((pad_total // 2, pad_total - pad_total // 2))
+            else:
+                output_size = (input_size - effective_kernel) // self.__strides[axis] + 1
+                pad_width.append((0, 0))
+            output_shape.append(output_size)
+        pad_width.append((0, 0))
+        if any(pad != (0, 0) for pad in pad_width):
+            layer_input = np.pad(layer_input, pad_width)
+        state['prepared_input'] = layer_input
+        state['output_shape'] = tuple(output_shape)
+
+    def kernel_tap(self, state, row, column):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vráti výrez doplneného vstupu, ktorý je pri výpočte konvolúcie násobený váhami pozície jadra (row, column).
+        Ide o pohľad na vstup posunutý podľa pozície v jadre a vzorkovaný podľa kroku konvolúcie.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param state:  stav vrstvy.
+        :param row:    riadok jadra.
+        :param column: stĺpec jadra.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: výrez vstupu s rozmerom (vzorky, výška výstupu, šírka výstupu, vstupné kanály).
+        """
+        height, width = state['output_shape']
+        row_start = row * self.__dilation[0]
+        column_start = column * self.__dilation[1]
+        return state['prepared_input'][:, row_start:row_start + self.__strides[0] * (height - 1) + 1:self.__strides[0],
+                                       column_start:column_start + self.__strides[1] * (width - 1) + 1:
+                                       self.__strides[1]]
+
+    def pre_activation(self, state, weights):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vypočíta výstup konvolúcie bez biasov ako súčet súčinov výrezov vstupu s maticami váh pre každú pozíciu jadra.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param state:   stav vrstvy.
+        :param weights: jadro konvolúcie s rozmerom (výška, šírka, vstupné kanály, feature mapy).
+        """
+        pre_activation = np.zeros((len(state['prepared_input']), *state['output_shape'], weights.shape[-1]),
+                                  dtype=np.float32)
+        for row in range(weights.shape[0]):
+            for column in range(weights.shape[1]):
+                pre_activation += np.matmul(self.kernel_tap(state, row, column), weights[row, column])
+        return pre_activation
+
+    def apply_weights_change(self, state, weights_change, changed):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Zmena jednej váhy jadra na pozícií (row, column) pre vstupný kanál channel a feature mapu fm zmení výstup
+        pred aplikovaním aktivačnej funkcie len na tejto feature mape. Zmena je rovná výrezu vstupného kanála
+        posunutému podľa pozície v jadre, ktorý je vynásobený zmenou váhy.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param state:          stav vrstvy.
+        :param weights_change: rozdiel aktuálnych a uložených váh.
+        :param changed:        indexy zmenených váh v sploštenom poli váh.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: indexy zmenených feature máp.
+        """
+        indexes = np.unravel_index(changed, weights_change.shape)
+        pre_activation = state['pre_activation']
+        for row, column, channel, feature_map in zip(*indexes):
+            pre_activation[..., feature_map] += weights_change[row, column, channel, feature_map] * \
+                                                self.kernel_tap(state, row, column)[..., channel]
+        return indexes[3]
+
+
+class NumpyEngine:
+    def __init__(self, keras_layers, layers_weights, layers_biases):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Trieda, ktorá zrkadlí vrstvy keras modelu a počíta ich výstupy pomocou knižnice numpy. Pri zmene váh je tak
+        možné prepočítať výstupy podporovaných vrstiev bez volania knižnice tensorflow. Váhy a biasy sú čítané
+        priamo z polí, ktoré menia posuvníky váh, preto nie je potrebné ich do triedy osobitne nastavovať.
+
+        Atribúty
+        ----------------------------------------------------------------------------------------------------------------
+        :var self.__layers_functions: list funkcií, ktoré pre každú vrstvu z jej vstupu vypočítajú výstup. Ak vrstva
+                                      nie je podporovaná, je na jej pozícií hodnota None.
+        :var self.__layers_weights:   list odkazov na polia váh jednotlivých vrstiev.
+        :var self.__layers_biases:    list odkazov na polia biasov jednotlivých vrstiev.
+        :var self.__layers_states:    slovník uložených stavov vrstiev s váhami. Stav obsahuje vstup, výstup pred
+                                      aplikovaním aktivačnej funkcie, výstup vrstvy a kópie váh a biasov, s ktorými
+                                      bol výstup vypočítaný. Na základe stavu je možné pri zmene niekoľkých váh
+                                      výstup vrstvy len upraviť namiesto jeho celého prepočítania.
+        :var self.__convolution_layers: set poradových čísel konvolučných vrstiev.
+        :var self.__weighted_layers:  set poradových čísel podporovaných vrstiev s váhami.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param keras_layers:   list vrstiev keras modelu.
+        :param layers_weights: list polí váh jednotlivých vrstiev.
+        :param layers_biases:  list polí biasov jednotlivých vrstiev.
+        """
+        self.__layers_weights = layers_weights
+        self.__layers_biases = layers_biases
+        self.__layers_states = dict()
+        self.__convolution_layers = set()
+        self.__weighted_layers = set()
+        self.__layers_functions = [self.create_layer_function(layer_number, layer)
+                                   for layer_number, layer in enumerate(keras_layers)]
+
+    def create_layer_function(self, layer_number, keras_layer):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Na základe typu a konfigurácie keras vrstvy vytvorí funkciu, ktorá z jej vstupu vypočíta výstup.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layer_number: poradové číslo vrstvy.
+        :param keras_layer:  vrstva keras modelu.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: funkcia vrstvy alebo None, ak vrstva nie je podporovaná.
+        """
+        # Typ vrstvy je určený podľa názvu jej triedy. Konfigurácia vrstvy obsahuje ďalšie nastavenia, ako napríklad
+        # názov použitej aktivačnej funkcie.
+        layer_type = type(keras_layer).__name__
+        try:
+            config = keras_layer.get_config()
+        except NotImplementedError:
+            return None
+
+        if layer_type in IDENTITY_LAYERS:
+            return lambda x: x
+        elif layer_type == 'Flatten':
+            return lambda x: x.reshape(len(x), -1)
+        elif layer_type == 'Reshape':
+            target_shape = tuple(config['target_shape'])
+            return lambda x: x.reshape(len(x), *target_shape)
+        elif layer_type == 'Activation':
+            return get_activation_function(config.get('activation'))
+        elif layer_type == 'ReLU':
+            return relu_layer_function(config)
+        elif layer_type == 'LeakyReLU':
+            alpha = float(config.get('alpha', config.get('negative_slope', 0.3)))
+            return lambda x: np.where(x >= 0, x, alpha * x)
+        elif layer_type == 'Softmax':
+            axis = config.get('axis', -1)
+            if not isinstance(axis, int):
+                return None
+            return lambda x: softmax(x, axis)
+        elif layer_type in ('Dense', 'Conv2D'):
+            # Vrstvy s váhami vyžadujú pole váh aj biasov a podporovanú aktivačnú funkciu.
+            activation_name = config.get('activation')
+            activation = get_activation_function(activation_name)
+            if activation is None or self.__layers_weights[layer_number] is None:
+                return None
+            elementwise = activation_name not in NON_ELEMENTWISE_ACTIVATIONS
+            if layer_type == 'Dense':
+                operations = DenseOperations()
+            else:
+                # Podporovaná je len konvolúcia s usporiadaním dát (vzorky, výška, šírka, kanály) bez skupín.
+                if config.get('data_format') not in (None, 'channels_last') or config.get('groups', 1) != 1 or \
+                        config.get('padding') not in ('valid', 'same'):
+                    return None
+                operations = ConvolutionOperations(config['strides'], config['dilation_rate'], config['padding'])
+                self.__convolution_layers.add(layer_number)
+            self.__weighted_layers.add(layer_number)
+            return lambda x, weights=None, biases=None: self.compute_weighted_layer(
+                layer_number, x, operations, activation, elementwise, weights, biases)
+        return None
+
+    def compute_weighted_layer(self, layer_number, layer_input, operations, activation, elementwise, weights=None,
+                               biases=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vypočíta výstup vrstvy s váhami. Ak sa vstup vrstvy od posledného výpočtu nezmenil a zmenilo sa len niekoľko
+        váh alebo biasov, je výstup vrstvy pred aplikovaním aktivačnej funkcie upravený len v zmenených kanáloch, teda
+        neurónoch pri hustej vrstve alebo feature mapách pri konvolučnej vrstve. Aktivačná funkcia je následne
+        aplikovaná len na tieto kanály.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layer_number: poradové číslo vrstvy.
+        :param layer_input:  vstup vrstvy.
+        :param operations:   inštancia triedy, ktorá definuje výpočet výstupu a jeho úpravu pre daný typ vrstvy.
+        :param activation:   aktivačná funkcia vrstvy.
+        :param elementwise:  hodnota značiaca, či aktivačná funkcia pracuje s každým prvkom osobitne.
+        :param weights:      kópia váh, z ktorej má byť výstup vypočítaný. Ak nie je zadaná, je vytvorená kópia
+                             aktuálnych váh.
+        :param biases:       kópia biasov, z ktorej má byť výstup vypočítaný. Ak nie je zadaná, je vytvorená kópia
+                             aktuálnych biasov.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: výstup vrstvy.
+        """
+        # Ak nie sú zadané, sú vytvorené kópie aktuálnych váh a biasov, keďže posuvníky ich môžu počas výpočtu meniť.
+        # Kópie sú uložené do stavu vrstvy a pri ďalšom výpočte sú porovnávané s novými hodnotami.
+        if weights is None:
+            weights = np.array(self.__layers_weights[layer_number])
+        if biases is None:
+            biases = np.array(self.__layers_biases[layer_number])
+        state = self.__layers_states.get(layer_number)
+
+        # Výstup je možné upraviť len ak existuje stav vrstvy vypočítaný z rovnakého vstupu. Aby sa pri opakovaných
+        # úpravách nehromadila numerická chyba, je po určitom počte úprav výstup vypočítaný celý.
+        if state is not None and state['input'] is layer_input and state['updates'] < INCREMENTAL_REFRESH_LIMIT:
+            weights_change = weights - state['weights']
+            changed = np.flatnonzero(weights_change)
+            biases_change = biases - state['biases']
+            changed_biases = np.flatnonzero(biases_change)
+            if len(changed) + len(changed_biases) <= MAX_INCREMENTAL_CHANGES:
+
+                # Výstup pred aplikovaním aktivačnej funkcie je upravovaný na mieste zmenami váh aj biasov. Ak by s ním
+                # uložený výstup vrstvy zdieľal pamäť, zmenil by sa aj výstup predchádzajúceho stavu, ktorý už môže
+                # byť vo vyrovnávacej pamäti, preto je v takom prípade najskôr skopírovaný.
+                if np.may_share_memory(state['output'], state['pre_activation']):
+                    state['pre_activation'] = state['pre_activation'].copy()
+
+                # Zmeny váh sú aplikované na uložený výstup pred aplikovaním aktivačnej funkcie. Návratovou hodnotou
+                # sú indexy zmenených výstupných kanálov.
+                changed_channels = operations.apply_weights_change(state, weights_change, changed)
+                pre_activation = state['pre_activation']
+
+                # Bias je konštantný posun výstupného kanála, preto je jeho zmena pripočítaná k celému výstupnému
+                # neurónu, prípadne k celej feature mape.
+                for channel in changed_biases:
+                    pre_activation[..., channel] += biases_change[channel]
+                changed_channels = np.concatenate([changed_channels, changed_biases])
+
+                # Pôvodný výstup môže byť používaný inými vláknami, preto je upravovaná jeho kópia. Aktivačná funkcia
+                # je aplikovaná len na zmenené kanály, ak to aktivačná funkcia umožňuje.
+                output = state['output'].copy()
+                if elementwise:
+                    changed_channels = np.unique(changed_channels)
+                    output[..., changed_channels] = activation(pre_activation[..., changed_channels])
+                else:
+                    output = np.array(activation(pre_activation), dtype=np.float32)
+                state['output'] = output
+                state['weights'] = weights
+                state['biases'] = biases
+                state['updates'] += 1
+                return output
+
+        # V ostatných prípadoch je výstup vrstvy vypočítaný celý. Výsledok je spolu s použitými váhami uložený ako nový
+        # stav vrstvy.
+        state = {'input': layer_input, 'weights': weights, 'biases': biases, 'updates': 0}
+        operations.prepare_input(state)
+        pre_activation = operations.pre_activation(state, weights) + biases
+        # Výstup je vždy uložený do samostatného poľa. Pri lineárnej aktivačnej funkcii by inak išlo o rovnaké pole ako
+        # výstup pred aplikovaním aktivačnej funkcie, ktorý je pri ďalšej zmene váh upravovaný na mieste. Tým by sa
+        # zmenil aj výstup, ktorý už bol vrátený a je uložený vo vyrovnávacej pamäti pre predchádzajúce váhy.
+        output = np.array(activation(pre_activation), dtype=np.float32)
+        state['pre_activation'] = pre_activation
+        state['output'] = output
+        self.__layers_states[layer_number] = state
+        return output
+
+    def is_convolution(self, layer_number):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vráti informáciu o tom, či ide o konvolučnú vrstvu. Celý výpočet takýchto vrstiev je v keras modeli rýchlejší,
+        no úprava výstupu po zmene jednej váhy je pomocou tejto triedy výrazne lacnejšia.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layer_number: poradové číslo vrstvy.
+        """
+        return layer_number in self.__convolution_layers
+
+    def supports(self, layer_number):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vráti informáciu o tom, či je možné výstup vrstvy vypočítať pomocou tejto triedy.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layer_number: poradové číslo vrstvy.
+        """
+        return self.__layers_functions[layer_number] is not None
+
+    def compute_layer(self, layer_number, layer_input, weights=None, biases=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vypočíta výstup zadanej vrstvy. Vstup je prevedený na typ float32, aby výpočet zodpovedal výpočtu v keras
+        modeli.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layer_number: poradové číslo vrstvy.
+        :param layer_input:  vstup vrstvy.
+        :param weights:      kópia váh vrstvy, z ktorej má byť výstup vypočítaný, alebo None pre aktuálne váhy.
+        :param biases:       kópia biasov vrstvy, z ktorej má byť výstup vypočítaný, alebo None pre aktuálne biasy.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: výstup vrstvy vo forme numpy array typu float32.
+        """
+        layer_input = np.asarray(layer_input, dtype=np.float32)
+        if layer_number in self.__weighted_layers:
+            output = self.__layers_functions[layer_number](layer_input, weights, biases)
+        else:
+            output = self.__layers_functions[layer_number](layer_input)
+        return np.asarray(output, dtype=np.float32)
+
+
+def get_number_of_components(points, fit_step=1, n_components=None):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Určí počet hlavných komponentov, ktoré vzniknú pri výpočte metódy PCA pre zadané body.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param points:       pole bodov s rozmerom (počet bodov, počet príznakov).
+    :param fit_step:     krok, s ktorým sú vybrané body na určenie hlavných komponentov.
+    :param n_components: požadovaný počet komponentov. Hodnota None značí všetky komponenty.
+
+    Návratová hodnota
+    --------------------------------------------------------------------------------------------------------------------
+    :return: počet vzniknutých hlavných komponentov.
+    """
+    number_of_components = min(len(points[::fit_step]), points.shape[1])
+    if n_components is not None:
+        number_of_components = min(number_of_components, n_components)
+    return number_of_components
+
+
+def compute_pca_projection(points, fit_step=1, n_components=None):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Vypočíta metódu PCA pre zadané body. Body sú najskôr normalizované, aby metóda vyšším hodnotám neprikladala väčší
+    význam. Normalizácia aj hlavné komponenty sú určené z bodov vybraných so zadaným krokom, transformované sú všetky
+    body. Ak je zadaný počet komponentov menší ako počet všetkých komponentov, sú pomocou randomizovaného SVD určené len
+    najvýznamnejšie komponenty.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param points:       pole bodov s rozmerom (počet bodov, počet príznakov).
+    :param fit_step:     krok, s ktorým sú vybrané body na určenie hlavných komponentov.
+    :param n_components: počet požadovaných hlavných komponentov. Hodnota None značí všetky komponenty.
+
+    Návratová hodnota
+    --------------------------------------------------------------------------------------------------------------------
+    :return: n-tica obsahujúca transformované body, podiel vysvetlenej variability jednotlivých komponentov, pole
+             hlavných komponentov, stred a mierku bodov. Pomocou posledných troch hodnôt je možné funkciou
+             project_with_basis premietnuť ďalšie body do rovnakej bázy.
+    """
+    # Pri vykonávaní metódy môže dôjsť k tomu, že nastane delenie nulou. Vtedy by bolo vypísané varovanie. Pomocou
+    # tohto príkazu je tento varovný výpis potlačený.
+    np.seterr(divide='ignore', invalid='ignore')
+    fit_points = points[::fit_step]
+    scaler = preprocessing.StandardScaler().fit(fit_points)
+    scaled_points = scaler.transform(fit_points)
+
+    # Pri širokých vrstvách by výpočet všetkých komponentov trval zbytočne dlho, pretože zobrazené sú najviac tri.
+    # Randomizované SVD vypočíta len požadovaný počet komponentov. Celková variabilita je v takom prípade určená
+    # priamo ako súčet rozptylov jednotlivých príznakov, aby percentá vysvetlenej variability zodpovedali úplnému
+    # výpočtu.
+    number_of_components = get_number_of_components(points, fit_step, n_components)
+    if number_of_components < min(scaled_points.shape):
+        pca = PCA(n_components=number_of_components, svd_solver='randomized', random_state=0)
+        pca.fit(scaled_points)
+        total_variance = np.var(scaled_points, axis=0, ddof=1).sum()
+        variance_ratio = pca.explained_variance_ / total_variance
+    else:
+        pca = PCA()
+        pca.fit(scaled_points)
+        variance_ratio = pca.explained_variance_ratio_
+
+    # Posun normalizácie aj posun metódy PCA sú spojené do jedného stredu, takže premietnutie bodov do bázy je len
+    # jedno odčítanie, delenie a násobenie matíc.
+    mean = scaler.mean_ + pca.mean_ * scaler.scale_
+    return pca.transform(scaler.transform(points)), variance_ratio, pca.components_, mean, scaler.scale_
+
+
+def project_with_basis(points, mean, scale, components):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Premietne body do bázy hlavných komponentov, ktorá bola určená pri predchádzajúcom výpočte metódy PCA. Ide len o
+    jedno násobenie matíc, preto je premietnutie výrazne lacnejšie ako opätovný výpočet metódy.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param points:     pole bodov s rozmerom (počet bodov, počet príznakov).
+    :param mean:       stred bodov, s ktorým bola báza určená.
+    :param scale:      mierka jednotlivých príznakov, s ktorou bola báza určená.
+    :param components: pole hlavných komponentov s rozmerom (počet komponentov, počet príznakov).
+
+    Návratová hodnota
+    --------------------------------------------------------------------------------------------------------------------
+    :return: pole premietnutých bodov s rozmerom (počet bodov, počet komponentov).
+    """
+    return ((points - mean) / scale) @ components.transpose()
+
+
+def get_feature_map_matrix(point_cords, feature_map=None):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Vráti výstup vrstvy vo forme matice, v ktorej riadky zodpovedajú jednotlivým bodom. Výstup vrstvy je uložený v tvare
+    (body, výška, šírka, feature mapy), preto je matica zvolenej feature mapy získaná jedným výberom a zmenou tvaru
+    bez cyklu cez jednotlivé body. Pri vrstvách bez feature máp ide len o pohľad na výstup vrstvy.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param point_cords:  transponovaný výstup vrstvy, teda pole s rozmerom (feature mapy, šírka, výška, body), prípadne
+                         (výstupy, body).
+    :param feature_map:  poradové číslo feature mapy alebo None, ak vrstva feature mapy nemá.
+
+    Návratová hodnota
+    --------------------------------------------------------------------------------------------------------------------
+    :return: matica výstupov v tvare (body, príznaky).
+    """
+    points = point_cords.transpose()
+    if feature_map is not None:
+        points = points[..., feature_map]
+    return points.reshape(len(points), -1)
+
+
+def get_points_fingerprint(points):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Vypočíta odtlačok bodov, pomocou ktorého je možné zistiť, či sa body od predchádzajúceho výpočtu zmenili.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param points: pole bodov.
+
+    Návratová hodnota
+    --------------------------------------------------------------------------------------------------------------------
+    :return: n-tica obsahujúca rozmer, typ a hash hodnôt poľa.
+    """
+    points = np.ascontiguousarray(points)
+    return points.shape, points.dtype.str, hashlib.blake2b(points.view(np.uint8), digest_size=16).hexdigest()
+
+
+def get_weights_digest(layer_weights, layer_biases):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Vypočíta hash váh a biasov vrstvy. Rovnaké hodnoty váh dávajú rovnaký hash, preto je ho možné použiť ako súčasť
+    kľúča pri ukladaní výsledkov, ktoré od váh závisia.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param layer_weights: pole váh vrstvy alebo None, ak vrstva váhy nemá.
+    :param layer_biases:  pole biasov vrstvy alebo None, ak vrstva biasy nemá.
+
+    Návratová hodnota
+    --------------------------------------------------------------------------------------------------------------------
+    :return: hash váh a biasov vo forme reťazca.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for array in (layer_weights, layer_biases):
+        if array is not None:
+            array = np.ascontiguousarray(array)
+            digest.update(str(array.shape).encode())
+            digest.update(array.view(np.uint8))
+    return digest.hexdigest()
+
+
+def compute_t_sne_affinities(points, perplexity):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Vypočíta maticu afinít P metódy t-SNE. Pre každý bod sú nájdení najbližší susedia a podmienené pravdepodobnosti sú
+    binárnym vyhľadávaním nastavené tak, aby zodpovedali zadanej perplexite. Výsledok závisí len od bodov a perplexity,
+    preto ho je možné použiť aj pri zmene ostatných parametrov metódy.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param points:     pole bodov s rozmerom (počet bodov, počet príznakov).
+    :param perplexity: perplexita metódy t-SNE.
+
+    Návratová hodnota
+    --------------------------------------------------------------------------------------------------------------------
+    :return: riedka symetrická matica afinít vo formáte CSR.
+    """
+    # Počet susedov je určený rovnako ako v knižnici sklearn. Vzdialenosti sú umocnené, pretože binárne vyhľadávanie
+    # pracuje so štvorcami vzdialeností.
+    n_neighbors = min(len(points) - 1, int(3. * perplexity + 1))
+    distances = NearestNeighbors(n_neighbors=n_neighbors).fit(points).kneighbors_graph(mode='distance')
+    distances.data **= 2
+    return _joint_probabilities_nn(distances, perplexity, 0)
+
+
+def optimize_t_sne_embedding(affinities, initial_embedding, config, progress=None):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Gradientným zostupom nájde rozloženie bodov, ktoré minimalizuje KL divergenciu voči matici afinít. Gradient je
+    počítaný metódou Barnes-Hut. Postup zodpovedá knižnici sklearn, teda najskôr prebieha fáza so zveličenými
+    afinitami a menším momentom a následne fáza so zvyšnými iteráciami.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param affinities:        riedka matica afinít vo formáte CSR.
+    :param initial_embedding: počiatočné súradnice bodov s rozmerom (počet bodov, počet komponentov).
+    :param config:            slovník parametrov metódy t-SNE.
+    :param progress:          funkcia, ktorej je každých T_SNE_CHECK_INTERVAL iterácií odovzdané číslo iterácie,
+                              celkový počet iterácií a priebežné súradnice bodov. Ak vráti True, je výpočet ukončený
+                              a výsledkom sú priebežné súradnice.
+
+    Návratová hodnota
+    --------------------------------------------------------------------------------------------------------------------
+    :return: pole transformovaných bodov s rozmerom (počet bodov, počet komponentov).
+    """
+    n_samples, n_components = initial_embedding.shape
+    degrees_of_freedom = max(n_components - 1, 1)
+    params = np.array(initial_embedding, dtype=np.float32).ravel()
+    update = np.zeros_like(params)
+    gains = np.ones_like(params)
+    n_iter = config['n_iter']
+    exploration_iter = min(T_SNE_EXPLORATION_ITERATIONS, n_iter)
+    learning_rate = config['learning_rate']
+    exaggerated = affinities * config['early_exaggeration']
+
+    for i in range(n_iter):
+        # Počas fázy zveličenia sú afinity vynásobené koeficientom early_exaggeration a je použitý menší moment.
+        if i < exploration_iter:
+            momentum, used_affinities = 0.5, exaggerated
+        else:
+            momentum, used_affinities = 0.8, affinities
+        _, grad = _kl_divergence_bh(params, used_affinities, degrees_of_freedom, n_samples, n_components,
+                                    compute_error=False, **T_SNE_GRADIENT_OPTIONS)
+
+        # Krok je prispôsobovaný samostatne pre každú súradnicu. Ak sa smer gradientu nezmenil, krok sa zväčšuje,
+        # inak sa zmenšuje.
+        inc = update * grad < 0.0
+        gains[inc] += 0.2
+        gains[~inc] *= 0.8
+        np.clip(gains, 0.01, np.inf, out=gains)
+        grad *= gains
+        update = momentum * update - learning_rate * grad
+        params += update
+
+        # Ak je gradient zanedbateľný, ďalšie iterácie by rozloženie už nezmenili. Priebežné súradnice sú odovzdané
+        # na zobrazenie a ak bol výpočet zrušený, je ukončený.
+        if (i + 1) % T_SNE_CHECK_INTERVAL == 0 and i + 1 < n_iter:
+            if np.linalg.norm(grad) <= T_SNE_MIN_GRAD_NORM:
+                break
+            if progress is not None and progress(i + 1, n_iter, params.reshape(n_samples, n_components)):
+                break
+    return params.reshape(n_samples, n_components)
+
+
+def create_sklearn_t_sne(config):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Vytvorí inštanciu triedy TSNE knižnice sklearn so zadanými parametrami. Počet iterácií je v novších verziách
+    knižnice zadávaný parametrom max_iter a parameter n_iter bol odstránený, preto je v takom prípade premenovaný.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param config: slovník parametrov metódy t-SNE.
+
+    Návratová hodnota
+    --------------------------------------------------------------------------------------------------------------------
+    :return: inštancia triedy TSNE.
+    """
+    config = dict(config)
+    if 'n_iter' in config and 'max_iter' in inspect.signature(TSNE).parameters:
+        config['max_iter'] = config.pop('n_iter')
+    return TSNE(**config)
+
+
+def compute_t_sne_embedding(points, config, affinities=None, progress=None):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Vypočíta metódu t-SNE pre všetky zadané body. Výpočet je rozdelený na výpočet matice afinít a optimalizáciu
+    rozloženia bodov. Ak je matica afinít poskytnutá, je prvá, výpočtovo náročnejšia časť vynechaná.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param points:     pole bodov s rozmerom (počet bodov, počet príznakov).
+    :param config:     slovník parametrov metódy t-SNE.
+    :param affinities: matica afinít z predchádzajúceho výpočtu s rovnakými bodmi a perplexitou alebo None.
+    :param progress:   funkcia na odovzdávanie priebežných výsledkov, viď. optimize_t_sne_embedding.
+
+    Návratová hodnota
+    --------------------------------------------------------------------------------------------------------------------
+    :return: n-tica obsahujúca pole transformovaných bodov s rozmerom (počet bodov, počet komponentov) a maticu afinít.
+             Ak nie sú pomocné funkcie knižnice sklearn dostupné, je namiesto matice afinít vrátená hodnota None.
+    """
+    if _kl_divergence_bh is not None:
+        # Počiatočné rozloženie je buď zadané v konfigurácií, alebo je určené metódou PCA a zmenšené tak, aby
+        # smerodajná odchýlka prvej súradnice bola 1e-4, rovnako ako v knižnici sklearn.
+        initial_embedding = config.get('init')
+        if not isinstance(initial_embedding, np.ndarray):
+            n_components = config['n_components']
+            initial_embedding = PCA(n_components=n_components, svd_solver='randomized',
+                                    random_state=0).fit_transform(points)
+            initial_embedding = initial_embedding / np.std(initial_embedding[:, 0]) * 1e-4
+
+        # Pomocné funkcie nie sú súčasťou verejného rozhrania knižnice sklearn, preto sa ich parametre, typy polí
+        # alebo obsah modulu môžu v inej verzií líšiť. Ak ich nie je možné zavolať, je použitá trieda TSNE.
+        try:
+            if affinities is None:
+                affinities = compute_t_sne_affinities(points, config['perplexity'])
+            return optimize_t_sne_embedding(affinities, initial_embedding, config, progress), affinities
+        except (TypeError, ValueError, AttributeError):
+            pass
+    return create_sklearn_t_sne(config).fit_transform(points), None
+
+
+def get_min_landmarks(config):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Vráti najmenší počet vybraných bodov, pre ktorý je možné metódu t-SNE vypočítať. Vybraných bodov musí byť viac ako
+    komponentov, aby bolo možné určiť počiatočné rozloženie metódou PCA, a každý bod musí mať celé okolie určené
+    parametrom perplexity.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param config: slovník parametrov metódy t-SNE.
+
+    Návratová hodnota
+    --------------------------------------------------------------------------------------------------------------------
+    :return: najmenší prípustný počet vybraných bodov.
+    """
+    return max(int(config['n_components']) + 1, int(3. * config['perplexity']) + 2)
+
+
+def select_landmarks(n_samples, n_landmarks, labels=None):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Vyberie indexy bodov, na ktorých bude vypočítaná metóda t-SNE. Ak sú dostupné triedy bodov, je výber stratifikovaný,
+    teda z každej triedy je vybraný počet bodov úmerný jej veľkosti, no aspoň jeden bod. Výber je deterministický,
+    aby pri opakovanom výpočte boli použité rovnaké body.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param n_samples:   počet všetkých bodov.
+    :param n_landmarks: požadovaný počet vybraných bodov.
+    :param labels:      zoznam tried jednotlivých bodov alebo None.
+
+    Návratová hodnota
+    --------------------------------------------------------------------------------------------------------------------
+    :return: zoradené pole indexov vybraných bodov.
+    """
+    rng = np.random.default_rng(0)
+    if labels is None or len(labels) != n_samples:
+        return np.sort(rng.choice(n_samples, n_landmarks, replace=False))
+
+    # Body sú rozdelené podľa tried a z každej triedy je náhodne vybraný príslušný počet bodov.
+    _, inverse, counts = np.unique(np.asarray(labels, dtype=str), return_inverse=True, return_counts=True)
+    selected = []
+    for class_index, count in enumerate(counts):
+        class_members = np.flatnonzero(inverse == class_index)
+        class_landmarks = min(count, max(1, int(round(count * n_landmarks / n_samples))))
+        selected.append(rng.choice(class_members, class_landmarks, replace=False))
+    selected = np.concatenate(selected)
+
+    # Zaokrúhľovaním a výberom aspoň jedného bodu z každej triedy môže byť vybraných viac bodov, ako bolo požadované.
+    # Počet vybraných bodov je preto obmedzený náhodným výberom z nich.
+    if len(selected) > n_landmarks:
+        selected = rng.choice(selected, n_landmarks, replace=False)
+    return np.sort(selected)
+
+
+def get_interpolation_weights(points, landmark_points, n_neighbors=LANDMARK_NEIGHBORS):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Pre každý bod nájde najbližšie vybrané body v priestore aktivácií a určí ich váhy nepriamo úmerné vzdialenosti.
+    Súradnice bodu v zobrazení metódy t-SNE sú potom váženým priemerom súradníc týchto susedov.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param points:          pole všetkých bodov s rozmerom (počet bodov, počet príznakov).
+    :param landmark_points: pole vybraných bodov s rozmerom (počet vybraných bodov, počet príznakov).
+    :param n_neighbors:     počet susedov použitých pri interpolácií.
+
+    Návratová hodnota
+    --------------------------------------------------------------------------------------------------------------------
+    :return: n-tica obsahujúca pole indexov susedov a pole ich váh, obe s rozmerom (počet bodov, počet susedov).
+    """
+    n_neighbors = min(n_neighbors, len(landmark_points))
+    distances, neighbors = NearestNeighbors(n_neighbors=n_neighbors).fit(landmark_points).kneighbors(points)
+
+    # Vybrané body majú samé seba ako najbližšieho suseda s nulovou vzdialenosťou, preto je ich poloha zachovaná.
+    weights = 1.0 / np.maximum(distances, 1e-12)
+    weights /= weights.sum(axis=1, keepdims=True)
+    return neighbors, weights
+
+
+def interpolate_embedding(landmark_embedding, neighbors, weights):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Určí súradnice všetkých bodov ako vážený priemer súradníc ich najbližších vybraných bodov.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param landmark_embedding: súradnice vybraných bodov s rozmerom (počet vybraných bodov, počet komponentov).
+    :param neighbors:          pole indexov susedov z funkcie get_interpolation_weights.
+    :param weights:            pole váh susedov z funkcie get_interpolation_weights.
+
+    Návratová hodnota
+    --------------------------------------------------------------------------------------------------------------------
+    :return: pole súradníc všetkých bodov s rozmerom (počet bodov, počet komponentov).
+    """
+    return np.einsum('nk,nkc->nc', weights, landmark_embedding[neighbors])
+
+
+def compute_t_sne_projection(points, config, affinities=None, progress=None, labels=None):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Vypočíta metódu t-SNE pre zadané body. Ak je počet bodov väčší ako parameter n_landmarks, je metóda vypočítaná len
+    pre stratifikovane vybranú podmnožinu bodov a ostatné body sú umiestnené interpoláciou z ich najbližších
+    susedov v priestore aktivácií. Vďaka tomu je možné zobraziť aj veľmi veľké množstvo bodov.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param points:     pole bodov s rozmerom (počet bodov, počet príznakov).
+    :param config:     slovník parametrov metódy t-SNE.
+    :param affinities: matica afinít z predchádzajúceho výpočtu s rovnakými bodmi a parametrami alebo None.
+    :param progress:   funkcia na odovzdávanie priebežných výsledkov, viď. optimize_t_sne_embedding.
+    :param labels:     zoznam tried jednotlivých bodov použitý pri výbere podmnožiny alebo None.
+
+    Návratová hodnota
+    --------------------------------------------------------------------------------------------------------------------
+    :return: rovnaká n-tica ako pri funkcii compute_t_sne_embedding.
+    """
+    # Príliš malý počet vybraných bodov je zvýšený na najmenší prípustný počet.
+    config = dict(config)
+    n_landmarks = config.pop('n_landmarks', 0)
+    if n_landmarks > 0:
+        n_landmarks = max(n_landmarks, get_min_landmarks(config))
+    if not 0 < n_landmarks < len(points):
+        return compute_t_sne_embedding(points, config, affinities, progress)
+
+    # Metóda je vypočítaná pre vybrané body. Ak je zadané počiatočné rozloženie všetkých bodov, je z neho vybrané
+    # rozloženie vybraných bodov.
+    landmarks = select_landmarks(len(points), n_landmarks, labels)
+    landmark_points = points[landmarks]
+    initial_embedding = config.get('init')
+    if isinstance(initial_embedding, np.ndarray) and len(initial_embedding) == len(points):
+        config['init'] = initial_embedding[landmarks]
+
+    # Susedia a ich váhy sú určení len raz, takže aj priebežné výsledky je možné interpolovať pre všetky body.
+    neighbors, weights = get_interpolation_weights(points, landmark_points)
+    landmark_progress = None
+    if progress is not None:
+        def landmark_progress(iteration, n_iter, embedding):
+            return progress(iteration, n_iter, interpolate_embedding(embedding, neighbors, weights))
+
+    landmark_embedding, affinities = compute_t_sne_embedding(landmark_points, config, affinities, landmark_progress)
+    embedding = interpolate_embedding(landmark_embedding, neighbors, weights)
+    embedding[landmarks] = landmark_embedding
+    return embedding, affinities
+
+
+def get_warm_start_config(config, previous_embedding):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Vytvorí konfiguráciu metódy t-SNE, ktorá pokračuje z predchádzajúceho výsledku. Body sú inicializované na
+    súradnice z predchádzajúceho výpočtu, preto pri menších zmenách váh stačí výrazne menší počet iterácií a body
+    medzi jednotlivými snímkami neskáču. Fáza zveličenia je vypnutá, pretože zhluky sú už v počiatočnom rozložení
+    oddelené.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param config:             slovník parametrov metódy t-SNE.
+    :param previous_embedding: pole súradníc z predchádzajúceho výpočtu s rozmerom (počet bodov, počet komponentov).
+
+    Návratová hodnota
+    --------------------------------------------------------------------------------------------------------------------
+    :return: nový slovník parametrov metódy t-SNE.
+    """
+    warm_config = dict(config)
+    warm_config['init'] = np.asarray(previous_embedding, dtype=np.float32)
+    warm_config['early_exaggeration'] = 1.0
+    warm_config['n_iter'] = max(MIN_T_SNE_ITERATIONS, int(config['n_iter'] * WARM_START_ITERATION_RATIO))
+    return warm_config
+
+
+def release_shared_memory(shm):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Uzavrie a odstráni blok zdieľanej pamäte. Funkcia je volaná po zaniknutí posledného poľa, ktoré pamäť používa.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param shm: inštancia triedy SharedMemory.
+    """
+    shm.close()
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def create_shared_array(shape, dtype=np.float32):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Vytvorí numpy pole uložené v zdieľanej pamäti. Pamäť je uvoľnená automaticky, keď zanikne vytvorené pole aj všetky
+    jeho pohľady.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param shape: rozmer poľa.
+    :param dtype: typ prvkov poľa.
+
+    Návratová hodnota
+    --------------------------------------------------------------------------------------------------------------------
+    :return: n-tica obsahujúca pole a jeho popis. Popis je možné poslať inému procesu, ktorý sa pomocou neho k poľu
+             pripojí.
+    """
+    dtype = np.dtype(dtype)
+    shape = tuple(int(dimension) for dimension in shape)
+    shm = shared_memory.SharedMemory(create=True, size=max(int(np.prod(shape)) * dtype.itemsize, 1))
+    array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+    weakref.finalize(array, release_shared_memory, shm)
+    return array, (shm.name, shape, dtype.str)
+
+
+def attach_shared_array(description):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Pripojí sa k poľu v zdieľanej pamäti, ktoré vytvoril iný proces. Po skončení práce je potrebné odstrániť všetky
+    odkazy na pole a zdieľanú pamäť uzavrieť.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param description: popis poľa vrátený funkciou create_shared_array.
+
+    Návratová hodnota
+    --------------------------------------------------------------------------------------------------------------------
+    :return: n-tica obsahujúca inštanciu triedy SharedMemory a pole.
+    """
+    name, shape, dtype = description
+    shm = shared_memory.SharedMemory(name=name)
+    return shm, np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf)
+
+
+def init_projection_worker(max_workers):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Inicializuje proces skupiny procesov. Gradient metódy t-SNE by v každom procese používal všetky jadrá procesora,
+    takže pri súbežnom výpočte viacerých vrstiev by jadrá boli viacnásobne preťažené. Každému procesu je preto
+    pridelený len jeho podiel jadier.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param max_workers: počet procesov skupiny.
+    """
+    if 'num_threads' in T_SNE_GRADIENT_OPTIONS:
+        T_SNE_GRADIENT_OPTIONS['num_threads'] = max(1, (os.cpu_count() or 1) // max_workers)
+
+
+def pca_task(input_description, output_description, fit_step, n_components):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Úloha vykonávaná v procese skupiny procesov. Vypočíta metódu PCA pre body v zdieľanej pamäti a transformované
+    body zapíše do výstupného poľa v zdieľanej pamäti.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param input_description:  popis vstupného poľa bodov.
+    :param output_description: popis výstupného poľa transformovaných bodov.
+    :param fit_step:           krok, s ktorým sú vybrané body na určenie hlavných komponentov.
+    :param n_components:       počet požadovaných hlavných komponentov.
+
+    Návratová hodnota
+    --------------------------------------------------------------------------------------------------------------------
+    :return: n-tica obsahujúca podiel vysvetlenej variability jednotlivých komponentov, pole hlavných komponentov,
+             stred a mierku bodov.
+    """
+    input_shm, points = attach_shared_array(input_description)
+    output_shm, output = attach_shared_array(output_description)
+    try:
+        transformed, variance_ratio, components, mean, scale = compute_pca_projection(points, fit_step, n_components)
+        output[...] = transformed
+        return variance_ratio, components, mean, scale
+    finally:
+        del points, output
+        input_shm.close()
+        output_shm.close()
+
+
+def t_sne_task(input_description, output_description, config, affinities, labels, snapshot_description,
+               control_description):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Úloha vykonávaná v procese skupiny procesov. Vypočíta metódu t-SNE pre body v zdieľanej pamäti a transformované
+    body zapíše do výstupného poľa v zdieľanej pamäti. Priebežné súradnice sú zapisované do poľa snapshot a do
+    riadiaceho poľa je zapísané číslo iterácie, ku ktorej patria. Ak je v riadiacom poli nastavený príznak zrušenia, je
+    výpočet ukončený.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param input_description:  popis vstupného poľa bodov.
+    :param output_description: popis výstupného poľa transformovaných bodov.
+    :param config:             slovník parametrov metódy t-SNE.
+    :param affinities:           matica afinít z predchádzajúceho výpočtu alebo None.
+    :param labels:               zoznam tried jednotlivých bodov alebo None.
+    :param snapshot_description: popis poľa priebežných súradníc.
+    :param control_description:  popis riadiaceho poľa obsahujúceho číslo iterácie, počet iterácií a príznak zrušenia.
+
+    Návratová hodnota
+    --------------------------------------------------------------------------------------------------------------------
+    :return: nová matica afinít, ak bola počas úlohy vypočítaná, inak None.
+    """
+    input_shm, points = attach_shared_array(input_description)
+    output_shm, output = attach_shared_array(output_description)
+    snapshot_shm, snapshot = attach_shared_array(snapshot_description)
+    control_shm, control = attach_shared_array(control_description)
+
+    def progress(iteration, n_iter, embedding):
+        # Číslo iterácie je zapísané až po súradniciach, aby hlavný proces nečítal súradnice skôr, ako sú zapísané.
+        snapshot[...] = embedding
+        control[1] = n_iter
+        control[0] = iteration
+        return bool(control[2])
+
+    try:
+        output[...], new_affinities = compute_t_sne_projection(points, config, affinities, progress, labels)
+        return new_affinities if affinities is None else None
+    finally:
+        del points, output, snapshot, control
+        input_shm.close()
+        output_shm.close()
+        snapshot_shm.close()
+        control_shm.close()
+
+
+class ProjectionPool:
+    def __init__(self, max_workers=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Trvalá skupina procesov, v ktorej sú počítané metódy na redukciu priestoru. Výpočty vo vláknach si navzájom
+        konkurujú o GIL, preto sú pri väčšom počte bodov presunuté do samostatných procesov. Body aj výsledky sú
+        odovzdávané cez zdieľanú pamäť, takže nie je potrebné ich serializovať a výsledok je možné použiť bez
+        kopírovania. Procesy sú vytvorené až pri prvom použití a bežia do konca aplikácie.
+
+        Atribúty
+        ----------------------------------------------------------------------------------------------------------------
+        :var self.__max_workers: maximálny počet procesov skupiny.
+        :var self.__executor:    inštancia triedy ProcessPoolExecutor alebo None, ak skupina ešte nebola vytvorená.
+        :var self.__lock:        zámok chrániaci vytvorenie skupiny procesov, keďže ju používa viacero vlákien.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param max_workers: maximálny počet procesov. Ak nie je zadaný, je použitý počet jadier procesora.
+        """
+        self.__max_workers = max_workers or os.cpu_count() or 1
+        self.__executor = None
+        self.__lock = threading.Lock()
+
+    def get_executor(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vráti skupinu procesov. Ak ešte nebola vytvorená, je vytvorená. Procesy nie sú vytvárané pomocou fork, keďže
+        hlavný proces používa vlákna knižníc Qt a tensorflow. Ak je to možné, je použitý forkserver, ktorý načíta
+        moduly len raz a procesy skupiny ich zdieľajú.
+        """
+        with self.__lock:
+            if self.__executor is None:
+                if 'forkserver' in multiprocessing.get_all_start_methods():
+                    context = multiprocessing.get_context('forkserver')
+                    context.set_forkserver_preload(['__main__', __name__])
+                else:
+                    context = multiprocessing.get_context('spawn')
+                self.__executor = ProcessPoolExecutor(self.__max_workers, mp_context=context,
+                                                      initializer=init_projection_worker,
+                                                      initargs=(self.__max_workers,))
+                atexit.register(self.__executor.shutdown, wait=False, cancel_futures=True)
+            return self.__executor
+
+    def is_worth_using(self, points, method):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vráti informáciu o tom, či sa výpočet oplatí presunúť do skupiny procesov. Metóda t-SNE je náročná aj pre malý
+        počet bodov, metóda PCA až pri väčšom počte hodnôt.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param points: pole bodov, pre ktoré sa má metóda vypočítať.
+        :param method: názov metódy na redukciu priestoru.
+        """
+        return method == 't-SNE' or points.size >= PROCESS_POOL_THRESHOLD
+
+    def run_task(self, task, points, output_shape, arguments, check=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Skopíruje body do zdieľanej pamäte, pripraví výstupné pole v zdieľanej pamäti a úlohu spustí v skupine procesov.
+        Počas čakania na výsledok je pravidelne volaná funkcia check, ktorá môže čakanie prerušiť vyvolaním výnimky.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param task:         funkcia vykonávaná v procese skupiny.
+        :param points:       pole bodov.
+        :param output_shape: rozmer výstupného poľa.
+        :param arguments:    n-tica ďalších argumentov úlohy.
+        :param check:        funkcia volaná počas čakania na výsledok.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: n-tica obsahujúca výstupné pole v zdieľanej pamäti a návratovú hodnotu úlohy alebo None, ak skupinu
+                 procesov nebolo možné použiť.
+        """
+        shared_input, input_description = create_shared_array(points.shape, np.float32)
+        shared_input[...] = points
+        output, output_description = create_shared_array(output_shape, np.float64)
+        try:
+            future = self.get_executor().submit(task, input_description, output_description, *arguments)
+            while True:
+                try:
+                    return output, future.result(RESULT_POLL_INTERVAL)
+                except FutureTimeoutError:
+                    if check is not None:
+                        try:
+                            check()
+                        except Exception:
+                            future.cancel()
+                            raise
+        except (BrokenProcessPool, OSError):
+            # Ak proces skupiny neočakávane skončil, je skupina zahodená a pri ďalšom použití vytvorená znova. Výpočet
+            # je v takom prípade vykonaný priamo v aktuálnom procese.
+            with self.__lock:
+                self.__executor = None
+            return None
+
+    def pca(self, points, fit_step=1, check=None, n_components=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vypočíta metódu PCA v skupine procesov. Ak to nie je možné, je vypočítaná v aktuálnom procese.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param points:       pole bodov s rozmerom (počet bodov, počet príznakov).
+        :param fit_step:     krok, s ktorým sú vybrané body na určenie hlavných komponentov.
+        :param check:        funkcia volaná počas čakania na výsledok.
+        :param n_components: počet požadovaných hlavných komponentov. Hodnota None značí všetky komponenty.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: rovnaká n-tica ako pri funkcii compute_pca_projection.
+        """
+        number_of_components = get_number_of_components(points, fit_step, n_components)
+        result = self.run_task(pca_task, points, (len(points), number_of_components), (fit_step, n_components), check)
+        if result is None:
+            return compute_pca_projection(points, fit_step, n_components)
+        output, (variance_ratio, components, mean, scale) = result
+        return output, variance_ratio, components, mean, scale
+
+    def t_sne(self, points, config, check=None, affinities=None, progress=None, labels=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vypočíta metódu t-SNE v skupine procesov. Ak to nie je možné, je vypočítaná v aktuálnom procese.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param points:     pole bodov s rozmerom (počet bodov, počet príznakov).
+        :param config:     slovník parametrov metódy t-SNE.
+        :param check:      funkcia volaná počas čakania na výsledok.
+        :param affinities: matica afinít z predchádzajúceho výpočtu alebo None.
+        :param progress:   funkcia na odovzdávanie priebežných výsledkov, viď. optimize_t_sne_embedding.
+        :param labels:     zoznam tried jednotlivých bodov alebo None.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: rovnaká n-tica ako pri funkcii compute_t_sne_projection.
+        """
+        # Priebežné súradnice a riadiace pole sú v zdieľanej pamäti. Počas čakania na výsledok je kontrolované, či
+        # proces nezapísal novšie priebežné súradnice. Ak áno, sú odovzdané funkcii progress. Ak si funkcia progress
+        # vyžiada ukončenie, alebo funkcia check vyvolá výnimku, je v riadiacom poli nastavený príznak zrušenia, aby
+        # proces zbytočne nepokračoval vo výpočte.
+        output_shape = (len(points), config.get('n_components', 2))
+        snapshot, snapshot_description = create_shared_array(output_shape, np.float64)
+        control, control_description = create_shared_array((3,), np.float64)
+        control[...] = 0
+        published = [0]
+
+        def check_progress():
+            try:
+                if check is not None:
+                    check()
+                iteration = int(control[0])
+                if progress is not None and iteration > published[0]:
+                    published[0] = iteration
+                    if progress(iteration, int(control[1]), snapshot.copy()):
+                        control[2] = 1
+            except Exception:
+                control[2] = 1
+                raise
+
+        arguments = (config, affinities, labels, snapshot_description, control_description)
+        result = self.run_task(t_sne_task, points, output_shape, arguments, check_progress)
+        if result is None:
+            return compute_t_sne_projection(points, config, affinities, progress, labels)
+        output, new_affinities = result
+        return output, affinities if new_affinities is None else new_affinities
+
+    ############################### GETTERS AND SETTERS ################################
+    @property
+    def max_workers(self):
+        return self.__max_workers
+
+
+def remove_file(file_path):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Zmaže súbor, ak existuje.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param file_path: cesta k súboru.
+    """
+    try:
+        os.remove(file_path)
+    except OSError:
+        pass
+
+
+class InferenceWorkerError(Exception):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Výnimka signalizujúca, že proces na výpočet výstupov vrstiev neočakávane skončil alebo výpočet zlyhal. Výstupy je
+    v takom prípade potrebné vypočítať v hlavnom procese.
+    """
+    pass
+
+
+def inference_worker_main(connection, model_path):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Hlavná funkcia procesu, ktorý vlastní keras model a počíta výstupy jeho vrstiev. Knižnica tensorflow je načítaná
+    až v tomto procese. Proces prijíma príkazy cez spojenie a na každý príkaz, okrem príkazu cancel, odpovedá práve
+    jednou správou. Príkaz cancel preruší prebiehajúci výpočet, mimo výpočtu je ignorovaný.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param connection: koniec obojsmerného spojenia s hlavným procesom.
+    :param model_path: cesta k súboru s uloženým keras modelom.
+    """
+    from tensorflow import keras
+    model = keras.models.load_model(model_path, compile=False)
+    models_cache = dict()
+    while True:
+        message = connection.recv()
+        command = message[0]
+        if command == 'stop':
+            return
+        elif command == 'cancel':
+            continue
+        try:
+            if command == 'weights':
+                # Zmena váh je poslaná ako indexy a nové hodnoty zmenených prvkov pre pole váh aj biasov.
+                layer = model.layers[message[1]]
+                layer_weights = layer.get_weights()
+                for array_index, indexes, values in message[2]:
+                    layer_weights[array_index].flat[indexes] = values
+                layer.set_weights(layer_weights)
+                connection.send(('done',))
+            elif command == 'predict':
+                _, input_description, output_descriptions, layers_list, partial = message
+                cancelled = compute_worker_activations(connection, model, models_cache, input_description,
+                                                       output_descriptions, layers_list, partial)
+                connection.send(('cancelled',) if cancelled else ('done',))
+        except Exception as error:
+            connection.send(('error', repr(error)))
+
+
+def compute_worker_activations(connection, model, models_cache, input_description, output_descriptions, layers_list,
+                               partial):
+    """
+    Popis
+    --------------------------------------------------------------------------------------------------------------------
+    Vypočíta v procese na výpočet výstupov vrstiev výstupy zadaných vrstiev a zapíše ich do polí v zdieľanej pamäti.
+    Výpočet prebieha po dávkach a medzi nimi je kontrolované, či hlavný proces výpočet nezrušil.
+
+    Parametre
+    --------------------------------------------------------------------------------------------------------------------
+    :param connection:          koniec spojenia s hlavným procesom.
+    :param model:               keras model.
+    :param models_cache:        slovník pomocných modelov pre jednotlivé n-tice vrstiev.
+    :param input_description:   popis vstupného poľa v zdieľanej pamäti.
+    :param output_descriptions: popisy výstupných polí v zdieľanej pamäti pre jednotlivé vrstvy.
+    :param layers_list:         zoznam poradových čísel vrstiev, ktorých výstupy sa majú vypočítať.
+    :param partial:             ak je True, je vstup výstupom vrstvy predchádzajúcej prvej vrstve zoznamu a vrstvy sú
+                                volané postupne za sebou. Inak je vstupom vstup modelu.
+
+    Návratová hodnota
+    --------------------------------------------------------------------------------------------------------------------
+    :return: True, ak bol výpočet zrušený, inak False.
+    """
+    from tensorflow import keras
+    input_shm, layer_input = attach_shared_array(input_description)
+    attached = [attach_shared_array(description) for description in output_descriptions]
+    outputs = [output for _, output in attached]
+    try:
+        layers = [model.layers[layer_number] for layer_number in layers_list]
+        intermediate_model = None
+        if not partial:
+            intermediate_model = models_cache.get(tuple(layers_list))
+            if intermediate_model is None:
+                intermediate_model = keras.Model(inputs=model.input, outputs=[layer.output for layer in layers])
+                models_cache[tuple(layers_list)] = intermediate_model
+
+        for batch_start in range(0, len(layer_input), INFERENCE_BATCH_SIZE):
+            # Ak hlavný proces poslal príkaz na zrušenie výpočtu, je výpočet ukončený.
+            if connection.poll() and connection.recv()[0] == 'cancel':
+                return True
+            batch_end = batch_start + INFERENCE_BATCH_SIZE
+            if partial:
+                layer_output = layer_input[batch_start:batch_end]
+                for i, layer in enumerate(layers):
+                    layer_output = layer(layer_output, training=False)
+                    outputs[i][batch_start:batch_end] = np.asarray(layer_output)
+            else:
+                batch_outputs = intermediate_model.predict_on_batch(layer_input[batch_start:batch_end])
+                if not isinstance(batch_outputs, list):
+                    batch_outputs = [batch_outputs]
+                for i, batch_output in enumerate(batch_outputs):
+                    outputs[i][batch_start:batch_end] = np.asarray(batch_output)
+        return False
+    finally:
+        del layer_input, outputs
+        input_shm.close()
+        for shm, _ in attached:
+            shm.close()
+        del attached
+
+
+class InferenceWorker:
+    def __init__(self, model_path, layers_weights, layers_biases):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Trieda spravujúca samostatný proces, ktorý vlastní kópiu keras modelu a počíta výstupy jeho vrstiev. Výpočet
+        tak nesúťaží o GIL s grafickým rozhraním a prípadný pád knižnice tensorflow neukončí okno aplikácie. Procesu
+        sú posielané len zmenené prvky váh a vstupy aj výstupy sú odovzdávané cez zdieľanú pamäť.
+
+        Atribúty
+        ----------------------------------------------------------------------------------------------------------------
+        :var self.__model_file:   finalizer, ktorý zmaže dočasný súbor s uloženým modelom. Súbor je zmazaný pri
+                                  ukončení procesu, prípadne pri ukončení aplikácie.
+        :var self.__connection:   koniec spojenia s procesom.
+        :var self.__process:      proces, v ktorom beží funkcia inference_worker_main.
+        :var self.__lock:         zámok zaručujúci, že proces naraz spracúva len jeden príkaz.
+        :var self.__sent_weights: slovník kópií váh a biasov, ktoré má proces nastavené. Kľúčom je poradové číslo
+                                  vrstvy. Podľa nich sú určené zmenené prvky, ktoré je potrebné procesu poslať.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param model_path:     cesta k súboru s uloženým modelom.
+        :param layers_weights: list polí váh jednotlivých vrstiev, s ktorými bol model uložený.
+        :param layers_biases:  list polí biasov jednotlivých vrstiev, s ktorými bol model uložený.
+        """
+        # Proces je vytvorený metódou spawn, keďže hlavný proces používa vlákna knižníc Qt a tensorflow a vytvorenie
+        # procesu pomocou fork by nebolo bezpečné.
+        context = multiprocessing.get_context('spawn')
+        self.__model_file = weakref.finalize(self, remove_file, model_path)
+        self.__connection, child_connection = context.Pipe()
+        self.__process = context.Process(target=inference_worker_main, args=(child_connection, model_path),
+                                         daemon=True)
+        self.__process.start()
+        child_connection.close()
+        self.__lock = threading.Lock()
+        self.__sent_weights = dict()
+        for layer_number, (weights, biases) in enumerate(zip(layers_weights, layers_biases)):
+            if weights is not None and biases is not None:
+                self.__sent_weights[layer_number] = [np.array(weights), np.array(biases)]
+
+    def receive(self, check=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Počká na odpoveď procesu. Počas čakania je pravidelne volaná funkcia check, ktorá môže čakanie prerušiť
+        vyvolaním výnimky.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param check: funkcia volaná počas čakania na odpoveď.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: správa prijatá od procesu.
+        """
+        try:
+            while not self.__connection.poll(RESULT_POLL_INTERVAL):
+                if check is not None:
+                    check()
+            reply = self.__connection.recv()
+        except (EOFError, OSError):
+            raise InferenceWorkerError('Inference process terminated.')
+        if reply[0] == 'error':
+            raise InferenceWorkerError(reply[1])
+        return reply
+
+    def send(self, message):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Pošle procesu správu.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param message: n-tica, ktorej prvým prvkom je názov príkazu.
+        """
+        try:
+            self.__connection.send(message)
+        except (EOFError, OSError):
+            raise InferenceWorkerError('Inference process terminated.')
+
+    def set_layer_weights(self, layer_number, weights, biases):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Pošle procesu zmenené prvky váh a biasov zadanej vrstvy.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layer_number: poradové číslo vrstvy.
+        :param weights:      aktuálne pole váh vrstvy.
+        :param biases:       aktuálne pole biasov vrstvy.
+        """
+        with self.__lock:
+            sent_arrays = self.__sent_weights[layer_number]
+            changes = []
+            for array_index, array in enumerate((weights, biases)):
+                indexes = np.flatnonzero(np.asarray(array) != sent_arrays[array_index])
+                if len(indexes):
+                    values = np.asarray(array).flat[indexes]
+                    changes.append((array_index, indexes, values))
+                    sent_arrays[array_index].flat[indexes] = values
+            if changes:
+                self.send(('weights', layer_number, changes))
+                self.receive()
+
+    def predict(self, layer_input, layers_list, output_shapes, partial, check=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vypočíta v procese výstupy zadaných vrstiev. Ak funkcia check počas čakania vyvolá výnimku, je výpočet v
+        procese zrušený a výnimka je vyvolaná znova.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layer_input:   vstup výpočtu.
+        :param layers_list:   zoznam poradových čísel vrstiev, ktorých výstupy sa majú vypočítať.
+        :param output_shapes: rozmery výstupov jednotlivých vrstiev.
+        :param partial:       ak je True, je vstup výstupom vrstvy predchádzajúcej prvej vrstve zoznamu. Inak je
+                              vstupom vstup modelu.
+        :param check:         funkcia volaná počas čakania na výsledok.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: list výstupov vrstiev. Výstupy sú uložené v zdieľanej pamäti a nie sú kopírované.
+        """
+        with self.__lock:
+            shared_input, input_description = create_shared_array(layer_input.shape, np.float32)
+            shared_input[...] = layer_input
+            outputs = []
+            output_descriptions = []
+            for output_shape in output_shapes:
+                output, output_description = create_shared_array(output_shape, np.float32)
+                outputs.append(output)
+                output_descriptions.append(output_description)
+            self.send(('predict', input_description, output_descriptions, list(layers_list), partial))
+            try:
+                reply = self.receive(check)
+            except InferenceWorkerError:
+                raise
+            except Exception:
+                # Výpočet bol prerušený. Proces je požiadaný o jeho zrušenie a je prijatá jeho odpoveď, aby ďalšia
+                # odpoveď patrila k ďalšiemu príkazu.
+                self.send(('cancel',))
+                self.receive()
+                raise
+            if reply[0] != 'done':
+                raise InferenceWorkerError('Unexpected reply from inference process.')
+            return outputs
+
+    def is_alive(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vráti informáciu o tom, či proces ešte beží.
+        """
+        return self.__process.is_alive()
+
+    def close(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Ukončí proces a zmaže dočasný súbor s uloženým modelom.
+        """
+        try:
+            self.__connection.send(('stop',))
+        except (EOFError, OSError):
+            pass
+        self.__process.join(1)
+        if self.__process.is_alive():
+            self.__process.terminate()
+        self.__connection.close()
+        self.__model_file()
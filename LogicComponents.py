@@ -1,18 +1,25 @@
 import cv2
+import os
+import time
+import tempfile
 import ntpath
 import pandas as pd
 import pandas.errors
 import matplotlib.colors as mcolors
 from os import listdir
 from tensorflow import keras
-from sklearn.manifold import TSNE
-from sklearn import preprocessing
 from AdditionalComponents import *
-from sklearn.decomposition import PCA
 from PlotAndControlComponents import *
+from ComputationComponents import *
 from os.path import isfile, join, isdir
 
 BASIC_POINT_COLOR = '#04B2D9'
+PARTIAL_BATCH_SIZE = 1024
+POLYGON_DIVISION = 5
+TARGET_REFRESH_RATE = 30
+IDLE_REFINEMENT_DELAY = 0.5
+REDUCED_PCA_SAMPLE_SIZE = 5000
+MEMOIZATION_MEMORY_LIMIT = 512 * 2 ** 20
 
 
 class GraphLogicLayer:
@@ -30,8 +37,14 @@ class GraphLogicLayer:
         :var self.__input_data:        premenná obashujúca načítané vstupné dáta. Tieto sú zadavané na vstup neurónovej
                                        siete.
         :var self.__points_config:     premenná obsahujúca konfiguračné údaje o vstupných bodoch.
-        :var self.__polygon_cords:     obsahuje dovjice bodov predstavujúce začiatočné a koncové body hrán v prípade ak
-                                       je v neurónovej sieti možné túto mriežku zobraziť.
+        :var self.__polygon_peaks:     obsahuje súradnice unikátnych vrcholov priestorovej mriežky v prípade ak je v
+                                       neurónovej sieti možné túto mriežku zobraziť. Každý vrchol prechádza sieťou
+                                       práve raz.
+        :var self.__polygon_edges:     pole hrán priestorovej mriežky. Každá hrana je tvorená dvojicou indexov do poľa
+                                       vrcholov. Na základe týchto indexov sú z výstupov vrcholov poskladané začiatočné
+                                       a koncové body hrán.
+        :var self.__polygon_division:  počet častí, na ktoré je pri vytváraní priestorovej mriežky rozdelená hrana
+                                       v smere každej osi.
         :var self.__number_of_layers:  počet vrstiev neurónovej siete
         :var self.__keras_model:       jedná sa o referenciu na model neurónovej siete načítaný zo súboru, ktorý sa
                                        stará o výpočet výstupov na jednotlivých vrstvách. V rámci používania
@@ -58,6 +71,66 @@ class GraphLogicLayer:
                                        aby počas výpočtu nedošlo k zaseknutiu apikácie. V hlavnom vlákne teda beží
                                        grafika aplikácie a väčšina výpočtov je ponechaná na toto vlákno.
         :var self.__is_running:        premmenná pre monitorovacie vlákno, ktorá značí, či ešte program beží.
+        :var self.__generation:        poradové číslo aktuálneho stavu váh. Pri každej zmene váh je zvýšené. Prebiehajúce
+                                       výpočty si ho priebežne kontrolujú a ak patria k staršiemu stavu, sú prerušené.
+                                       Zobrazený je tak vždy len najnovší stav.
+        :var self.__refresh_rate:      požadovaný počet prekreslení za sekundu pri zmene váh pomocou posuvníkov. Zmeny
+                                       váh, ktoré prídu počas jedného snímku, sú spojené do jedného výpočtu.
+        :var self.__visible_layers:    set poradových čísel vrstiev, ktorých grafy sú práve viditeľné v hlavnom okne.
+                                       Hodnota None značí, že viditeľnosť nie je známa a za viditeľné sú považované
+                                       všetky aktívne vrstvy. Viditeľné vrstvy sú pri zmene váh prepočítané ako prvé.
+        :var self.__visibility_changed: hodnota signalizujúca monitorovaciemu vláknu, že sa zmenila množina viditeľných
+                                       vrstiev a je potrebné prepočítať neaktuálne vrstvy, ktoré sa zobrazili.
+        :var self.__requested_layers:  set poradových čísel vrstiev, ktorých výpočet metódy na redukciu priestoru bol
+                                       vyžiadaný z hlavného vlákna a má byť vykonaný v monitorovacom vlákne.
+        :var self.__reduced_quality:   hodnota značiaca, či predchádzajúci snímok prekročil svoj časový rozpočet. Ak
+                                       áno, sú metódy na redukciu priestoru počas ťahania posuvníka počítané v zníženej
+                                       kvalite a plná kvalita je dopočítaná až po nečinnosti používateľa.
+        :var self.__models_cache:      slovník pomocných modelov na výpočet výstupov medziľahlých vrstiev. Kľúčom je
+                                       n-tica poradových čísel vrstiev, ktorých výstupy model počíta. Vďaka tomu nie je
+                                       potrebné pri každom výpočte vytvárať nový keras model. Slovník je vyčistený pri
+                                       načítaní nového modelu.
+        :var self.__input_batch:       spojené vstupné dáta a začiatočné a koncové body hrán priestorovej mriežky.
+                                       Všetky tieto body prechádzajú sieťou naraz v jednej dávke.
+        :var self.__activations_store: slovník obsahujúci výstupy jednotlivých vrstiev pre spojenú vstupnú dávku.
+                                       Kľúčom je poradové číslo vrstvy. Výstupy všetkých vrstiev sú vypočítané jedným
+                                       prechodom sieťou a následne sú z tohto slovníka poskytované zobrazovaným
+                                       vrstvám. Pri zmene váh sú neplatné výstupy odstránené.
+        :var self.__store_lock:        zámok chrániaci slovník výstupov vrstiev, keďže k nemu pristupuje hlavné aj
+                                       monitorovacie vlákno. Zámok je držaný len počas čítania a zápisu, nie počas
+                                       výpočtu výstupov, aby hlavné vlákno nečakalo na výpočet.
+        :var self.__compute_lock:      zámok zaručujúci, že výstupy vrstiev počíta naraz len jedno vlákno. Trieda
+                                       NumpyEngine, keras model aj samostatný proces na výpočet výstupov totiž nie sú
+                                       určené na súbežné používanie viacerými vláknami.
+        :var self.__store_version:     poradové číslo stavu slovníka výstupov vrstiev. Je zvýšené pri každom
+                                       odstránení neplatných výstupov. Výstupy vypočítané bez zámku sú do slovníka
+                                       uložené len vtedy, ak sa medzičasom nezmenilo.
+        :var self.__is_chain_model:    hodnota značiaca, či vrstvy modelu tvoria jednoduchú postupnosť, v ktorej je
+                                       vstupom každej vrstvy výstup predchádzajúcej vrstvy. Len pri takomto modeli je
+                                       možné výpočet začať od vrstvy, na ktorej došlo k zmene.
+        :var self.__numpy_engine:      inštancia triedy NumpyEngine, ktorá počíta výstupy podporovaných vrstiev pomocou
+                                       knižnice numpy bez volania knižnice tensorflow.
+        :var self.__unsynced_layers:   set poradových čísel vrstiev, ktorých zmenené váhy ešte neboli nastavené vrstvám
+                                       keras modelu. Váhy sú do keras modelu nastavené až vtedy, keď sú potrebné,
+                                       teda pred výpočtom pomocou keras modelu alebo pred jeho uložením.
+        :var self.__keras_digests:     slovník hashov váh a biasov, ktoré sú nastavené vrstvám keras modelu. Kľúčom je
+                                       poradové číslo vrstvy. Podľa neho sú pred výpočtom nastavené váhy všetkým
+                                       vrstvám, ktorých váhy v keras modeli nezodpovedajú kópiám váh výpočtu.
+        :var self.__projection_pool:   inštancia triedy ProjectionPool, v ktorej skupine procesov sú paralelne počítané
+                                       metódy na redukciu priestoru pre jednotlivé vrstvy.
+        :var self.__use_inference_worker: hodnota značiaca, či majú byť výstupy vrstiev pomocou keras modelu počítané
+                                       v samostatnom procese.
+        :var self.__inference_worker:  inštancia triedy InferenceWorker alebo None, ak samostatný proces nie je
+                                       použitý. Ak proces zlyhá, je zrušený a výstupy sú počítané v tomto procese.
+        :var self.__data_version:      poradové číslo vstupnej dávky. Zvýši sa pri každej zmene vstupných dát.
+        :var self.__activations_states: slovník, ktorý ku každému uloženému výstupu vrstvy uchováva stav, z ktorého bol
+                                       vypočítaný. Stav tvorí poradové číslo vstupnej dávky a hashe váh danej vrstvy a
+                                       všetkých predchádzajúcich vrstiev.
+        :var self.__results_cache:     vyrovnávacia pamäť výstupov vrstiev a výsledkov metód na redukciu priestoru so
+                                       spoločným obmedzením veľkosti. Kľúče výstupov vrstiev začínajú reťazcom
+                                       activation a obsahujú stav, z ktorého bol výstup vypočítaný. Kľúče výsledkov
+                                       metód začínajú reťazcom projection. Pri návrate k predchádzajúcim hodnotám váh
+                                       alebo parametrov nie je potrebné výsledky počítať znovu.
 
         Parametre
         ----------------------------------------------------------------------------------------------------------------
@@ -68,7 +141,9 @@ class GraphLogicLayer:
         self.__mg_frame = main_graph
         self.__input_data = None
         self.__points_config = None
-        self.__polygon_cords = None
+        self.__polygon_peaks = None
+        self.__polygon_edges = None
+        self.__polygon_division = POLYGON_DIVISION
 
         # Definícia štruktúry siete.
         self.__number_of_layers = 0
@@ -76,10 +151,32 @@ class GraphLogicLayer:
         self.__active_layers = None
         self.__neural_layers = list()
         self.__keras_layers = list()
+        self.__models_cache = dict()
+        self.__input_batch = None
+        self.__activations_store = dict()
+        self.__store_lock = threading.RLock()
+        self.__compute_lock = threading.RLock()
+        self.__store_version = 0
+        self.__is_chain_model = False
+        self.__numpy_engine = None
+        self.__unsynced_layers = set()
+        self.__keras_digests = dict()
+        self.__projection_pool = ProjectionPool()
+        self.__use_inference_worker = False
+        self.__inference_worker = None
+        self.__data_version = 0
+        self.__activations_states = dict()
+        self.__results_cache = LRUCache(max_bytes=MEMOIZATION_MEMORY_LIMIT)
 
         # Vytvorenie, inicializácia a spustenie monitorovacieho vlákna, ktoré sa bude starať vykonávanie výpočtov.
         # Vlákno je nastavené ako deamon vlákno, aby bolo možné program bez problémov vypnúť.
         self.__changed_layer_q = QueueSet()
+        self.__generation = 0
+        self.__refresh_rate = TARGET_REFRESH_RATE
+        self.__reduced_quality = False
+        self.__visible_layers = None
+        self.__visibility_changed = False
+        self.__requested_layers = set()
         self.__condition_var = threading.Condition()
         self.__monitoring_thread = threading.Thread(target=self.monitor_change)
         self.__is_running = True
@@ -112,10 +209,19 @@ class GraphLogicLayer:
         self.__keras_layers = list()
         self.__active_layers = list()
 
-        # Keďže po načítaní nového modelu nie sú dostupné žiadne vsutpné dáta, je atribútom polygon_cords a input_data
-        # priradená hodnota None.
-        self.__polygon_cords = None
+        # Pomocné modely vytvorené pre predchádzajúci model už nie sú platné, preto je ich zoznam vyčistený. Rovnako sú
+        # odstránené uložené výstupy vrstiev a výsledky metód na redukciu priestoru. Je zistené, či je možné výpočty
+        # výstupov začínať od vrstvy, na ktorej došlo k zmene.
+        self.__models_cache = dict()
+        self.__results_cache.clear()
+        self.__is_chain_model = self.check_chain_model()
+
+        # Keďže po načítaní nového modelu nie sú dostupné žiadne vsutpné dáta, je atribútom mriežky a input_data
+        # priradená hodnota None. Spolu so vstupnou dávkou sú odstránené aj výstupy vrstiev predchádzajúceho modelu.
+        self.__polygon_peaks = None
+        self.__polygon_edges = None
         self.__input_data = None
+        self.prepare_input_batch()
 
         # Do atribútu je priradená referencia na prázdny dict. Následne sú nastavené hodnoty konfiguračného slovníka
         # pomocou metódy reset_points_config.
@@ -132,10 +238,26 @@ class GraphLogicLayer:
             self.__neural_layers.append(neural_layer)
             i += 1
 
+        # Je vytvorená trieda, ktorá zrkadlí vrstvy keras modelu. Váhy a biasy číta priamo z polí jednotlivých vrstiev,
+        # ktoré sú menené pomocou posuvníkov.
+        self.__numpy_engine = NumpyEngine(self.__keras_layers,
+                                          [layer.layer_weights for layer in self.__neural_layers],
+                                          [layer.layer_biases for layer in self.__neural_layers])
+        self.__unsynced_layers = set()
+        self.__keras_digests = dict()
+
+        # Proces na výpočet výstupov vrstiev vlastní kópiu predchádzajúceho modelu, preto je nahradený novým procesom.
+        # Proces je ukončený pod zámkom výpočtu, aby bol ukončený aj proces, ktorý práve spúšťa vlákno na pozadí. Nový
+        # proces je spustený na pozadí, keďže uloženie modelu a spustenie procesu trvá dlho.
+        with self.__compute_lock:
+            self.stop_inference_worker()
+        if self.__use_inference_worker:
+            threading.Thread(target=self.update_inference_worker, daemon=True).start()
+
         # Na záver je inicializovaná aj inštancia triedy MainGraphFrame.
         self.__mg_frame.initialize(self)
 
-    def recalculate(self, starting_layer=0):
+    def recalculate(self, starting_layer=0, generation=None):
         """
         Popis
         ----------------------------------------------------------------------------------------------------------------
@@ -147,7 +269,16 @@ class GraphLogicLayer:
         :param starting_layer: predstavuje poradové číslo vrstvy, na ktorej došlo k zmene. Keďže ide o klasické a CNN
                                nie o rekurentné neurónove siete, môže zmena váh na vstupe určitej vrstvy ovplyvniť
                                len konkrétnu vrstvu a vrstvy nasledujúce za ňou.
+        :param generation:     poradové číslo stavu váh, ku ktorému výpočet patrí. Ak je zadané a počas výpočtu dôjde
+                               k ďalšej zmene váh, je výpočet prerušený výnimkou StaleComputationError.
         """
+        # Výstupy vrstiev, ktoré mohli byť zmenou ovplyvnené sú zo slovníka výstupov odstránené. Ak je niektorá z
+        # ovplyvnených vrstiev zobrazená, sú výstupy všetkých ovplyvnených vrstiev vypočítané jedným prechodom.
+        self.invalidate_activations_store(starting_layer)
+        if any(layer_number >= starting_layer for layer_number in self.__active_layers):
+            self.update_activations_store(generation)
+        self.check_generation(generation)
+
         # Na základe poradového čísla je zo zoznamu aktívnych vrstiev vytvorený zoznam poradových čísel (súčasne aj
         # indexov) vrstiev, ktoré majú byť prepočítané a prekreslené. Prepočítané a prekreslené majú byť vrstvy,
         # ktoré sa nachádzajú v poradi za vrstvou, na ktorej došlo k zmene, teda ich poradové číslo je rovné
@@ -179,25 +310,11 @@ class GraphLogicLayer:
         # Najskôr je potrebné zistiť, či bli nejaké vstupné dáta načítané.
         if self.__input_data is not None:
 
-            # Ak boli vstupné dáta načítané, sú tieto vstupné dáta spolu s listom vrstiev, na ktorých má dôjsť k zmene
-            # zaslané ako argumenty do metódy, ktorej návratovou hodnotou sú aktivácie na vrstvách, ktoré do nej boli
-            # zaslané. Aktivácie sú v poradí zodpovedajúcom poradiu vrstiev v rámci listu vrstiev, na ktorých má
-            # dôjsť k aktualizácií.
-            activations = self.get_activation_for_layer(self.__input_data, layers_for_update)
-
-            # Podľa toho, či list obsahoval viac ako jednu vrstvu je navrátená hodnota. Typ návratovej hodnoty môže byť
-            # priamo numpy array, ak bol výpočet uskutočnený len pre jednu vrstvu alebo list, ktorý obsahuje výstupy
-            # pre jednotlivé vrstvy.
-            if not isinstance(activations, list):
-
-                # Ak bola návratová hodnota typu numpy array je táto hodnota obalená do listu, aby ďalšie výpočty boli
-                # konzistentné.
-                activations = [activations]
-
-            # Hodnota výstupu na jednotlivých vrstvách je postupné priraďovaná príslušným atribútom na príslušných vrst-
-            # vách.
-            for i, layer_number in enumerate(layers_for_update):
-                self.__neural_layers[layer_number].point_cords = activations[i].transpose()
+            # Ak boli vstupné dáta načítané, je hodnota výstupu na jednotlivých vrstvách postupne priraďovaná prísluš-
+            # ným atribútom na príslušných vrstvách. Výstupy sú získané zo slovníka výstupov vrstiev, takže nie je
+            # potrebné sieť pre každú vrstvu spúšťať osobitne.
+            for layer_number in layers_for_update:
+                self.assign_layer_cords(layer_number)
 
     def recalculate_grid(self, layers_for_update):
         """
@@ -210,37 +327,27 @@ class GraphLogicLayer:
         :param layers_for_update: ide o list, ktorý obsahuje zoznam vrstiev, ktoré sú aktívne a je na nich zvolená
                                   možnosť pre zobrazenie mriežky.
         """
-        # Skontroluje sa, či existujú nejaké súradnice hrán priestorovej mirežky.
-        if self.__polygon_cords is not None:
-
-            # Súradnice hrán priestorovej mriežky sú rozdelené na začiatočné a koncové body a sú poslané ako argument
-            # metódy pre výpočet aktivácií na zadaných vrstvách.
-            activations_start = self.get_activation_for_layer(self.__polygon_cords[0], layers_for_update)
-            activations_end = self.get_activation_for_layer(self.__polygon_cords[1], layers_for_update)
-
-            # Podľa počtu vrstiev v zozname je návratová hodnoa buď list alebo numpy array. Toto je potrebné overiť.
-            if not isinstance(activations_start, list):
-                # V prípade, že bola zadaná len jedna vrstva, boal návratová hdonota typu numpy array. Preto začiatočné
-                # aj koncové výstupné súradnice obalíme do listu, kvôli konzistencií ďalších úkonov v rámci metódy.
-                activations_start = [activations_start]
-                activations_end = [activations_end]
-
-            # Výpočítané výstupné súradnice hrán sú v cykle priradené atribútom v príslušných vrstiev.
-            for i, layer_number in enumerate(layers_for_update):
-
-                # Začiatočne a koncové body hrán pre konkrétnu vrstvu musia byť transponované. Z transponovaných bodov
-                # je vytvorená dvojica ktorá je priradená atribútu príslušnej neurónovej vrstvy.
-                start_points = activations_start[i].transpose()
-                end_points = activations_end[i].transpose()
-                self.__neural_layers[layer_number].polygon_cords_tuples = [start_points, end_points]
+        # Výpočítané výstupné súradnice hrán sú v cykle priradené atribútom v príslušných vrstiev. Výstupy hrán sú
+        # súčasťou spoločnej dávky so vstupnými dátami, preto sú získané zo slovníka výstupov vrstiev.
+        for layer_number in layers_for_update:
+            self.set_polygon_cords(layer_number)
 
     def monitor_change(self):
         """
         Popis
         ----------------------------------------------------------------------------------------------------------------
         Metóda je spustená v monitorovaciom vlákne. Vlákno beží počas celého behu programu a ak došlo k zmene váh na
-        niektorej z vrstiev, vykoná potrebné výpočty a prekreslí grafy.
+        niektorej z vrstiev, vykoná potrebné výpočty a prekreslí grafy. Pri zmene váh sú prepočítané a prekreslené
+        len vrstvy, ktoré sú práve viditeľné. Ostatné vrstvy sú prepočítané, keď sa posunutím zobrazia, alebo keď
+        používateľ prestane s váhami hýbať.
         """
+        # Set outdated_layers obsahuje aktívne vrstvy, ktorých zobrazenie nezodpovedá aktuálnym váham, či už preto, že
+        # výpočet bol odložený, alebo preto, že bol prerušený. Set reduced_layers obsahuje vrstvy zobrazené v zníženej
+        # kvalite, ktoré je po nečinnosti potrebné dopočítať.
+        outdated_layers = set()
+        reduced_layers = set()
+        frame_start = 0.0
+
         # Nekonečná slučka, v ktorej vlákno beží.
         while True:
 
@@ -251,11 +358,22 @@ class GraphLogicLayer:
                 self.__condition_var.release()
                 return
 
-            # Následne sa skontroluje, či je zásobník s indexami zmenených vrstiev prázdny alebo nie.
-            while self.__changed_layer_q.is_empty():
-
-                # Ak je zásobník prázdny, je zámok odomknutý a vlákno čaka, kým dostane signál o zmene.
-                self.__condition_var.wait()
+            # Následne sa skontroluje, či je zásobník s indexami zmenených vrstiev prázdny alebo nie. Vlákno je prebudené
+            # aj vtedy, ak sa zmenila množina viditeľných vrstiev.
+            idle = False
+            while self.__changed_layer_q.is_empty() and not self.__visibility_changed and not self.__requested_layers:
+
+                # Ak je zásobník prázdny, je zámok odomknutý a vlákno čaka, kým dostane signál o zmene. Ak sú niektoré
+                # vrstvy neaktuálne alebo zobrazené v zníženej kvalite, čaká vlákno len obmedzený čas. Ak počas neho
+                # nedôjde k žiadnej zmene, používateľ prestal s posuvníkom hýbať a vrstvy sú dopočítané.
+                if outdated_layers or reduced_layers:
+                    if not self.__condition_var.wait(IDLE_REFINEMENT_DELAY) and \
+                            self.__changed_layer_q.is_empty() and not self.__visibility_changed and \
+                            not self.__requested_layers:
+                        idle = True
+                        break
+                else:
+                    self.__condition_var.wait()
 
                 # Po signalizácií, je zámok opäť zamnkutý a je skontrolované, či je program ešte stále beží, pretože
                 # signál môže značiť aj ukončenie programu.
@@ -265,28 +383,620 @@ class GraphLogicLayer:
                     self.__condition_var.release()
                     return
 
+            if idle:
+                # Počas nečinnosti sú v plnej kvalite prepočítané všetky neaktuálne vrstvy a vrstvy zobrazené v zníženej
+                # kvalite. Viditeľné vrstvy sú spracované ako prvé. Ak počas výpočtu dôjde k zmene váh, je výpočet
+                # prerušený a nespracované vrstvy zostávajú naplánované.
+                generation = self.__generation
+                self.__condition_var.release()
+                visible_layers, hidden_layers = self.split_layers_by_visibility(outdated_layers | reduced_layers)
+                try:
+                    for layers in (visible_layers, hidden_layers):
+                        self.refresh_layers(layers, generation)
+                        outdated_layers.difference_update(layers)
+                        reduced_layers.difference_update(layers)
+                    self.__reduced_quality = False
+                except StaleComputationError:
+                    pass
+                continue
+
+            if self.__changed_layer_q.is_empty():
+                # Ak sa zmenila len množina viditeľných vrstiev, sú prepočítané neaktuálne vrstvy, ktoré sa práve
+                # zobrazili. Následne sú v plnej kvalite prepočítané vrstvy, ktorých výpočet bol vyžiadaný z hlavného
+                # vlákna. Ak je ich výpočet prerušený zmenou váh, sú označené ako neaktuálne a dopočítané neskôr.
+                self.__visibility_changed = False
+                requested_layers = sorted(layer_number for layer_number in self.__requested_layers
+                                          if layer_number in (self.__active_layers or ()))
+                self.__requested_layers.clear()
+                generation = self.__generation
+                self.__condition_var.release()
+                reduced_quality = self.__reduced_quality
+                visible_layers, _ = self.split_layers_by_visibility(outdated_layers)
+                try:
+                    self.refresh_layers(visible_layers, generation, reduced_quality)
+                    outdated_layers.difference_update(visible_layers)
+                    if reduced_quality:
+                        reduced_layers.update(visible_layers)
+                    self.refresh_layers(requested_layers, generation)
+                except StaleComputationError:
+                    outdated_layers.update(requested_layers)
+                continue
+
+            # Zmeny váh, ktoré prídu počas jedného snímku, sú spojené do jedného výpočtu. Ak od začiatku predchádza-
+            # júceho snímku ešte neuplynul jeho časový interval, vlákno počká na jeho koniec. Počas čakania je zámok
+            # odomknutý, takže ďalšie zmeny sú pridávané do zásobníka.
+            frame_interval = 1.0 / self.__refresh_rate
+            remaining = frame_start + frame_interval - time.perf_counter()
+            while remaining > 0 and self.__is_running:
+                self.__condition_var.wait(remaining)
+                remaining = frame_start + frame_interval - time.perf_counter()
+            frame_start = time.perf_counter()
+
             # Ak sa v zásobníku nachádzajú nejaké vrstvy, na ktorých došlo k zmenám, je obsah zásobníka s týmito
             # vrstvami do pomocnej premennej. Následne je zásobník vyčistený a synchronizačná premenná
             # odomknutá.
             actual_changed = self.__changed_layer_q.copy()
             self.__changed_layer_q.clear()
+            self.__visibility_changed = False
+            generation = self.__generation
             self.__condition_var.release()
 
             # Kvôli efektivite je zo všetkých vrstiev na ktorých došlo k zmenám zvolená najnižšie poradové číslo vrstvy.
-            # V cykle sú ešte vrstvám v Keras modele nastavené nové hodnoty váh a biasov.
+            # V cykle sú ešte vrstvy označené ako vrstvy, ktorých váhy je potrebné nastaviť do Keras modelu. Váhy sú
+            # nastavené až pred výpočtom pomocou keras modelu, keďže podporované vrstvy sú počítané bez neho. Výstupy
+            # vrstiev, ktoré mohli byť zmenou ovplyvnené, sú zo slovníka výstupov odstránené.
             starting_layer_number = self.__number_of_layers
-            for layer_number in actual_changed:
-                if layer_number < starting_layer_number:
-                    starting_layer_number = layer_number
-                layer = self.__neural_layers[layer_number]
-                self.set_layer_weights_and_biases(layer_number, layer.layer_weights, layer.layer_biases)
+            with self.__store_lock:
+                for layer_number in actual_changed:
+                    if layer_number < starting_layer_number:
+                        starting_layer_number = layer_number
+                    self.__unsynced_layers.add(layer_number)
+                self.invalidate_activations_store(starting_layer_number)
+
+            # Všetky aktívne vrstvy od najnižšej zmenenej vrstvy sú označené ako neaktuálne. Prepočítané a prekreslené
+            # sú však len tie, ktoré sú viditeľné. Ak počas výpočtu dôjde k ďalšej zmene váh, je výpočet prerušený a
+            # pokračuje sa rovno s najnovším stavom váh.
+            outdated_layers.update(layer_number for layer_number in list(self.__active_layers)
+                                   if layer_number >= starting_layer_number)
+            visible_layers, _ = self.split_layers_by_visibility(outdated_layers)
+            reduced_quality = self.__reduced_quality
+            try:
+                self.refresh_layers(visible_layers, generation, reduced_quality)
+                outdated_layers.difference_update(visible_layers)
+                if reduced_quality:
+                    reduced_layers.update(visible_layers)
+            except StaleComputationError:
+                pass
+
+            # Ak snímok prekročil svoj časový rozpočet, budú ďalšie snímky počítané v zníženej kvalite.
+            if time.perf_counter() - frame_start > frame_interval:
+                self.__reduced_quality = True
+
+    def split_layers_by_visibility(self, layers):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Rozdelí zadané vrstvy na vrstvy, ktorých graf je práve viditeľný v hlavnom okne, a na ostatné vrstvy. Do úvahy
+        sú brané len aktívne vrstvy. Ak ešte nie je známe, ktoré vrstvy sú viditeľné, sú za viditeľné považované
+        všetky.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layers: zoznam alebo set poradových čísel vrstiev.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: n-tica obsahujúca zoradený list viditeľných a zoradený list ostatných vrstiev.
+        """
+        active_layers = set(self.__active_layers)
+        visible_layers = self.__visible_layers
+        visible = []
+        hidden = []
+        for layer_number in sorted(layers):
+            if layer_number in active_layers:
+                if visible_layers is None or layer_number in visible_layers:
+                    visible.append(layer_number)
+                else:
+                    hidden.append(layer_number)
+        return visible, hidden
+
+    def refresh_layers(self, layers, generation=None, reduced_quality=False):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Prepočíta a prekreslí zadané aktívne vrstvy. Výstupy vrstiev sú vypočítané len po poslednú zo zadaných vrstiev,
+        výstupy ďalších vrstiev sú dopočítané až keď budú potrebné.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layers:          zoradený list poradových čísel vrstiev.
+        :param generation:      poradové číslo stavu váh, ku ktorému výpočet patrí.
+        :param reduced_quality: hodnota značiaca, či majú byť metódy na redukciu priestoru vypočítané v zníženej kvalite.
+        """
+        if not layers:
+            return
+        self.update_activations_store(generation, layers[-1])
+        self.check_generation(generation)
+        self.recalculate_cords(layers)
+        self.recalculate_grid([layer_number for layer_number in layers
+                               if self.__neural_layers[layer_number].calculate_polygon])
+        self.broadcast_changes(layers[0], generation, reduced_quality, layers)
+
+    def prepare_input_batch(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Spojí načítané vstupné dáta s vrcholmi priestorovej mriežky do jednej dávky, ktorá prechádza sieťou naraz.
+        Keďže sa zmenil vstup siete, sú všetky vypočítané výstupy vrstiev odstránené.
+        """
+        with self.__store_lock:
+            # Ak nie sú načítané vstupné dáta, dávka neexistuje. Vrcholy mriežky sú pripojené za vstupné dáta, takže
+            # výstupy je možné neskôr rozdeliť podľa počtu vstupných bodov.
+            # Dávka je prevedená na typ float32, s ktorým pracuje keras model aj trieda NumpyEngine. Vďaka tomu
+            # zostáva vstup prvej vrstvy pri opakovaných výpočtoch rovnakým objektom.
+            self.__data_version += 1
+            if self.__input_data is None:
+                self.__input_batch = None
+            elif self.__polygon_peaks is None:
+                self.__input_batch = np.asarray(self.__input_data, dtype=np.float32)
+            else:
+                self.__input_batch = np.concatenate([self.__input_data, self.__polygon_peaks]).astype(np.float32)
+            self.invalidate_activations_store()
+
+    def invalidate_activations_store(self, starting_layer=0):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Odstráni zo slovníka výstupov vrstiev výstupy, ktoré už nie sú platné. Zmena váh na vrstve ovplyvní výstup
+        tejto vrstvy a všetkých vrstiev nasledujúcich za ňou.
 
-            # Po nastavení nových váh sú pre vrstvy, ktoré nasledujú v poradí po najnižšej vrstve, na ktorej došlo k
-            # zmene váh. Následne sú zmený vysielané jednotlivým vrstávm pomocou metódy broad cast.
-            self.recalculate(starting_layer_number)
-            self.broadcast_changes(starting_layer_number)
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param starting_layer: poradové číslo prvej vrstvy, ktorej výstup už nie je platný.
+        """
+        with self.__store_lock:
+            self.__store_version += 1
+            for layer_number in [key for key in self.__activations_store if key >= starting_layer]:
+                del self.__activations_store[layer_number]
+                self.__activations_states.pop(layer_number, None)
 
-    def get_activation_for_layer(self, input_points, updated_layers_list):
+    def take_weights_snapshot(self, first_layer, last_layer):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vytvorí kópie váh a biasov zadaných vrstiev a vypočíta z nich hashe. Posuvníky váh menia polia váh bez zámku,
+        preto sú výstupy vrstiev počítané z týchto kópií. Hash tak vždy zodpovedá váham, z ktorých bol výstup
+        vypočítaný, aj keď sa váhy počas výpočtu zmenia.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param first_layer: poradové číslo prvej vrstvy.
+        :param last_layer:  poradové číslo poslednej vrstvy.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: slovník, ktorý ku každej vrstve obsahuje n-ticu s kópiou váh, kópiou biasov a ich hashom.
+        """
+        snapshot = dict()
+        for layer_number in range(first_layer, last_layer + 1):
+            layer = self.__neural_layers[layer_number]
+            weights = None if layer.layer_weights is None else np.array(layer.layer_weights)
+            biases = None if layer.layer_biases is None else np.array(layer.layer_biases)
+            snapshot[layer_number] = (weights, biases, get_weights_digest(weights, biases))
+        return snapshot
+
+    def store_activation(self, layer_number, activation, weights_state, publish=True):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Uloží výstup vrstvy do slovníka výstupov vrstiev spolu so stavom, z ktorého bol vypočítaný. Výstup je uložený
+        aj do vyrovnávacej pamäte výstupov, aby ho bolo možné použiť pri návrate k rovnakému stavu váh.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layer_number:  poradové číslo vrstvy.
+        :param activation:    výstup vrstvy.
+        :param weights_state: dvojica obsahujúca poradové číslo vstupnej dávky a n-ticu hashov váh vrstiev po poslednú
+                              počítanú vrstvu.
+        :param publish:       ak je False, je výstup uložený len do vyrovnávacej pamäte výstupov.
+        """
+        layer_state = (weights_state[0], weights_state[1][:layer_number + 1])
+        if publish:
+            self.__activations_store[layer_number] = activation
+            self.__activations_states[layer_number] = layer_state
+        self.__results_cache.put(('activation', layer_state), activation)
+
+    def publish_activations(self, activations, weights_state, store_version, generation):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Uloží výstupy vrstiev vypočítané bez zámku. Do slovníka výstupov vrstiev sú uložené len vtedy, ak z neho
+        medzičasom neboli odstránené neplatné výstupy a výpočet stále patrí k najnovšiemu stavu váh. Inak by slovník
+        obsahoval výstupy, ktoré už nebudú odstránené. Keďže je stav výstupov určený hashmi váh, z ktorých boli
+        vypočítané, sú do vyrovnávacej pamäte výstupov uložené vždy.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param activations:   slovník výstupov vrstiev, ktorého kľúčom je poradové číslo vrstvy.
+        :param weights_state: stav váh, z ktorého boli výstupy vypočítané, viď. store_activation.
+        :param store_version: poradové číslo stavu slovníka výstupov vrstiev na začiatku výpočtu.
+        :param generation:    poradové číslo stavu váh, ku ktorému výpočet patrí.
+        """
+        with self.__store_lock:
+            publish = store_version == self.__store_version and (generation is None or
+                                                                 generation == self.__generation)
+            for layer_number in sorted(activations):
+                self.store_activation(layer_number, activations[layer_number], weights_state, publish)
+
+    def assign_layer_cords(self, layer_number):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Priradí vrstve výstup pre načítané vstupné dáta a stav, z ktorého bol výstup vypočítaný.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layer_number: poradové číslo vrstvy.
+        """
+        # Výstup je prípadne vypočítaný bez zámku. Pod zámkom sú vrstve len priradené výstup a jeho stav naraz, aby
+        # si navzájom zodpovedali.
+        activation, cords_state = self.get_stored_activation_state(layer_number)
+        point_cords = np.ascontiguousarray(activation[:len(self.__input_data)]).transpose()
+        with self.__store_lock:
+            neural_layer = self.__neural_layers[layer_number]
+            neural_layer.point_cords = point_cords
+            neural_layer.cords_state = cords_state
+
+    def update_activations_store(self, generation=None, last_layer=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vypočíta chýbajúce výstupy vrstiev pre načítané vstupné dáta. Výstupy všetkých chýbajúcich vrstiev sú
+        vypočítané jedným prechodom sieťou pre spojenú vstupnú dávku a uložené do slovníka výstupov vrstiev.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param generation: poradové číslo stavu váh, ku ktorému výpočet patrí. Výpočet je medzi vrstvami a dávkami
+                           prerušený, ak už nejde o najnovší stav váh. Vypočítané výstupy zostávajú uložené.
+        :param last_layer: poradové číslo poslednej vrstvy, ktorej výstup má byť vypočítaný. Ak nie je zadané, sú
+                           vypočítané výstupy až po poslednú vrstvu siete.
+        """
+        # Naraz počíta výstupy len jedno vlákno. Zámok výstupov je držaný len počas ich čítania a ukladania, takže
+        # hlavné vlákno môže počas výpočtu čítať už vypočítané výstupy.
+        with self.__compute_lock:
+            with self.__store_lock:
+                # Ak nie sú načítané žiadne vstupné dáta, nie je čo počítať.
+                if self.__input_batch is None:
+                    return
+
+                # Neplatné výstupy sú odstraňované vždy od určitej vrstvy až po koniec siete, preto stačí nájsť prvú
+                # vrstvu, ktorej výstup chýba. Od tejto vrstvy sú vypočítané výstupy všetkých zvyšných vrstiev.
+                starting_layer = 0
+                while starting_layer in self.__activations_store:
+                    starting_layer += 1
+                end_layer = self.__number_of_layers if last_layer is None else min(last_layer + 1,
+                                                                                   self.__number_of_layers)
+                if starting_layer >= end_layer:
+                    return
+
+                # Pred výpočtom sú vytvorené kópie váh, z ktorých sú výstupy počítané, a ich hashe tvoria stav
+                # uložených výstupov. Ak výpočet začína od uloženého výstupu predchádzajúcej vrstvy, je začiatok stavu
+                # prevzatý z neho, keďže práve z týchto váh bol vstup výpočtu vypočítaný. Celým keras modelom
+                # prechádza dávka od vstupu, preto sú v takom prípade skopírované váhy všetkých vrstiev.
+                if self.__is_chain_model and starting_layer > 0:
+                    snapshot = self.take_weights_snapshot(starting_layer, end_layer - 1)
+                    data_version, digests = self.__activations_states[starting_layer - 1]
+                else:
+                    snapshot = self.take_weights_snapshot(0, end_layer - 1)
+                    data_version, digests = self.__data_version, ()
+                digests = digests + tuple(snapshot[n][2] for n in range(len(digests), end_layer))
+                weights_state = (data_version, digests)
+
+                # Výstupy vrstiev, ktoré už boli pre rovnaký stav váh vypočítané, sú prevzaté z vyrovnávacej pamäte.
+                # Výstup vrstvy závisí od váh všetkých predchádzajúcich vrstiev, preto sú výstupy preberané len po
+                # prvú vrstvu, ktorej výstup v pamäti chýba. Od nej pokračuje výpočet.
+                while starting_layer < end_layer:
+                    layer_state = (weights_state[0], weights_state[1][:starting_layer + 1])
+                    activation = self.__results_cache.get(('activation', layer_state))
+                    if activation is None:
+                        break
+                    self.store_activation(starting_layer, activation, weights_state)
+                    starting_layer += 1
+                layers_for_update = list(range(starting_layer, end_layer))
+                if not layers_for_update:
+                    return
+
+                # Vstup výpočtu a stav slovníka výstupov sú prečítané pod zámkom. Samotný výpočet prebieha bez neho.
+                store_version = self.__store_version
+                input_batch = self.__input_batch
+                if self.__is_chain_model and starting_layer > 0:
+                    layer_input = self.__activations_store[starting_layer - 1]
+                else:
+                    layer_input = input_batch
+
+            # Vypočítané výstupy sú uložené aj vtedy, ak je výpočet prerušený, keďže výstupy vrstiev pred zmenenou
+            # vrstvou zostávajú platné.
+            activations = dict()
+            try:
+                if self.__is_chain_model:
+                    # Ak vrstvy modelu tvoria jednoduchú postupnosť, je vstupom prvej neplatnej vrstvy uložený výstup
+                    # predchádzajúcej vrstvy, prípadne vstupná dávka. Výpočet teda prebehne len na vrstvách od vrstvy,
+                    # na ktorej došlo k zmene. Vrstvy podporované triedou NumpyEngine sú počítané bez knižnice
+                    # tensorflow.
+                    layer_number = starting_layer
+                    while layer_number < end_layer and self.use_numpy_engine(layer_number, starting_layer):
+                        self.check_generation(generation)
+                        weights, biases, _ = snapshot[layer_number]
+                        layer_input = self.__numpy_engine.compute_layer(layer_number, layer_input, weights, biases)
+                        activations[layer_number] = layer_input
+                        layer_number += 1
+
+                    # Od prvej nepodporovanej vrstvy je výpočet ponechaný na vrstvy keras modelu, ktorým sú pred
+                    # výpočtom nastavené aktuálne váhy.
+                    if layer_number < end_layer:
+                        self.synchronize_keras_weights(snapshot)
+                        outputs = self.get_worker_activations(
+                            layer_input, list(range(layer_number, end_layer)), True, generation)
+                        if outputs is None:
+                            outputs = self.get_partial_activations(layer_input, layer_number, generation, end_layer)
+                        for i, activation in enumerate(outputs):
+                            activations[layer_number + i] = activation
+                else:
+                    # V opačnom prípade prechádza dávka celým keras modelom. Návratová hodnota je pri jednej vrstve
+                    # typu numpy array, preto je kvôli konzistencií obalená do listu.
+                    self.synchronize_keras_weights(snapshot)
+                    outputs = self.get_worker_activations(input_batch, layers_for_update, False, generation)
+                    if outputs is None:
+                        outputs = self.get_activation_for_layer(input_batch, layers_for_update, generation)
+                    if not isinstance(outputs, list):
+                        outputs = [outputs]
+                    for i, layer_number in enumerate(layers_for_update):
+                        activations[layer_number] = outputs[i]
+            finally:
+                self.publish_activations(activations, weights_state, store_version, generation)
+
+    def use_numpy_engine(self, layer_number, starting_layer):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Rozhodne, či má byť výstup vrstvy vypočítaný pomocou triedy NumpyEngine. Konvolučné vrstvy sú pomocou nej
+        počítané len vtedy, ak ide o vrstvu, na ktorej došlo k zmene váh. Vtedy je možné uložený výstup len
+        upraviť. Nasledujúce konvolučné vrstvy sú počítané rýchlejšie pomocou keras modelu.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layer_number:   poradové číslo vrstvy.
+        :param starting_layer: poradové číslo vrstvy, od ktorej začína výpočet.
+        """
+        if not self.__numpy_engine.supports(layer_number):
+            return False
+        if self.__numpy_engine.is_convolution(layer_number):
+            return layer_number == starting_layer and layer_number in self.__unsynced_layers
+        return True
+
+    def get_stored_activation(self, layer_number):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vráti výstup zadanej vrstvy pre spojenú vstupnú dávku. Ak výstup v slovníku výstupov vrstiev chýba, je
+        vypočítaný spolu s výstupmi ostatných chýbajúcich vrstiev.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layer_number: poradové číslo vrstvy, ktorej výstup je požadovaný.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: výstup vrstvy vo forme numpy array, ktorého prvý rozmer zodpovedá počtu bodov v dávke.
+        """
+        return self.get_stored_activation_state(layer_number)[0]
+
+    def get_stored_activation_state(self, layer_number):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vráti výstup zadanej vrstvy pre spojenú vstupnú dávku spolu so stavom, z ktorého bol vypočítaný. Ak výstup
+        v slovníku výstupov vrstiev chýba, je vypočítaný bez držania zámku. Ak boli výstupy počas výpočtu
+        zneplatnené, je výpočet zopakovaný.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layer_number: poradové číslo vrstvy, ktorej výstup je požadovaný.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: dvojica obsahujúca výstup vrstvy a jeho stav.
+        """
+        while True:
+            with self.__store_lock:
+                if layer_number in self.__activations_store or self.__input_batch is None:
+                    return self.__activations_store[layer_number], self.__activations_states.get(layer_number)
+            self.update_activations_store()
+
+    def get_points_activation(self, layer_number):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vráti výstup zadanej vrstvy pre načítané vstupné dáta. Ide o prvú časť výstupu spojenej vstupnej dávky.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layer_number: poradové číslo vrstvy, ktorej výstup je požadovaný.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: výstup vrstvy pre vstupné body.
+        """
+        return self.get_stored_activation(layer_number)[:len(self.__input_data)]
+
+    def get_polygon_activation(self, layer_number):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vráti výstupy zadanej vrstvy pre začiatočné a koncové body hrán priestorovej mriežky. Výstupy vrcholov mriežky
+        sú získané z časti výstupu spojenej vstupnej dávky, ktorá nasleduje za vstupnými bodmi. Z nich sú podľa
+        indexov hrán poskladané výstupy začiatočných a koncových bodov.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layer_number: poradové číslo vrstvy, ktorej výstup je požadovaný.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: dvojica výstupov pre začiatočné a koncové body hrán.
+        """
+        peaks_activations = self.get_stored_activation(layer_number)[len(self.__input_data):]
+        return peaks_activations[self.__polygon_edges[:, 0]], peaks_activations[self.__polygon_edges[:, 1]]
+
+    def check_chain_model(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Zistí, či vrstvy načítaného modelu tvoria jednoduchú postupnosť, teda či je vstupom každej vrstvy výstup vrstvy,
+        ktorá sa nachádza v poradí pred ňou.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: True, ak vrstvy tvoria jednoduchú postupnosť, inak False.
+        """
+        # Pri modeloch s vetvením, viacerými vstupmi alebo zdieľanými vrstvami nie je pojem vstupu a výstupu vrstvy
+        # jednoznačný a keras v takom prípade vyvolá výnimku. Takéto modely sú počítané vždy od vstupu siete.
+        layers = self.__keras_model.layers
+        try:
+            return all(layers[i].input is layers[i - 1].output for i in range(1, len(layers)))
+        except (AttributeError, ValueError):
+            return False
+
+    def get_partial_activations(self, layer_input, starting_layer, generation=None, end_layer=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vypočíta výstupy vrstiev, počnúc zadanou vrstvou až po poslednú vrstvu siete. Vstupom prvej vrstvy je uložený
+        výstup predchádzajúcej vrstvy, takže vrstvy pred zmenenou vrstvou nie sú opätovne počítané.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layer_input:    vstup vrstvy, od ktorej má výpočet začať.
+        :param starting_layer: poradové číslo vrstvy, od ktorej začína výpočet.
+        :param generation:     poradové číslo stavu váh, ku ktorému výpočet patrí.
+        :param end_layer:      poradové číslo vrstvy, pred ktorou výpočet končí. Ak nie je zadané, končí výpočet
+                               poslednou vrstvou siete.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: list výstupov vrstiev od zadanej vrstvy po koncovú vrstvu.
+        """
+        # Vrstvy sú volané priamo na dávkach dát. Takéto volanie na rozdiel od vytvárania nového pomocného modelu
+        # nepridáva do grafu keras modelu nové uzly, takže výstupy vrstiev v pôvodnom modeli zostávajú jednoznačné.
+        # Dáta sú spracúvané po dávkach, aby nedošlo k nadmernému využitiu pamäte.
+        layers = self.__keras_layers[starting_layer:end_layer]
+        outputs = [[] for _ in layers]
+        for batch_start in range(0, len(layer_input), PARTIAL_BATCH_SIZE):
+            self.check_generation(generation)
+            layer_output = layer_input[batch_start:batch_start + PARTIAL_BATCH_SIZE]
+            for i, layer in enumerate(layers):
+                layer_output = layer(layer_output, training=False)
+                outputs[i].append(np.asarray(layer_output))
+
+        # Výstupy jednotlivých dávok sú pre každú vrstvu spojené do jedného poľa.
+        return [np.concatenate(layer_outputs) for layer_outputs in outputs]
+
+    def get_worker_activations(self, layer_input, layers_list, partial, generation=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vypočíta výstupy zadaných vrstiev v samostatnom procese na výpočet výstupov vrstiev. Výstupy sú vrátené cez
+        zdieľanú pamäť. Ak proces nie je spustený alebo zlyhal, vráti None a výstupy je potrebné vypočítať v tomto
+        procese.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layer_input: vstup výpočtu.
+        :param layers_list: zoznam poradových čísel vrstiev, ktorých výstupy sa majú vypočítať.
+        :param partial:     ak je True, je vstup výstupom vrstvy predchádzajúcej prvej vrstve zoznamu a vrstvy sú
+                            počítané postupne za sebou. Inak je vstupom vstupná dávka celého modelu.
+        :param generation:  poradové číslo stavu váh, ku ktorému výpočet patrí.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: list výstupov vrstiev alebo None.
+        """
+        worker = self.__inference_worker
+        if worker is None:
+            return None
+
+        # Výstupné polia sú pripravené v tomto procese, preto je potrebné poznať ich rozmer. Ak rozmer výstupu niektorej
+        # vrstvy nie je pevne daný, je výpočet ponechaný na tento proces.
+        output_shapes = []
+        for layer_number in layers_list:
+            output_shape = tuple(self.__keras_layers[layer_number].output.shape[1:])
+            if None in output_shape:
+                return None
+            output_shapes.append((len(layer_input),) + output_shape)
+        try:
+            return worker.predict(np.asarray(layer_input, dtype=np.float32), layers_list, output_shapes, partial,
+                                  lambda: self.check_generation(generation))
+        except (InferenceWorkerError, OSError):
+            # Ak proces zlyhal alebo nebolo možné vytvoriť zdieľanú pamäť, je proces ukončený a ďalšie výpočty
+            # prebiehajú v tomto procese.
+            self.stop_inference_worker()
+            return None
+
+    def start_inference_worker(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Spustí samostatný proces na výpočet výstupov vrstiev. Model s aktuálnymi váhami je uložený do dočasného súboru,
+        z ktorého ho proces načíta. Ak model nie je možné uložiť, proces nie je spustený.
+        """
+        if self.__keras_model is None or self.__inference_worker is not None:
+            return
+        with self.__compute_lock:
+            # Model aj proces dostanú rovnaké kópie váh, aby proces vedel, s akými váhami bol model uložený.
+            snapshot = self.take_weights_snapshot(0, self.__number_of_layers - 1)
+            self.synchronize_keras_weights(snapshot)
+            file_descriptor, model_path = tempfile.mkstemp(suffix='.h5')
+            os.close(file_descriptor)
+            try:
+                self.__keras_model.save(model_path)
+            except Exception:
+                os.remove(model_path)
+                return
+            try:
+                self.__inference_worker = InferenceWorker(model_path,
+                                                          [snapshot[n][0] for n in range(self.__number_of_layers)],
+                                                          [snapshot[n][1] for n in range(self.__number_of_layers)])
+            except OSError:
+                # Ak proces nie je možné spustiť, výstupy sú počítané v tomto procese. Dočasný súbor zmaže finalizer
+                # inštancie.
+                self.__inference_worker = None
+
+    def update_inference_worker(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Spustí alebo ukončí samostatný proces na výpočet výstupov vrstiev podľa toho, či má byť používaný. Metóda je
+        volaná vo vlákne na pozadí, keďže čaká na dokončenie výpočtu výstupov vrstiev, ukladá model do súboru a spúšťa
+        proces. Stav je zistený až pod zámkom, takže pri viacerých rýchlych zmenách nastavenia platí posledná z nich.
+        """
+        with self.__compute_lock:
+            if self.__use_inference_worker:
+                self.start_inference_worker()
+            else:
+                self.stop_inference_worker()
+
+    def stop_inference_worker(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Ukončí samostatný proces na výpočet výstupov vrstiev, ak je spustený.
+        """
+        worker = self.__inference_worker
+        self.__inference_worker = None
+        if worker is not None:
+            worker.close()
+
+    def get_activation_for_layer(self, input_points, updated_layers_list, generation=None):
         """
         Popis
         ----------------------------------------------------------------------------------------------------------------
@@ -296,21 +1006,57 @@ class GraphLogicLayer:
         ----------------------------------------------------------------------------------------------------------------
         :param input_points:        vstupné body, ktorých aktiváciu chceme získať
         :param updated_layers_list: zoznam vrstiev, pre ktoré majú byť vypočítané hodnty výstupu.
+        :param generation:          poradové číslo stavu váh, ku ktorému výpočet patrí. Ak je zadané, je predikcia
+                                    vykonávaná po dávkach a medzi nimi je kontrolované, či stav váh nie je zastaraný.
         """
-        # Je vytvorený zoznam odkazov na výstupy vrstiev na základe parametra updated_layers_list. Tento zoznam sa nás-
-        # ledne použije ako parameter metódy keras modelu.
-        calculated_layers = [self.__keras_model.layers[layer_number].output for layer_number in
-                             updated_layers_list]
-
-        # Je vytvorený pomocný model, ktorý slúži na výpočet výstupov medziľahlých vrstiev. Pri vytváraní je ako
-        # argument použitý vstupn neurónvej siete, ktorá je načítaná a ako výstupy sú použité odkazy na výstupy
-        # jednotlivých vrstiev, pre ktoré chceme tieto výstupy vypočítať.
-        intermediate_layer_mode = keras.Model(inputs=self.__keras_model.input,
-                                              outputs=calculated_layers)
+        # Pomocný model je získaný z cache podľa n-tice požadovaných vrstiev. Nový model je vytváraný len v prípade, ak
+        # pre danú kombináciu vrstiev ešte neexistuje.
+        intermediate_layer_mode = self.get_intermediate_model(updated_layers_list)
 
         # Na pomocnom modeli je spusená metóda na predikciu výstupu, ktorej návratovou hodnotou je list výstupných
         # hodnôt bodov po prechode sieťou na určitej vrstve, ktorej výstup sme požadovali.
-        return intermediate_layer_mode.predict(input_points)
+        if generation is None:
+            return intermediate_layer_mode.predict(input_points)
+
+        # Pri výpočte po zmene váh je predikcia rozdelená na dávky, aby ju bolo možné prerušiť, ak medzičasom došlo k
+        # ďalšej zmene váh. Výstupy dávok sú pre každú vrstvu spojené do jedného poľa.
+        outputs = [[] for _ in updated_layers_list]
+        for batch_start in range(0, len(input_points), PARTIAL_BATCH_SIZE):
+            self.check_generation(generation)
+            batch_outputs = intermediate_layer_mode.predict_on_batch(
+                input_points[batch_start:batch_start + PARTIAL_BATCH_SIZE])
+            if not isinstance(batch_outputs, list):
+                batch_outputs = [batch_outputs]
+            for i, batch_output in enumerate(batch_outputs):
+                outputs[i].append(np.asarray(batch_output))
+        return [np.concatenate(layer_outputs) for layer_outputs in outputs]
+
+    def get_intermediate_model(self, updated_layers_list):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vráti pomocný model na výpočet výstupov zadaných vrstiev. Vytvorené modely sú uchovávané v cache, takže pri
+        opakovanom výpočte nedochádza k opätovnému vytváraniu a trasovaniu grafu keras modelu.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param updated_layers_list: zoznam vrstiev, ktorých výstupy má pomocný model počítať.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: pomocný keras model s výstupmi zadaných vrstiev.
+        """
+        # Kľúčom do cache je n-tica poradových čísel vrstiev. Ak model pre tento kľúč ešte nebol vytvorený, je vytvorený
+        # zoznam odkazov na výstupy vrstiev a následne pomocný model, ktorého vstupom je vstup načítanej neurónovej
+        # siete a výstupmi sú výstupy jednotlivých vrstiev. Váhy vrstiev sú zdieľané s pôvodným modelom, preto
+        # zmena váh nemá na platnosť pomocného modelu vplyv.
+        cache_key = tuple(updated_layers_list)
+        intermediate_model = self.__models_cache.get(cache_key)
+        if intermediate_model is None:
+            calculated_layers = [self.__keras_model.layers[layer_number].output for layer_number in cache_key]
+            intermediate_model = keras.Model(inputs=self.__keras_model.input, outputs=calculated_layers)
+            self.__models_cache[cache_key] = intermediate_model
+        return intermediate_model
 
     def set_points_for_layer(self, layer_number):
         """
@@ -324,10 +1070,10 @@ class GraphLogicLayer:
         ----------------------------------------------------------------------------------------------------------------
         :param layer_number: číslo vrstvy, pre ktorú sa má vypočítať aktivácia
         """
-        # Ak sú načítané nejaké vsutpné body vykoná sa vypočet a nastavenie výstupov pre zadanú vrstvu.
+        # Ak sú načítané nejaké vsutpné body je nastavený výstup pre zadanú vrstvu. Výstup je získaný zo slovníka
+        # výstupov vrstiev, takže sieť je spustená len v prípade, ak výstup ešte nebol vypočítaný.
         if self.__input_data is not None:
-            self.__neural_layers[layer_number].point_cords = self.get_activation_for_layer(self.__input_data,
-                                                                                           [layer_number]).transpose()
+            self.assign_layer_cords(layer_number)
 
         # Ak je na vrstve zvolená možnosť vykresľovania mriežky, sú vypočítané a nastavnené súradnice začiatočných a
         # koncových bodov.
@@ -345,13 +1091,14 @@ class GraphLogicLayer:
         :param layer_number: predstavuje číslo vrstvy, pre ktorú majú byť výstupné hodnoty vypočítané a následne aj
                              priradené.
         """
-        # Výpočet aktivácie pre jednotlivé body hrán polygonu.
-        if self.__polygon_cords is not None:
-            start_points = self.get_activation_for_layer(self.__polygon_cords[0], [layer_number]).transpose()
-            end_points = self.get_activation_for_layer(self.__polygon_cords[1], [layer_number]).transpose()
-            self.__neural_layers[layer_number].polygon_cords_tuples = [start_points, end_points]
+        # Výstupy pre jednotlivé body hrán polygonu sú získané zo slovníka výstupov vrstiev, kde boli vypočítané spolu
+        # so vstupnými dátami. Výstupy musia byť transponované a následne sú priradené príslušnej vrstve.
+        if self.__polygon_peaks is not None and self.__input_data is not None:
+            start_points, end_points = self.get_polygon_activation(layer_number)
+            self.__neural_layers[layer_number].polygon_cords_tuples = [start_points.transpose(),
+                                                                       end_points.transpose()]
 
-    def broadcast_changes(self, start_layer=0):
+    def broadcast_changes(self, start_layer=0, generation=None, reduced_quality=False, layers=None):
         """
         Popis
         ----------------------------------------------------------------------------------------------------------------
@@ -359,31 +1106,40 @@ class GraphLogicLayer:
 
         Paramatre
         ----------------------------------------------------------------------------------------------------------------
-        :param start_layer: poradové číslo vrstvy. Vrstvy s poradovým číslom väčším ako je toto, budú prekreslené.
+        :param start_layer:     poradové číslo vrstvy. Vrstvy s poradovým číslom väčším ako je toto, budú prekreslené.
+        :param generation:      poradové číslo stavu váh, ku ktorému výpočet patrí. Ak počas výpočtu dôjde k ďalšej
+                                zmene váh, nie sú grafy prekreslené a je vyvolaná výnimka StaleComputationError.
+        :param reduced_quality: ak je nastavené na True, metódy na redukciu priestoru sú vypočítané v zníženej kvalite,
+                                aby bolo možné dodržať požadovaný počet prekreslení za sekundu.
+        :param layers:          zoznam vrstiev, ktoré majú byť prekreslené. Ak nie je zadaný, sú prekreslené všetky
+                                aktívne vrstvy od vrstvy start_layer.
         """
+        if layers is None:
+            layers = [layer_number for layer_number in self.__active_layers if layer_number >= start_layer]
 
         # Je vytvorený nový zoznam, ktorý bude obsahovať vlákna podieľajúce sa na vypočte zvolených metód na vrstvách
         # neurónovej siete.
         threads = []
-        for layer_number in self.__active_layers:
-            # Pre každu vrstvu medzi aktívnymi vrstvami, sa otestuje, či je jej poradové číslo väčsie, alebo rovne ako
-            # číslo vrstvy, od ktorej sa majú vykonávať zmeny.
-            if layer_number >= start_layer:
-
-                # Ak je poradové číslo väčšie, je vytvorené vlákno, ktorému je priradená metóda vrstvy, vykonávajúca
-                # prípadný výpočet metódy na redukciu priestoru. Vlákno je pridané do zoznamu pracujúcich vlakien
-                # a je spustené.
-                thread = threading.Thread(target=self.__neural_layers[layer_number].apply_displayed_data_changes)
-                threads.append(thread)
-                thread.start()
+        updated = dict()
+        for layer_number in layers:
+            # Pre každú vrstvu je vytvorené vlákno, ktorému je priradená metóda vrstvy, vykonávajúca prípadný výpočet
+            # metódy na redukciu priestoru. Vlákno je pridané do zoznamu pracujúcich vlakien a je spustené.
+            thread = threading.Thread(target=self.apply_layer_changes,
+                                      args=(layer_number, generation, reduced_quality, updated))
+            threads.append(thread)
+            thread.start()
 
         # Následne sa prechádza zoznam pracujúcich vlákien a čaká sa, kým každé z nich vykoná zadanú činnosť.
         for thread in threads:
             thread.join()
 
-        # Po tom, čo každé vlákno dokončí svoju úlohu, sú ovplyvnené aktívne vrstvy prekreslené.
-        for layer_number in self.__active_layers:
-            if layer_number >= start_layer:
+        # Po tom, čo každé vlákno dokončí svoju úlohu, sú ovplyvnené aktívne vrstvy prekreslené. Prekreslené sú len
+        # vtedy, ak výsledky stále zodpovedajú najnovšiemu stavu váh. Vrstvy, ktorých výpočet bol pri zníženej kvalite
+        # odložený, prekreslené nie sú.
+        self.check_generation(generation)
+        for layer_number in layers:
+            if updated.get(layer_number, False):
+                self.check_generation(generation)
                 self.__neural_layers[layer_number].redraw_graph_if_active()
 
         # Pri výpočte mohlo dôjsť k zmenám informácií, napríklad k zmene vyjadrenej variability prislúchajúcej k jedno-
@@ -391,6 +1147,28 @@ class GraphLogicLayer:
         # ovplyvnili.
         self.__mg_frame.update_active_options_layer(start_layer)
 
+    def apply_layer_changes(self, layer_number, generation=None, reduced_quality=False, updated=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Metóda spúšťaná vo vláknach metódy broadcast_changes. Vykoná výpočet zvolenej metódy na redukciu priestoru
+        pre zadanú vrstvu. Ak je výpočet prerušený kvôli zastaranému stavu váh, vlákno je ticho ukončené.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layer_number:    poradové číslo vrstvy, pre ktorú sa má výpočet vykonať.
+        :param generation:      poradové číslo stavu váh, ku ktorému výpočet patrí.
+        :param reduced_quality: hodnota značiaca, či má byť výpočet vykonaný v zníženej kvalite.
+        :param updated:         slovník, do ktorého je pod poradovým číslom vrstvy zapísané, či boli zobrazované údaje
+                                vrstvy zmenené.
+        """
+        try:
+            result = self.__neural_layers[layer_number].apply_displayed_data_changes(generation, reduced_quality)
+        except StaleComputationError:
+            result = False
+        if updated is not None:
+            updated[layer_number] = result
+
     def redraw_active_graphs(self, start_layer=0):
         """
         Popis
@@ -422,17 +1200,76 @@ class GraphLogicLayer:
         """
         self.__keras_layers[layer_number].set_weights([np.array(layer_weights), np.array(layer_biases)])
 
+    def synchronize_keras_weights(self, snapshot=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Nastaví vrstvám keras modelu aktuálne hodnoty váh a biasov tých vrstiev, na ktorých od poslednej synchronizácie
+        došlo k zmene. Metódu je potrebné zavolať pred výpočtom pomocou keras modelu a pred jeho uložením.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param snapshot: kópie váh získané metódou take_weights_snapshot. Vrstvám, ktoré obsahuje, sú nastavené váhy z
+                         kópií, aby výstupy zodpovedali ich hashom. Neskoršia zmena váh vrstvu opäť označí ako
+                         nesynchronizovanú.
+        """
+        # Množina zmenených vrstiev je prevzatá pod zámkom výstupov, keďže do nej pridáva monitorovacie vlákno.
+        # Nastavovanie váh prebieha pod zámkom výpočtu, aby sa váhy keras modelu nemenili počas výpočtu. Kópie váh
+        # mohli vzniknúť skôr, ako monitorovacie vlákno vrstvu označilo ako zmenenú, preto sú nastavené aj vrstvám,
+        # ktorých váhy v keras modeli majú iný hash ako kópia.
+        with self.__compute_lock:
+            with self.__store_lock:
+                unsynced_layers = set(self.__unsynced_layers)
+                self.__unsynced_layers.clear()
+            if snapshot is not None:
+                unsynced_layers.update(layer_number for layer_number, (weights, _, digest) in snapshot.items()
+                                       if weights is not None and digest != self.__keras_digests.get(layer_number))
+            for layer_number in sorted(unsynced_layers):
+                layer = self.__neural_layers[layer_number]
+                if snapshot is not None and layer_number in snapshot:
+                    weights, biases, digest = snapshot[layer_number]
+                else:
+                    weights, biases = np.array(layer.layer_weights), np.array(layer.layer_biases)
+                    digest = get_weights_digest(weights, biases)
+                if digest == self.__keras_digests.get(layer_number):
+                    continue
+                self.set_layer_weights_and_biases(layer_number, weights, biases)
+                self.__keras_digests[layer_number] = digest
+
+                # Ak je spustený samostatný proces na výpočet výstupov, sú mu poslané len zmenené prvky váh.
+                if self.__inference_worker is not None:
+                    try:
+                        self.__inference_worker.set_layer_weights(layer_number, weights, biases)
+                    except (InferenceWorkerError, OSError):
+                        self.stop_inference_worker()
+
+    def check_generation(self, generation):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Overí, či výpočet patrí k najnovšiemu stavu váh. Ak medzičasom došlo k ďalšej zmene váh, je vyvolaná výnimka
+        StaleComputationError, ktorá výpočet preruší.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param generation: poradové číslo stavu váh, ku ktorému výpočet patrí. Ak je None, výpočet nie je prerušiteľný.
+        """
+        if generation is not None and generation != self.__generation:
+            raise StaleComputationError()
+
     def signal_change_on_layer(self, layer_number):
         """
         Popis
         ----------------------------------------------------------------------------------------------------------------
-        Metóda pridá do zásobníka zmenených vrstiev, číslo vrstvy na ktorej došlo k zmene.
+        Metóda pridá do zásobníka zmenených vrstiev, číslo vrstvy na ktorej došlo k zmene. Každá zmena vytvára nový
+        stav váh, preto je zvýšené jeho poradové číslo.
 
         Parametre
         ----------------------------------------------------------------------------------------------------------------
         :param layer_number: poradové číslo vrstvy, na ktorej došlo k zmene váh alebo biasov
         """
         self.__condition_var.acquire()
+        self.__generation += 1
         self.__changed_layer_q.add(layer_number)
         self.__condition_var.notify()
         self.__condition_var.release()
@@ -473,6 +1310,7 @@ class GraphLogicLayer:
                     except Exception as e:
                         return e
                     self.__input_data = new_value
+                    self.prepare_input_batch()
                     self.reset_points_config()
 
                     basic_color_list = self.__points_config['default_color']
@@ -524,6 +1362,7 @@ class GraphLogicLayer:
                     # údaje. Následne je resetovaná konfiguračná premenná pre body a do pomocnej premennej je
                     # priradený odkaz na list, ktorý bude obsahovať základnú farbu načítaných vstupov.
                     self.__input_data = np.array(input_data_tmp).reshape(-1, *self.__keras_model.input_shape[-3:])
+                    self.prepare_input_batch()
                     self.reset_points_config()
                     basic_color_list = self.__points_config['default_color']
 
@@ -622,20 +1461,16 @@ class GraphLogicLayer:
 
                     # Ak sa počet stĺpcov nachádza v prípustnom intervale, je medzi stĺpcami nájdená maximálna a
                     # minimálna hodnota vstupu, na základe ktorých bude definovaná priestorová mriežka. Každá
-                    # hrana bude rozdelená na päť častí.
+                    # hrana bude rozdelená na zvolený počet častí.
                     minimal_cord = np.min(self.__input_data[:, :shape_of_input], axis=0).tolist()
                     maximal_cord = np.max(self.__input_data[:, :shape_of_input], axis=0).tolist()
-                    polygon = Polygon(minimal_cord, maximal_cord, [5, 5, 5])
+                    polygon = Polygon(minimal_cord, maximal_cord, [self.__polygon_division] * shape_of_input)
 
-                    # Vrcholy a pdobne aj hrany mriežky sú prevedené na numpy array a sú priradené do premennej.
-                    polygon_peak_cords = np.array(polygon.Peaks)
-                    edges_tuples = np.array(polygon.Edges)
-
-                    # Začiatočné a koncové vrcholy sú získane na základe definovaných hrán a priradené do premennej
-                    # držiacej odkaz na začiatočne a koncové súradnice vrcholov.
-                    self.__polygon_cords = []
-                    self.__polygon_cords.append(polygon_peak_cords[:, edges_tuples[:, 0]].transpose())
-                    self.__polygon_cords.append(polygon_peak_cords[:, edges_tuples[:, 1]].transpose())
+                    # Vrcholy a hrany mriežky sú priradené do premenných. Vrcholy sú uchované osobitne od hrán, aby
+                    # každý vrchol prechádzal sieťou len raz. Začiatočné a koncové body hrán sú až z výstupov
+                    # vrcholov získané podľa indexov.
+                    self.__polygon_peaks = polygon.Peaks.transpose()
+                    self.__polygon_edges = polygon.Edges
 
                     # Pre každú vrstvu je nastavené, že je možné priestorovú mriežku zobraziť.
                     for layer in self.__neural_layers:
@@ -644,9 +1479,14 @@ class GraphLogicLayer:
 
                     # V prípade ak vstup nespĺňa podmienky, je každej vrstve atribút signalizujúci možnosť vykreslenia
                     # priestorovej mriežky nastavený na False.
+                    self.__polygon_peaks = None
+                    self.__polygon_edges = None
                     for layer in self.__neural_layers:
                         layer.possible_polygon = False
 
+                # Vstupné dáta sú spolu s bodmi mriežky spojené do jednej dávky, ktorá bude prechádzať sieťou.
+                self.prepare_input_batch()
+
                 # Ak prebehlo načítvanaie bez chyby, sú aplikované zmeny a grafy všetky grafy sú prekreslené. Taktiež
                 # je aktualizovaný aj panel možností, pretože načítaním dát sa môžu sprístupniť určité nové možnosti.
                 self.recalculate()
@@ -838,6 +1678,21 @@ class GraphLogicLayer:
         for layer in self.__neural_layers:
             layer.set_default_cords()
 
+    def request_layers_refresh(self, layers):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vyžiada prepočítanie a prekreslenie zadaných vrstiev v monitorovacom vlákne. Používa sa pre výpočty, ktoré sú
+        príliš zdĺhavé na to, aby prebiehali v hlavnom vlákne.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param layers: zoznam poradových čísel vrstiev.
+        """
+        with self.__condition_var:
+            self.__requested_layers.update(layers)
+            self.__condition_var.notify()
+
     def require_options_bar_update(self, neural_layer):
         """
         Popis
@@ -880,6 +1735,69 @@ class GraphLogicLayer:
     def active_layers(self, value):
         self.__active_layers = value
 
+    @property
+    def polygon_division(self):
+        return self.__polygon_division
+
+    @polygon_division.setter
+    def polygon_division(self, value):
+        self.__polygon_division = max(int(value), 1)
+
+    @property
+    def projection_pool(self):
+        return self.__projection_pool
+
+    @property
+    def results_cache(self):
+        return self.__results_cache
+
+    @property
+    def store_lock(self):
+        return self.__store_lock
+
+    @property
+    def generation(self):
+        return self.__generation
+
+    @property
+    def memoization_memory_limit(self):
+        return self.__results_cache.max_bytes
+
+    @memoization_memory_limit.setter
+    def memoization_memory_limit(self, value):
+        self.__results_cache.max_bytes = value
+
+    @property
+    def use_inference_worker(self):
+        return self.__use_inference_worker
+
+    @use_inference_worker.setter
+    def use_inference_worker(self, value):
+        self.__use_inference_worker = bool(value)
+        threading.Thread(target=self.update_inference_worker, daemon=True).start()
+
+    @property
+    def visible_layers(self):
+        return self.__visible_layers
+
+    @visible_layers.setter
+    def visible_layers(self, value):
+        # Pri zmene viditeľných vrstiev je prebudené monitorovacie vlákno, aby prepočítalo neaktuálne vrstvy, ktoré sa
+        # práve zobrazili.
+        with self.__condition_var:
+            if value != self.__visible_layers:
+                self.__visible_layers = set(value)
+                self.__visibility_changed = True
+                self.__condition_var.notify()
+
+    @property
+    def refresh_rate(self):
+        return self.__refresh_rate
+
+    @refresh_rate.setter
+    def refresh_rate(self, value):
+        self.__refresh_rate = max(float(value), 1.0)
+
 
 class NeuralLayer:
     def __init__(self, logic_layer: GraphLogicLayer, keras_layer: keras.layers.Layer,
@@ -916,7 +1834,8 @@ class NeuralLayer:
         :var self.__logic_layer:    odkaz na triedu typu GraphLogicLayer.
         :var self.__layer_number:   poradové číslo vrstvy.
         :var self.__point_cords:    obsahuje výstupné hodnoty bodov na tejto sieti bez aplikácie niektorej z metód na
-                                    redukciu priestoru.
+                                    redukciu priestoru. Ide o transponovaný pohľad na súvislé pole výstupu vrstvy
+                                    v tvare (body, výška, šírka, feature mapy), prípadne (body, výstupy).
         :var self.__used_cords:     list použitých súradnic, ktorého obsah závisí od použitej metódy redukcie priestoru.
         :var self.__activ_nodes_l:  názvy výstupov, používaných pri výpise informácií ohľadom použitej PCA, konkrétne
                                     informácie o vplyve výstupu na jednotlivé hlavné komponenty.
@@ -926,6 +1845,25 @@ class NeuralLayer:
                                     súradnice ale z tejto premennej sú vytiahnuté len požadované súradnice.
         :var self.__visible:        nesie informáciu o tom, či je pre danú vrstvu vykresľovaný zobrazený rámec s grafom
                                     a ovládačom váh.
+        :var self.__pca_basis:      báza hlavných komponentov z posledného výpočtu metódy PCA. Obsahuje číslo feature
+                                    mapy, stred a mierku bodov a pole hlavných komponentov. Ak je v konfigurácií PCA
+                                    zapnutá zmrazená báza, sú nové výstupy vrstvy premietnuté do tejto bázy namiesto
+                                    opätovného výpočtu metódy. Osi grafu sa tak pri zmene váh neotáčajú.
+        :var self.__t_sne_state:    výsledok posledného výpočtu metódy t-SNE. Obsahuje číslo feature mapy, použitú
+                                    konfiguráciu a súradnice bodov. Ďalší výpočet s rovnakými parametrami pokračuje z
+                                    týchto súradníc.
+        :var self.__t_sne_affinities: matica afinít z posledného výpočtu metódy t-SNE spolu s kľúčom, ktorý tvorí číslo
+                                      feature mapy, perplexita a odtlačok bodov. Pri zmene ostatných parametrov metódy
+                                      nie je potrebné maticu počítať znova.
+        :var self.__t_sne_progress:   ak práve prebieha výpočet metódy t-SNE, obsahuje dvojicu (číslo iterácie, počet
+                                      iterácií), inak None.
+        :var self.__t_sne_cancelled:  príznak, ktorým používateľ žiada o ukončenie prebiehajúceho výpočtu metódy t-SNE.
+        :var self.__cords_state:      stav váh a vstupnej dávky, z ktorého boli vypočítané výstupy vrstvy. Spolu s
+                                      metódou a jej parametrami tvorí kľúč do vyrovnávacej pamäte výsledkov metód na
+                                      redukciu priestoru.
+        :var self.__precompute_request: poradové číslo stavu váh, stav výstupov vrstvy, metóda a jej parametre, pre
+                                      ktoré sú na pozadí počítané výsledky ostatných feature máp, alebo None, ak
+                                      žiadny výpočet neprebieha.
 
         Parametre
         ----------------------------------------------------------------------------------------------------------------
@@ -954,6 +1892,13 @@ class NeuralLayer:
         self.__pc_labels = []
         self.__method_cords = []
         self.__visible = False
+        self.__pca_basis = None
+        self.__t_sne_state = None
+        self.__t_sne_affinities = None
+        self.__t_sne_progress = None
+        self.__t_sne_cancelled = False
+        self.__cords_state = None
+        self.__precompute_request = None
 
         # Podľa toho, či výstupný tvar obsahuje viac ako dva rozmery, či su na výstupe vrstvy prítomné feature mapy.
         # Výstupný formát má tvar (veľkosť vstupnej dávky (väčšinou hodnota None), (tu sa možu nachádzať dva rozme-
@@ -1105,6 +2050,10 @@ class NeuralLayer:
         self.__layer_config['used_method'] = 'No method'
         self.__layer_config['config_selected_method'] = 'No method'
 
+        # Pod kľúčom precompute_feature_maps je informácia o tom, či majú byť na pozadí vypočítané výsledky metódy na
+        # redukciu priestoru aj pre ostatné feature mapy vrstvy.
+        self.__layer_config['precompute_feature_maps'] = False
+
         # V nasledujúcej časti sú definované konfigurácie, ktoré v sebe nesú nasavenia pre výpočet a zobrazenie metód
         # na redukciu priestoru. Najskôr sú definované hodnoty, ktoré bude táto konfiguračná peremenná obsahovať.
         # Konfigruacia pre metódu na redukciu No method obsahuje zoznam súradníc, ktoré majú byť po výpočte zo-
@@ -1116,6 +2065,8 @@ class NeuralLayer:
                       'n_possible_pc': 0,
                       'percentage_variance': None,
                       'largest_influence': None,
+                      'frozen_basis': False,
+                      'truncated': False
                       }
 
         # Metóda t-SNE je určená pre vizualizáciu viac dimenzionálnych dát. Dáta dokáže transformovať maximálne do troch
@@ -1124,12 +2075,15 @@ class NeuralLayer:
         number_t_sne_components = min(self.__output_dim, 3)
 
         # Konfigurácia pre metódu t-SNE pozostáva z viacerých častí. Prvá čast obsahuje parametre pre jej výpočet.
-        # Hodnoty týchto parametrov boli nastavené podľa dokumentácie k metóda t-SNE v knižnici sklearn.
+        # Hodnoty týchto parametrov boli nastavené podľa dokumentácie k metóda t-SNE v knižnici sklearn. Parameter
+        # n_landmarks s hodnotou 0 znamená, že metóda je vypočítaná presne pre všetky body. Výpočet len pre vybrané body
+        # si musí používateľ zapnúť sám.
         used_config = {'n_components': number_t_sne_components,
                        'perplexity': 30,
                        'early_exaggeration': 12.0,
                        'learning_rate': 200,
-                       'n_iter': 1000}
+                       'n_iter': 1000,
+                       'n_landmarks': 0}
 
         # Parametre bude používateľ schopný meniť a preto tieto vstupy bude potrebné ošetriť a zistiť či sú valídne,
         # preto je vytvorený slovník obsahujúci pod identifikátorom parametra požadovaný typ a hranice prípustné
@@ -1139,7 +2093,8 @@ class NeuralLayer:
                              'perplexity': (0, float, float("inf")),
                              'early_exaggeration': (0, float, 1000),
                              'learning_rate': (float("-inf"), float, float("inf")),
-                             'n_iter': (250, int, float("inf"))
+                             'n_iter': (250, int, float("inf")),
+                             'n_landmarks': (0, int, float("inf"))
                              }
 
         # Jedodtlivé časti konfigurácie pre metódu t-SNE sú priradené do premennej. Premenná obsahuje aj kľúč options_pa
@@ -1158,31 +2113,62 @@ class NeuralLayer:
         # Na záver je pre všetky metódy nastaviť valídne základné súradnice, ktoré majú byť zobrazené.
         self.set_default_cords()
 
-    def apply_displayed_data_changes(self):
+    def apply_displayed_data_changes(self, generation=None, reduced_quality=False):
         """
         Popis
         ----------------------------------------------------------------------------------------------------------------
         Metóda nastaví dáta, ktoré sa majú zobraziť, ak náhodou došlo k zmenám metód na redukciu priestoru na danej vr-
         stve.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param generation:      poradové číslo stavu váh, ku ktorému výpočet patrí. Ak počas výpočtu dôjde k ďalšej
+                                zmene váh, je výpočet prerušený výnimkou StaleComputationError a výsledky nie sú
+                                nastavené.
+        :param reduced_quality: ak je nastavené na True, je metóda PCA vypočítaná len z podmnožiny bodov a výpočet
+                                metódy t-SNE je odložený, až kým používateľ neprestane meniť váhy.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: vracia True, ak boli zobrazované údaje vrstvy zmenené, inak False.
         """
+        # Výpočet metódy t-SNE vyžiadaný z hlavného vlákna je odovzdaný monitorovaciemu vláknu. Tam prebieha s poradovým
+        # číslom stavu váh, takže je pri zmene váh prerušený, a nemôže prebiehať súčasne s iným výpočtom tejto vrstvy.
+        # Výsledok je zobrazený po dokončení výpočtu.
+        if self.__has_points and self.__layer_config['used_method'] == 't-SNE' and \
+                threading.current_thread() is threading.main_thread():
+            self.__logic_layer.request_layers_refresh([self.__layer_number])
+            return False
+
         # Podľa toho, či sú načítané nejaké vstupy sa buď to vykoná požadovaná metóda na redukciu alebo metóda skončí.
         if self.__has_points:
 
             # Ak boli načítané nejaké vstupy je podľa použitej metódy na redukicu priestoru použitá metóda na jej výpo-
             # čet.
             used_method = self.__layer_config['used_method']
+            self.__logic_layer.check_generation(generation)
             if used_method == 'No method':
                 self.apply_no_method()
             elif used_method == 'PCA':
-                self.apply_PCA()
+                self.apply_PCA(generation, reduced_quality)
             elif used_method == "t-SNE":
-                self.apply_t_SNE()
+                # Výpočet metódy t-SNE je príliš náročný na to, aby sa stihol počas jedného snímku. Pri zníženej
+                # kvalite je preto ponechané posledné zobrazenie.
+                if reduced_quality:
+                    return False
+                self.apply_t_SNE(generation)
 
             # Na zákalde zvolenej metódy na redukciu priestoru sú nastavené súradnice, ktoré sa majú byť zobrazené.
             self.set_used_cords()
             # Na záver sú triede zodpovednej za vykreslenie výstupu vrstvy nastavené požadované súradnice na zobrazenie.
             self.set_points_for_graph()
 
+            # Po dokončení výpočtu v plnej kvalite je prípadne spustený výpočet ostatných feature máp na pozadí.
+            if not reduced_quality:
+                self.start_feature_maps_precompute()
+            return True
+        return False
+
     def set_points_for_graph(self):
         """
         Popis
@@ -1240,12 +2226,12 @@ class NeuralLayer:
                 # Ak sa na výstupe nachádzajú feature mapy a nie je použitá žiadna z metód na redukciu priestoru, test-
                 # uje sa, či sú nastavené súradnice pre zobrazenie.
                 if len(self.__method_cords) != 0:
-                    # Ak sú súradnice nastavené, na základe  atribútu so zvolenou feature mapou je zvolený výstup
-                    # zodpovedajúcí aktivácií načítaných bodov pre danú feature mapu. Z hodnôt výstupov jedno-
-                    # tlivých obrázkov pre túto feature mapu sú zvolené zadané súradnice.
-                    feature_map_points = self.__method_cords[self.__selected_fm, :, :, :].transpose()
-                    self.__graph_frame.plotting_frame.points_cords = feature_map_points[:, self.__used_cords[0],
-                                                                     self.__used_cords[1]].transpose()
+                    # Ak sú súradnice nastavené, sú z výstupu vrstvy v tvare (body, výška, šírka, feature mapy)
+                    # vybrané zadané súradnice zvolenej feature mapy pre všetky obrázky. Kopírované sú len tieto
+                    # hodnoty.
+                    feature_map_points = self.__method_cords.transpose()
+                    self.__graph_frame.plotting_frame.points_cords = feature_map_points[
+                        :, self.__used_cords[0], self.__used_cords[1], self.__selected_fm].transpose()
             else:
                 # V prípade že na výstupe vrstvy sa nachádzajú feature mapy, alebo je použitá niektorá z metód na red-
                 # ukciu priestoru, skontorluje sa, či sú zadané súradnice na zobrazenie pre metódu.
@@ -1259,108 +2245,270 @@ class NeuralLayer:
         Popis
         ----------------------------------------------------------------------------------------------------------------
         Metóda, ktorá sa zavolá ak nie je nastavená žiadna ina metóda na redukciu priestoru. Spočíva v jednoduchom
-        priradení hodnôt výstupu vrstvy vypočítaných na zákalde predikcie neurónovej siete.
+        priradení hodnôt výstupu vrstvy vypočítaných na zákalde predikcie neurónovej siete. Výstup vrstvy nie je
+        menený, preto nie je potrebné ho kopírovať.
         """
-        self.__method_cords = self.__point_cords.copy()
+        self.__method_cords = self.__point_cords
 
-    def apply_PCA(self):
+    def apply_PCA(self, generation=None, reduced_quality=False):
         """
         Popis
         ----------------------------------------------------------------------------------------------------------------
         Metóda vykoná výpočet metódy PCA. Postup pri výpočte sa v niektorých častiach líši s ohľadom na to, či je výstup
         z vrsty vo forme feature máp alebo nie.
-        """
-        # Pri vykonávaní metódy môže dôjsť k tomu, že nastane delenie nulou. Vtedy by bolo vypísané varovanie. Pomocou
-        # tohto príkazu je tento varovný výpis potlačený.
-        np.seterr(divide='ignore', invalid='ignore')
-
-        # Spracovanie bodov pred použitím metódy závisí od toho či su výstupom vrstvy feature mapy alebo nie.
-        if self.__has_f_maps:
 
-            # Ak sa na výstupe vrstvy nachádzajú feature mapy, sú podľa zvolenej feature mapy vybrané príslušné feature
-            # mapy pre každý zo vstupov. Hodnoty sú získane z atribútu obsahujúce výstupy pre danú vrstvu, získané na
-            # základe predpovede keras modelu. Tieto feature mapy, väčšinou vo forme polí, sú potom pre jednotlivé
-            # vstupy transformované na vektory a vložené do premennej.
-            feature_map_points = self.__point_cords[self.__selected_fm, :, :, :].transpose()
-            points_cords = np.array([xi.flatten() for xi in feature_map_points])
-        else:
-
-            # Ak výstup neobsahuje feature mapy, sú body pre metódu získané jednoducho prekopríovaním hodnôt získaných
-            # získaných predikciou výstupu pre danú vrstvu pomocou keras modelu.
-            points_cords = self.__point_cords.transpose().copy()
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param generation:      poradové číslo stavu váh, ku ktorému výpočet patrí.
+        :param reduced_quality: ak je nastavené na True, sú normalizácia aj hlavné komponenty určené len z rovnomerne
+                                vybranej podmnožiny bodov. Transformované sú následne všetky body.
+        """
+        # Pri zapnutom režime truncated je vypočítaný len obmedzený počet najvýznamnejších komponentov.
+        pca_config = self.__layer_config['PCA_config']
+        n_components = TRUNCATED_PCA_COMPONENTS if pca_config['truncated'] else None
+
+        # Ak bola metóda pre rovnaké výstupy vrstvy a rovnaké parametre už vypočítaná, je výsledok použitý z vyrovnáva-
+        # cej pamäte. Výsledky v zníženej kvalite a premietnutia do zmrazenej bázy do nej ukladané nie sú.
+        cache_key = None
+        if not reduced_quality and not pca_config['frozen_basis']:
+            cache_key = self.get_projection_cache_key('PCA', n_components)
+            cached = self.__logic_layer.results_cache.get(cache_key) if cache_key is not None else None
+            if cached is not None:
+                self.set_PCA_entry(cached)
+                return
 
-        # Načítané body je potrebné následne normalizovať. Na to je použitá funkcia z knižnice sklearn. Normalizácia je
-        # potrebná, pretože metóda by vyšším hodnotám prikladala väčší význam čo sa týka vysvetlenej variability, aj
-        # keď by to nemusela byť pravda v prípade keď budú dáta štandardizované.
-        scaled_data = preprocessing.StandardScaler().fit_transform(points_cords)
-        pca = PCA()
+        # Body pre metódu sú získané z výstupu vrstvy. Ak sa na výstupe vrstvy nachádzajú feature mapy, sú pre každý
+        # zo vstupov vybrané hodnoty zvolenej feature mapy a transformované na vektor. Inak sú body získané priamo
+        # z výstupu vrstvy bez kopírovania.
+        points_cords = self.get_points_matrix()
+
+        # Ak je zapnutá zmrazená báza a báza z posledného výpočtu zodpovedá zobrazovaným bodom, sú body do nej len
+        # premietnuté. Informácie o vysvetlenej variabilite zostávajú z posledného výpočtu.
+        basis = self.__pca_basis
+        if pca_config['frozen_basis'] and basis is not None and basis['feature_map'] == self.__selected_fm and \
+                basis['n_components'] == n_components and len(basis['mean']) == points_cords.shape[1]:
+            pca_data = project_with_basis(points_cords, basis['mean'], basis['scale'], basis['components'])
+            self.__logic_layer.check_generation(generation)
+            self.__method_cords = pca_data.transpose()
+            return
+
+        # Pri zníženej kvalite je normalizácia aj PCA určená len z rovnomerne vybranej podmnožiny bodov. Výber s pevným
+        # krokom zaručuje, že pri po sebe idúcich snímkoch sú použité rovnaké body a zobrazenie neskáče.
+        fit_step = 1
+        if reduced_quality and len(points_cords) > REDUCED_PCA_SAMPLE_SIZE:
+            fit_step = int(np.ceil(len(points_cords) / REDUCED_PCA_SAMPLE_SIZE))
+
+        # Metóda PCA je vypočítaná pre body zvolenej feature mapy. Počas čakania na výsledok je kontrolované, či
+        # medzičasom nedošlo k zmene váh.
+        entry = self.compute_PCA_entry(points_cords, self.__selected_fm, n_components, fit_step,
+                                       lambda: self.__logic_layer.check_generation(generation))
+
+        # Ak medzičasom došlo k zmene váh, výsledok už nie je platný a nie je priradený. Inak sú súradnice aj informácie
+        # o výstupe metódy priradené vrstve a výsledok je uložený do vyrovnávacej pamäte.
+        self.__logic_layer.check_generation(generation)
+        self.set_PCA_entry(entry)
+        if cache_key is not None:
+            self.__logic_layer.results_cache.put(cache_key, entry)
+
+    def compute_PCA_entry(self, points_cords, feature_map, n_components, fit_step=1, check=None):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vypočíta metódu PCA pre zadané body a vráti výsledok spolu s informáciami zobrazovanými v panele možností.
+        Výsledok nie je vrstve priradený, preto je metódu možné použiť aj pri výpočte pre inú ako zvolenú feature mapu.
 
-        # Normalizvané dáta sú vložené do funkcie, ktorá zistí hodnoty vlastných vektorov na základe týchto dát.
-        # Potom ako sú hodnoty vlastných vektorov nastavené, sú pomocou nich dáta transformované a priradené
-        # do pomocnej premennej. Dáta v tejto pomocnej premennej zobrazujú transformované súradnice bodov
-        # prislúchajúce jednotlivým hlavným komponentom.
-        pca.fit(scaled_data)
-        pca_data = pca.transform(scaled_data)
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param points_cords: pole bodov s rozmerom (počet bodov, počet príznakov).
+        :param feature_map:  poradové číslo feature mapy, ku ktorej body patria.
+        :param n_components: počet požadovaných hlavných komponentov. Hodnota None značí všetky komponenty.
+        :param fit_step:     krok, s ktorým sú vybrané body na určenie hlavných komponentov.
+        :param check:        funkcia volaná počas čakania na výsledok zo skupiny procesov.
 
-        # Súradnice sú následne transponované a priradené do atribútu obsahujúce výstupné hodnoty po aplikácií niektorej
-        # z metód na redukciu priestoru.
-        self.__method_cords = pca_data.transpose()
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: slovník obsahujúci súradnice, bázu hlavných komponentov a informácie o výstupe metódy.
+        """
+        # Body sú normalizované a je na ne aplikovaná metóda PCA. Pri väčšom počte bodov je výpočet vykonaný v skupine
+        # procesov, aby výpočty pre jednotlivé vrstvy prebiehali naozaj paralelne. Výsledné súradnice sú v takom
+        # prípade uložené v zdieľanej pamäti a nie sú kopírované.
+        projection_pool = self.__logic_layer.projection_pool
+        if projection_pool.is_worth_using(points_cords, 'PCA'):
+            pca_data, variance_ratio, components, mean, scale = projection_pool.pca(points_cords, fit_step, check,
+                                                                                    n_components)
+        else:
+            pca_data, variance_ratio, components, mean, scale = compute_pca_projection(points_cords, fit_step,
+                                                                                       n_components)
 
         # Do pomocnej premennej priradíme počet vzniknutých hlavných komponentov.
-        number_of_pcs_indexes = pca.explained_variance_ratio_.size
+        number_of_pcs_indexes = variance_ratio.size
+        percentage_variance = None
+        largest_influence = None
         if number_of_pcs_indexes > 0:
-            # Ak boli vypočítané niektoré hlavné komponenty, sú informácie získané na základe výstupu z metódy priradené
-            # do konfiguračného súboru PCA metódy. Tieto informácie môžu byť následne zobrazené v panele možností.
-            # Najskôr je vytvorená pandas séria obsahujúca informácie o tom, koľko variability vysvetľujú jedno-
-            # tlivé hlavné komponenty. Séria má index podľa mena jednotlivých komponentov. Prvý komponent vždy
-            # vysvetľuje najviac variability. Ako posledné je vytvorený pandas dataframe, ktorý obsahuje info-
-            # rmácie o vplyve prvkov výstupu na jednotlivé hlavné komponenty. Indexy tohoto dataframe sú pri-
-            # radené na zákalde atribútu, obsahujúceho názvy pre tieto prvky.
-            self.__layer_config['PCA_config']['percentage_variance'] = pd.Series(
-                np.round(pca.explained_variance_ratio_ * 100, decimals=1),
-                index=self.__pc_labels[:number_of_pcs_indexes])
-            self.__layer_config['PCA_config']['largest_influence'] = pd.DataFrame(pca.components_.transpose(),
-                                                                                  index=self.__activ_nodes_l)
+            # Ak boli vypočítané niektoré hlavné komponenty, sú z výstupu metódy vytvorené informácie, ktoré môžu byť
+            # následne zobrazené v panele možností. Najskôr je vytvorená pandas séria obsahujúca informácie o tom,
+            # koľko variability vysvetľujú jednotlivé hlavné komponenty. Séria má index podľa mena jednotlivých
+            # komponentov. Prvý komponent vždy vysvetľuje najviac variability. Ako posledné je vytvorený pandas
+            # dataframe, ktorý obsahuje informácie o vplyve prvkov výstupu na jednotlivé hlavné komponenty.
+            # Indexy tohoto dataframe sú priradené na zákalde atribútu, obsahujúceho názvy pre tieto prvky.
+            percentage_variance = pd.Series(np.round(variance_ratio * 100, decimals=1),
+                                            index=self.__pc_labels[:number_of_pcs_indexes])
+            largest_influence = pd.DataFrame(components.transpose(), index=self.__activ_nodes_l)
+
+        # Súradnice sú transponované, aby zodpovedali tvaru atribútu obsahujúceho výstupné hodnoty po aplikácií
+        # niektorej z metód na redukciu priestoru.
+        return {'method_cords': pca_data.transpose(),
+                'basis': {'feature_map': feature_map, 'n_components': n_components, 'mean': mean, 'scale': scale,
+                          'components': components},
+                'n_possible_pc': number_of_pcs_indexes,
+                'percentage_variance': percentage_variance,
+                'largest_influence': largest_influence}
+
+    def set_PCA_entry(self, entry):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Priradí vrstve výsledok metódy PCA vytvorený metódou compute_PCA_entry.
 
-    def apply_t_SNE(self):
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param entry: slovník obsahujúci súradnice, bázu hlavných komponentov a informácie o výstupe metódy.
+        """
+        pca_config = self.__layer_config['PCA_config']
+        self.__method_cords = entry['method_cords']
+        self.__pca_basis = entry['basis']
+        pca_config['n_possible_pc'] = entry['n_possible_pc']
+        pca_config['percentage_variance'] = entry['percentage_variance']
+        pca_config['largest_influence'] = entry['largest_influence']
+
+    def apply_t_SNE(self, generation=None):
         """
         Popis
         ----------------------------------------------------------------------------------------------------------------
         Metóda, ktorá sa použije ak bola na redukciu priestoru použitá metóda t-SNE.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param generation: poradové číslo stavu váh, ku ktorému výpočet patrí.
         """
         # Najskôr je do pomocnej premennej priradený dictionary, ktorý obsahuje hodnoty parametrov na výpočet tejto
         # metódy.
         t_sne_config = self.__layer_config['t_SNE_config']
-        # Podľa toho, či sa na výstupe nachádzajú feature mapy sú do pomocnej premennej priradené hodnoty predpovedaných
-        # výstupov.
-        if self.__has_f_maps:
 
-            # Ak sa na výstupe nachádzajú feature mapy, tak na zákalde zvolenej feature mapy sú vybraté aktivácie pre 
-            # zodpovedajúce tejto feature mape pre všetky body. Metóda t-SNE pracuje len s vektormi, preto je potre-
-            # bné jednotlivé výstupy preransformovať a vložiť do pomocnej premennej.
-            feature_map_points = self.__point_cords[self.__selected_fm, :, :, :].transpose()
-            points_cords = np.array([xi.flatten() for xi in feature_map_points])
-        else:
+        # Ak bola metóda pre rovnaké výstupy vrstvy a rovnaké parametre už vypočítaná, je výsledok použitý z vyrovnáva-
+        # cej pamäte. Výsledok je zároveň nastavený ako východisko pre ďalší výpočet s rovnakými parametrami.
+        cache_key = self.get_projection_cache_key('t-SNE', tuple(sorted(t_sne_config['used_config'].items())))
+        cached = self.__logic_layer.results_cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            self.__t_sne_state = {'feature_map': self.__selected_fm, 'config': t_sne_config['used_config'].copy(),
+                                  'embedding': cached}
+            self.__method_cords = cached.transpose()
+            return
+
+        # Do pomocnej premennej sú priradené hodnoty predpovedaných výstupov. Ak sa na výstupe nachádzajú feature mapy,
+        # sú vybraté aktivácie zvolenej feature mapy pre všetky body. Metóda t-SNE pracuje len s vektormi, preto sú
+        # jednotlivé výstupy transformované na vektory.
+        points_cords = self.get_points_matrix()
+        # Následne je na základe použitej konfigurácie uskutočnená metóda t-SNE. Výpočet prebieha v skupine procesov,
+        # aby výpočty pre jednotlivé vrstvy neblokovali jeden druhý. Výstup je transponovaný a vložený do atríbútu
+        # držiaceho súradnice, ktoré majú byť zobrazené.
+        # Ak bola metóda na rovnakej feature mape a s rovnakými parametrami už vypočítaná, výpočet pokračuje z
+        # predchádzajúcich súradníc so skráteným počtom iterácií.
+        used_config = t_sne_config['used_config']
+        state = self.__t_sne_state
+        if state is not None and state['feature_map'] == self.__selected_fm and state['config'] == used_config and \
+                len(state['embedding']) == len(points_cords):
+            used_config = get_warm_start_config(used_config, state['embedding'])
+
+        # Matica afinít závisí len od bodov, perplexity a počtu vybraných bodov. Ak sa tieto od posledného výpočtu
+        # nezmenili, je použitá uložená matica a vynechá sa hľadanie najbližších susedov aj kalibrácia perplexity.
+        affinities_key = (self.__selected_fm, used_config['perplexity'], used_config['n_landmarks'],
+                          get_points_fingerprint(points_cords))
+        affinities = None
+        if self.__t_sne_affinities is not None and self.__t_sne_affinities['key'] == affinities_key:
+            affinities = self.__t_sne_affinities['affinities']
+
+        # Počas výpočtu sú priebežné súradnice pravidelne zobrazované v grafe. Výpočet je možné z panela možností
+        # zrušiť, vtedy sú výsledkom posledné priebežné súradnice. Triedy bodov sú použité pri výbere podmnožiny bodov,
+        # ak je bodov viac ako parameter n_landmarks.
+        labels = self.__points_config['label'] if self.__points_config is not None else None
+        self.__t_sne_cancelled = False
+        self.__t_sne_progress = (0, used_config['n_iter'])
+
+        def progress(iteration, n_iter, embedding):
+            return self.publish_t_SNE_progress(generation, iteration, n_iter, embedding)
+
+        projection_pool = self.__logic_layer.projection_pool
+        try:
+            if projection_pool.is_worth_using(points_cords, 't-SNE'):
+                transformed_cords, affinities = projection_pool.t_sne(
+                    points_cords, used_config, lambda: self.__logic_layer.check_generation(generation), affinities,
+                    progress, labels)
+            else:
+                transformed_cords, affinities = compute_t_sne_projection(points_cords, used_config, affinities,
+                                                                         progress, labels)
+        finally:
+            self.__t_sne_progress = None
+            if self.__graph_frame is not None:
+                self.__graph_frame.plotting_frame.progress_text = None
+        self.__t_sne_affinities = {'key': affinities_key, 'affinities': affinities}
+        self.__logic_layer.check_generation(generation)
+        self.__t_sne_state = {'feature_map': self.__selected_fm, 'config': t_sne_config['used_config'].copy(),
+                              'embedding': transformed_cords}
+        self.__method_cords = transformed_cords.transpose()
+
+        # Do vyrovnávacej pamäte je uložený len dokončený výpočet, nie výpočet zrušený používateľom.
+        if cache_key is not None and not self.__t_sne_cancelled:
+            self.__logic_layer.results_cache.put(cache_key, transformed_cords)
+
+    def publish_t_SNE_progress(self, generation, iteration, n_iter, embedding):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Zobrazí priebežné súradnice prebiehajúceho výpočtu metódy t-SNE a nad grafom vypíše počet vykonaných iterácií.
+        Výpočet prebieha v monitorovacom vlákne, preto je ho možné z panela možností zrušiť.
 
-            # Ak sa na výstupe feature mapy nenáchádzajú sú body transponované aby príznaky prislúchajúce jednotlivým 
-            # bodom boli zoradené v stĺpcoch.
-            points_cords = self.__point_cords.transpose().copy()
-        # Následne je inicializovaná trieda pre výpočet metódy t-SNE na základe použitej konfigurácie. Následne je usku-
-        # točnená metóda t-SNE a výstup je transponovaný a vložený do atríbútu držiaceho súradnice, ktoré majú byť
-        # zobrazené.
-        tsne = TSNE(**t_sne_config['used_config'])
-        transformed_cords = tsne.fit_transform(points_cords).transpose()
-        self.__method_cords = transformed_cords
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param generation: poradové číslo stavu váh, ku ktorému výpočet patrí.
+        :param iteration:  počet vykonaných iterácií.
+        :param n_iter:     celkový počet iterácií.
+        :param embedding:  priebežné súradnice bodov s rozmerom (počet bodov, počet komponentov).
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: True, ak má byť výpočet ukončený, inak False.
+        """
+        self.__logic_layer.check_generation(generation)
+        self.__t_sne_progress = (iteration, n_iter)
+        if self.__graph_frame is not None:
+            self.__method_cords = np.array(embedding.transpose())
+            self.set_used_cords()
+            self.set_points_for_graph()
+            self.__graph_frame.plotting_frame.progress_text = 't-SNE {}/{}'.format(iteration, n_iter)
+            self.redraw_graph_if_active()
+        return self.__t_sne_cancelled
+
+    def cancel_t_SNE(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Požiada o ukončenie prebiehajúceho výpočtu metódy t-SNE. Výsledkom výpočtu sú posledné priebežné súradnice.
+        """
+        if self.__t_sne_progress is not None:
+            self.__t_sne_cancelled = True
 
     def clear(self):
         """
         Popis
         ----------------------------------------------------------------------------------------------------------------
-        Metóda vyčistí grafické zobrazenie neurónovej vrstvy, ak je nejaké zobrazované.
+        Metóda vyčistí grafické zobrazenie neurónovej vrstvy, ak je nejaké zobrazované. Zároveň je zrušená požiadavka
+        na predpočítanie feature máp, čím je prípadný prebiehajúci výpočet na pozadí ukončený.
         """
         if self.__graph_frame is not None:
             self.__graph_frame.clear()
             self.__graph_frame = None
+        self.__precompute_request = None
 
     def signal_change(self):
         """
@@ -1470,6 +2618,10 @@ class NeuralLayer:
         n_of_samples = self.__layer_config['number_of_samples']
         o_dimension = self.__layer_config['output_dimension']
         number_of_cords = min(3, o_dimension)
+
+        # Základné súradnice sú nastavené po načítaní nových vstupov, preto predchádzajúci výsledok metódy t-SNE už
+        # nezodpovedá bodom a ďalší výpočet musí začať od začiatku.
+        self.__t_sne_state = None
         if self.__has_f_maps:
             # Ak vrstva na výstupe obsahuje feature mapy, je potrebné nastaviť súradnice, ktoré majú byť použite pre
             # zobrazenie bez použitia metódy na redukciu priestoru, odlišne ako v iných prípadoch, pretože pri
@@ -1526,6 +2678,163 @@ class NeuralLayer:
         self.__layer_config['t_SNE_config']['displayed_cords'] = list(range(
                                                     self.__layer_config['t_SNE_config']['used_config']['n_components']))
 
+    def get_points_matrix(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vráti výstup vrstvy vo forme matice, v ktorej riadky zodpovedajú jednotlivým bodom. Pri vrstvách s feature
+        mapami obsahujú riadky hodnoty zvolenej feature mapy, viď. funkcia get_feature_map_matrix.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: matica výstupov v tvare (body, príznaky).
+        """
+        return get_feature_map_matrix(self.__point_cords, self.__selected_fm if self.__has_f_maps else None)
+
+    def get_precompute_parameters(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vráti názov používanej metódy na redukciu priestoru a jej parametre v rovnakom tvare, v akom sú súčasťou kľúča
+        do vyrovnávacej pamäte výsledkov metód. Premietnutie do zmrazenej bázy PCA sa do pamäte neukladá.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: n-tica s názvom metódy a jej parametrami alebo None, ak nie je čo predpočítať.
+        """
+        used_method = self.__layer_config['used_method']
+        if used_method == 'PCA' and not self.__layer_config['PCA_config']['frozen_basis']:
+            return 'PCA', TRUNCATED_PCA_COMPONENTS if self.__layer_config['PCA_config']['truncated'] else None
+        if used_method == 't-SNE':
+            return 't-SNE', tuple(sorted(self.__layer_config['t_SNE_config']['used_config'].items()))
+        return None
+
+    def start_feature_maps_precompute(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Ak je na vrstve zapnuté predpočítanie feature máp, spustí na pozadí výpočet používanej metódy na redukciu
+        priestoru pre všetky ostatné feature mapy. Výsledky sú ukladané do vyrovnávacej pamäte výsledkov metód, takže
+        pri zmene zobrazovanej feature mapy je výsledok len načítaný. Ak sa od posledného spustenia zmenili výstupy
+        vrstvy, metóda alebo jej parametre, prebiehajúci výpočet je ukončený.
+        """
+        # Ak je predpočítanie vypnuté alebo nie je čo predpočítať, je prípadný prebiehajúci výpočet ukončený bez
+        # čakania na zámok výstupov vrstiev. Metóda je volaná aj z hlavného vlákna a zámok môže počas výpočtu výstupov
+        # držať monitorovacie vlákno.
+        parameters = self.get_precompute_parameters()
+        if not (self.__has_f_maps and self.__has_points and self.__layer_config['precompute_feature_maps'] and
+                parameters is not None):
+            self.__precompute_request = None
+            return
+
+        # Výstupy vrstvy a stav, z ktorého boli vypočítané, sú prečítané naraz, aby si navzájom zodpovedali. Spolu s
+        # nimi je prečítané aj poradové číslo stavu váh, aby bol výpočet ukončený pri akejkoľvek zmene váh, aj keď
+        # výstupy skrytej vrstvy ešte neboli prepočítané. Pod zámkom sú len prečítané odkazy, výpočet prebieha až po
+        # jeho uvoľnení.
+        with self.__logic_layer.store_lock:
+            point_cords = self.__point_cords
+            cords_state = self.__cords_state
+            generation = self.__logic_layer.generation
+        request = (generation, cords_state, parameters) if cords_state is not None else None
+
+        # Ak už pre rovnaký stav a parametre výpočet prebieha alebo prebehol, nie je spustený znova. Zmenou požiadavky
+        # je prípadný prebiehajúci výpočet ukončený.
+        if request == self.__precompute_request:
+            return
+        self.__precompute_request = request
+        if request is not None:
+            thread = threading.Thread(target=self.precompute_feature_maps, args=(point_cords, request), daemon=True)
+            thread.start()
+
+    def precompute_feature_maps(self, point_cords, request):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vypočíta metódu na redukciu priestoru pre všetky feature mapy vrstvy, ktoré nie sú uložené vo vyrovnávacej
+        pamäti. Feature mapy sú rozdelené medzi toľko vlákien, koľko procesov má skupina procesov, takže výpočty
+        prebiehajú paralelne na viacerých jadrách. Najskôr sú počítané feature mapy najbližšie k zvolenej feature
+        mape. Výpočet je ukončený, ak bola medzičasom vytvorená iná požiadavka, požiadavka bola zrušená, zmenili sa
+        výstupy vrstvy alebo váhy siete.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param point_cords: transponovaný výstup vrstvy, pre ktorý sú výsledky počítané.
+        :param request:     n-tica obsahujúca poradové číslo stavu váh, stav výstupov vrstvy a parametre metódy
+                            z get_precompute_parameters.
+        """
+        generation, cords_state, parameters = request
+        results_cache = self.__logic_layer.results_cache
+        labels = self.__points_config['label'] if self.__points_config is not None else None
+        feature_maps = sorted(range(len(point_cords)), key=lambda fm: abs(fm - self.__selected_fm))
+
+        def check():
+            if self.__precompute_request != request or self.__cords_state != cords_state:
+                raise StaleComputationError()
+            self.__logic_layer.check_generation(generation)
+
+        def precompute(assigned_feature_maps):
+            for feature_map in assigned_feature_maps:
+                # Kľúč zodpovedá kľúču, ktorý vytvára metóda get_projection_cache_key pri zvolenej feature mape.
+                cache_key = ('projection', self.__layer_number, feature_map, cords_state, parameters)
+                if cache_key in results_cache:
+                    continue
+                try:
+                    check()
+                    points_cords = get_feature_map_matrix(point_cords, feature_map)
+                    if parameters[0] == 'PCA':
+                        entry = self.compute_PCA_entry(points_cords, feature_map, parameters[1], check=check)
+                    else:
+                        config = dict(parameters[1])
+                        projection_pool = self.__logic_layer.projection_pool
+                        if projection_pool.is_worth_using(points_cords, 't-SNE'):
+                            entry, _ = projection_pool.t_sne(points_cords, config, check, labels=labels)
+                        else:
+                            entry, _ = compute_t_sne_projection(points_cords, config, labels=labels)
+                    check()
+                except StaleComputationError:
+                    return
+                results_cache.put(cache_key, entry)
+
+        # Každé vlákno dostane každú n-tú feature mapu, takže aj najbližšie feature mapy sú počítané súčasne.
+        number_of_threads = self.__logic_layer.projection_pool.max_workers
+        threads = [threading.Thread(target=precompute, args=(feature_maps[i::number_of_threads],), daemon=True)
+                   for i in range(number_of_threads)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    def get_projection_cache_key(self, *parameters):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vytvorí kľúč do vyrovnávacej pamäte výsledkov metód na redukciu priestoru. Kľúč tvorí označenie projection,
+        číslo vrstvy, zvolená feature mapa, stav váh a vstupnej dávky, z ktorého boli vypočítané výstupy vrstvy, a
+        parametre metódy.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param parameters: názov metódy a jej parametre.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: kľúč do vyrovnávacej pamäte alebo None, ak nie je stav výstupov vrstvy známy.
+        """
+        if self.__cords_state is None:
+            return None
+        return 'projection', self.__layer_number, self.__selected_fm, self.__cords_state, parameters
+
+    def refit_PCA_basis(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Zahodí bázu hlavných komponentov z posledného výpočtu a metódu PCA vypočíta znova z aktuálnych výstupov vrstvy.
+        Pri zapnutej zmrazenej báze je nová báza použitá pri ďalších zmenách váh.
+        """
+        self.__pca_basis = None
+        self.apply_displayed_data_changes()
+        self.redraw_graph_if_active()
+
     def signal_feature_map_change(self):
         """
         Popis
@@ -1567,6 +2876,18 @@ class NeuralLayer:
     def points_config(self):
         return self.__points_config
 
+    @property
+    def t_sne_progress(self):
+        return self.__t_sne_progress
+
+    @property
+    def cords_state(self):
+        return self.__cords_state
+
+    @cords_state.setter
+    def cords_state(self, value):
+        self.__cords_state = value
+
     @points_config.setter
     def points_config(self, value):
         self.__points_config = value
@@ -1629,7 +2950,9 @@ class NeuralLayer:
         if value is not None:
             self.__visible = True
         else:
+            # Skrytá vrstva nepotrebuje predpočítané feature mapy, preto je prebiehajúci výpočet ukončený.
             self.__visible = False
+            self.__precompute_request = None
         self.__graph_frame = value
 
     @property
@@ -1977,6 +3300,48 @@ class MainGraphFrame(QWidget):
         self.__add_rm_layer_rc.setFixedWidth(412)
         self.__graph_area_layout.addWidget(self.__add_rm_layer_rc)
 
+        # Pri posunutí alebo zmene rozsahu scrollbaru je zistené, ktoré grafy sú viditeľné. Tie sú pri zmene váh
+        # prepočítané ako prvé.
+        scrollbar = self.scrollable_frame.horizontalScrollBar()
+        scrollbar.valueChanged.connect(self.update_visible_layers)
+        scrollbar.rangeChanged.connect(self.update_visible_layers)
+
+    def resizeEvent(self, event):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Pri zmene veľkosti okna sa môže zmeniť aj množina viditeľných grafov.
+
+        Parametre
+        ----------------------------------------------------------------------------------------------------------------
+        :param event: udalosť zmeny veľkosti.
+        """
+        super(MainGraphFrame, self).resizeEvent(event)
+        self.update_visible_layers()
+
+    def update_visible_layers(self, *args):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Zistí, ktoré grafy aktívnych vrstiev sa aspoň čiastočne nachádzajú vo viditeľnej časti scrollovacieho okna a
+        ich poradové čísla nastaví logickej vrstve. Metóda je volaná v hlavnom vlákne, preto môže bezpečne pracovať
+        s grafickými komponentami.
+        """
+        if self.__logic_layer is None:
+            return
+
+        # Poloha grafov je určená vzhľadom na obsah scrollovacieho okna. Obsah je pri posúvaní presúvaný, preto je
+        # poloha grafu posunutá o polohu obsahu a porovnaná s viditeľnou oblasťou okna.
+        viewport_rect = self.scrollable_frame.viewport().rect()
+        content_position = self.__scrollbar_content.pos()
+        visible_layers = set()
+        for layer_number in self.__active_layers:
+            graph_frame = self.__neural_layers[layer_number].graph_frame
+            if graph_frame is not None and \
+                    graph_frame.geometry().translated(content_position).intersects(viewport_rect):
+                visible_layers.add(layer_number)
+        self.__logic_layer.visible_layers = visible_layers
+
     def initialize(self, logic_layer: GraphLogicLayer):
         """
         Popis
@@ -2088,6 +3453,9 @@ class MainGraphFrame(QWidget):
             if len(self.__active_layers) == self.__number_of_layers:
                 self.__add_rm_layer_rc.hide()
 
+            # Viditeľnosť grafov je zistená až po rozmiestnení nového grafu v okne.
+            QtCore.QTimer.singleShot(0, self.update_visible_layers)
+
     def hide_layer(self, layer_number: int):
         """
         Popis
@@ -2119,6 +3487,7 @@ class MainGraphFrame(QWidget):
                 self.__add_rm_layer_rc.show()
             if self.__options_frame.active_layer == layer:
                 self.__options_frame.hide_option_bar()
+            QtCore.QTimer.singleShot(0, self.update_visible_layers)
 
     def show_layer_options_frame(self, layer_number):
         """
@@ -2217,14 +3586,22 @@ class OptionsFrame(QWidget):
                                           priestoru, konkrétne použitie metódy: PCA
         :var self.__t_SNE_rb:             radiobutton, ktorý sĺuži na nastavenie požadovanej metódy na redukciu
                                           priestoru, konkrétne použitie metódy: t-SNE
+        :var self.__precompute_fmaps_cb:  checkbox, ktorý značí, či majú byť na pozadí vypočítané výsledky používanej
+                                          metódy na redukciu priestoru pre všetky feature mapy vrstvy.
         :var self.__pca_info_gbox:        obaľovací element, ktorý obaĺuje prvky zobrazujúce informácie o vykonanej
                                           PCA analýze.
         :var self.__var_expl_lb:          listbox, ktorý zobrazuje informácie o vysvetlenej variabilite jednotlivými
                                           komponentami na zvolenej vrstve, ak bola použitá metóda PCA
         :var self.__load_scores_lb:       listbox, ktorý zobrazuje informácie o vpyve jednotlivých vstupov na zvolený
                                           hlavný komponent, ak bola použitá metóda PCA.
+        :var self.__freeze_basis_cb:      checkbox, ktorý značí, či majú byť pri zmene váh výstupy vrstvy premietnuté do
+                                          bázy hlavných komponentov z posledného výpočtu metódy PCA.
+        :var self.__refit_basis_btn:      tlačidlo na opätovný výpočet bázy hlavných komponentov.
+        :var self.__truncated_cb:         checkbox, ktorý značí, či má byť pri metóde PCA vypočítaný len obmedzený
+                                          počet najvýznamnejších hlavných komponentov.
         :var self.__t_sne_parameter_gbox: obaľovací element, ktorý v sebe zahŕňa grafické prvky pre zadávanie parametrov
                                           použitých aplikovanie metódy t-SNE.
+        :var self.__cancel_t_sne_btn:     tlačidlo na zrušenie prebiehajúceho výpočtu metódy t-SNE na aktívnej vrstve.
         :var self.__use_method_btn:       tlačidlo, na použitie zvolenej metódy pomocou radioboxu.
         :var self.__cur_used_method:      názov práve používanej metódy redukcie priestor.
         """
@@ -2272,10 +3649,15 @@ class OptionsFrame(QWidget):
         self.__no_method_rb = QRadioButton('No method')
         self.__PCA_rb = QRadioButton('PCA')
         self.__t_SNE_rb = QRadioButton('t-SNE')
+        self.__precompute_fmaps_cb = QCheckBox('Precompute all feature maps')
         self.__pca_info_gbox = QGroupBox('PCA information')
         self.__var_expl_lb = QListWidget()
         self.__load_scores_lb = QListWidget()
+        self.__freeze_basis_cb = QCheckBox('Freeze basis')
+        self.__refit_basis_btn = QPushButton('Refit')
+        self.__truncated_cb = QCheckBox('Top {} PCs'.format(TRUNCATED_PCA_COMPONENTS))
         self.__t_sne_parameter_gbox = QGroupBox('t-SNE parameters')
+        self.__cancel_t_sne_btn = QPushButton('Cancel t-SNE')
         self.__use_method_btn = QPushButton()
         self.__cur_used_method = 'No method'
 
@@ -2406,18 +3788,38 @@ class OptionsFrame(QWidget):
         radio_button_group.addButton(self.__t_SNE_rb)
         radio_button_layout.addWidget(self.__t_SNE_rb)
 
+        # Pod radio buttonmi je checkbox na predpočítanie výsledkov metódy pre všetky feature mapy vrstvy. Zobrazený je
+        # len pri vrstvách, ktoré majú na výstupe feature mapy.
+        self.__precompute_fmaps_cb.toggled.connect(self.on_precompute_fmaps_check)
+        dim_reduction_layout.addWidget(self.__precompute_fmaps_cb, alignment=QtCore.Qt.AlignLeft)
+
         # Listboxu zobrazujúcemu variabilitu vysvetlenú jednotlivými komponentami je priradená funkcia, ktorá sa zavolá
         # po kliknutí na komponent. Obaľovaciemu elementu listboxov je nastavená maximálna výška. Listbox je pridaný
         # do rozmiestnenia obaľovacieho elementu pre tento listbox so zarovnaním nahor, toto zarovnanie spôsobí, že
         # sa natiahne po maximálnu výšku obaľovacieho elementu.
         self.__var_expl_lb.currentRowChanged.connect(self.show_PCA_loading_scores)
-        self.__pca_info_gbox.setMaximumHeight(200)
+        self.__pca_info_gbox.setMaximumHeight(240)
         dim_reduction_layout.addWidget(self.__pca_info_gbox, alignment=QtCore.Qt.AlignTop)
 
-        # Vytvorenie rozmiestnenia pre podskupinu obsahujúcu informácie o výstupe metódy PCA na danej vrstve.
-        pca_info_layout = QHBoxLayout(self.__pca_info_gbox)
+        # Vytvorenie rozmiestnenia pre podskupinu obsahujúcu informácie o výstupe metódy PCA na danej vrstve. V hornej
+        # časti podskupiny je checkbox na zmrazenie bázy hlavných komponentov, checkbox na obmedzenie počtu komponentov
+        # a tlačidlo na opätovný výpočet bázy.
+        pca_info_wrapper_layout = QVBoxLayout(self.__pca_info_gbox)
+        pca_info_wrapper_layout.setAlignment(QtCore.Qt.AlignTop)
+        pca_info_wrapper_layout.setContentsMargins(0, 10, 0, 0)
+        pca_basis_layout = QHBoxLayout()
+        pca_basis_layout.setContentsMargins(5, 0, 5, 0)
+        self.__freeze_basis_cb.toggled.connect(self.on_freeze_basis_check)
+        self.__refit_basis_btn.clicked.connect(self.on_refit_basis)
+        self.__truncated_cb.toggled.connect(self.on_truncated_check)
+        pca_basis_layout.addWidget(self.__freeze_basis_cb)
+        pca_basis_layout.addWidget(self.__truncated_cb)
+        pca_basis_layout.addWidget(self.__refit_basis_btn, alignment=QtCore.Qt.AlignRight)
+        pca_info_wrapper_layout.addLayout(pca_basis_layout)
+        pca_info_layout = QHBoxLayout()
         pca_info_layout.setAlignment(QtCore.Qt.AlignTop)
-        pca_info_layout.setContentsMargins(0, 10, 0, 0)
+        pca_info_layout.setContentsMargins(0, 0, 0, 0)
+        pca_info_wrapper_layout.addLayout(pca_info_layout)
 
         # Vytvorenie obaľovacieho elementu pre listbox vysvetľujúci variabilitu a pridanie tohto kontajnera do
         # rozmiestnenia informačnej podskupiny.
@@ -2454,15 +3856,20 @@ class OptionsFrame(QWidget):
 
         # Vytvorenie listov obsahujúcich identifikátor a názov pre inštancie triedy RewritableLabel. Identifikátor je
         # zhodný s kľúčom do konfiguračnej premennej pre výpočet metódy t-SNE.
-        t_sne_parameter_id_list = ['n_components', 'perplexity', 'early_exaggeration', 'learning_rate', 'n_iter']
+        t_sne_parameter_id_list = ['n_components', 'perplexity', 'early_exaggeration', 'learning_rate', 'n_iter',
+                                   'n_landmarks']
         t_sne_parameter_label = ['Number of components:', 'Perplexity:', 'Early exaggeration:', 'Learning rate:',
-                                 'Number of iteration:']
+                                 'Number of iteration:', 'Landmarks (0 = all points):']
         for i in range(len(t_sne_parameter_id_list)):
             t_sne_parameter_rw = RewritableLabel(t_sne_parameter_id_list[i], t_sne_parameter_label[i], '-',
                                                  self.validate_t_sne_entry)
             t_sne_par_layout.addWidget(t_sne_parameter_rw, alignment=QtCore.Qt.AlignLeft)
             self.__tSNE_parameters_dict[t_sne_parameter_id_list[i]] = t_sne_parameter_rw
 
+        # Pod parametrami je tlačidlo na zrušenie prebiehajúceho výpočtu metódy t-SNE.
+        self.__cancel_t_sne_btn.clicked.connect(self.on_cancel_t_sne)
+        t_sne_par_layout.addWidget(self.__cancel_t_sne_btn, alignment=QtCore.Qt.AlignLeft)
+
         # Nastavenie textu tlačidla, jeho pridanie do rozmiestnenia a nastavenie funkcie, ktorá bude zavolaná po kliknu-
         # tí na tlačidlo.
         self.__use_method_btn.setText('Use method')
@@ -2565,7 +3972,15 @@ class OptionsFrame(QWidget):
         elif config_selected_method == 't-SNE':
             self.__t_SNE_rb.setChecked(True)
 
-        # Ak je aktuálne použitá metóda PCA, sú vypísané aj informácie o výstupe metódy.
+        # Checkbox predpočítania feature máp je zobrazený len pri vrstvách s feature mapami.
+        if self.__changed_config['has_feature_maps']:
+            self.__precompute_fmaps_cb.setChecked(self.__changed_config['precompute_feature_maps'])
+            self.__precompute_fmaps_cb.show()
+
+        # Checkboxy zmrazenej bázy a obmedzeného počtu komponentov zodpovedajú konfigurácií vrstvy. Ak je aktuálne
+        # použitá metóda PCA, sú vypísané aj informácie o výstupe metódy.
+        self.__freeze_basis_cb.setChecked(self.__changed_config['PCA_config']['frozen_basis'])
+        self.__truncated_cb.setChecked(self.__changed_config['PCA_config']['truncated'])
         if self.__cur_used_method == 'PCA':
             self.update_PCA_information()
 
@@ -2613,7 +4028,9 @@ class OptionsFrame(QWidget):
         Funkcia, ktorá sa zavolá po zvolení metódy a klikutí na tlačidlo Use method. Na základe zvolenej metódy, nastaví
         v konfiguračnej premennej hodnotu aktuálnej metódy a taktiež prispôsobí vzhľad a hodnoty na panele možností.
         """
-        if self.__active_layer is not None:
+        # Ak na aktívnej vrstve práve prebieha výpočet metódy t-SNE, nie je možné použiť inú metódu, kým výpočet neskončí
+        # alebo nie je zrušený.
+        if self.__active_layer is not None and self.__active_layer.t_sne_progress is None:
             # Je získaná metóda, podľa zakliknutého radio buttonu. Je definovaná premenná need_recalculation, aby
             # nedošlo k zbytočnému prepočítavaniu na vrstve, nedošlo k žiadne zmene ale napríklad bolo tlačidlo
             # viac krát stlačené.
@@ -2824,8 +4241,7 @@ class OptionsFrame(QWidget):
             # Ak je aktuálne používaná metóda PCA, sú nastavené názvy vstupov a hodnoty vstupov sú nastavené na zákaldne
             # posledne použitých hodnôt zadaných používateľom.
             entry_names = ['PC axis X:', 'PC axis Y:', 'PC axis Z:']
-            number_of_pcs = min(self.__changed_config['output_dimension'],
-                                self.__changed_config['number_of_samples'])
+            number_of_pcs = self.get_number_of_possible_PCs()
             # Podľa počtu hlavných komponentov, ktoré je možné zobraziť je do premennej obsahujúcej informáciu o rozsahu
             # možných zadaných hodnôt priradená informácia.
             if number_of_pcs == 0:
@@ -2959,6 +4375,7 @@ class OptionsFrame(QWidget):
         ----------------------------------------------------------------------------------------------------------------
         Metóda na skrytie grafických prvkov v rámci podskupiny redukcia priestoru.
         """
+        self.__precompute_fmaps_cb.hide()
         self.hide_all_methods_information()
 
     def hide_all_methods_information(self):
@@ -3019,6 +4436,82 @@ class OptionsFrame(QWidget):
             self.__active_layer.use_config()
             self.__active_layer.redraw_graph_if_active()
 
+    def on_freeze_basis_check(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Metóda, ktorá sa zavolá v prípade, ak bolo kliknuté na checkbox freeze_basis. V rámci tejto metódy sa aktualizuje
+        konfiguračná premenná. Zmena sa prejaví pri ďalšom výpočte metódy PCA.
+        """
+        if self.__changed_config:
+            self.__changed_config['PCA_config']['frozen_basis'] = self.__freeze_basis_cb.isChecked()
+
+    def on_precompute_fmaps_check(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Metóda, ktorá sa zavolá v prípade, ak bolo kliknuté na checkbox precompute_fmaps. V rámci tejto metódy sa
+        aktualizuje konfiguračná premenná a na aktívnej vrstve je výpočet ostatných feature máp spustený, prípadne
+        ukončený.
+        """
+        if self.__changed_config:
+            self.__changed_config['precompute_feature_maps'] = self.__precompute_fmaps_cb.isChecked()
+            self.__active_layer.start_feature_maps_precompute()
+
+    def on_refit_basis(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Metóda, ktorá sa zavolá po kliknutí na tlačidlo refit. Báza hlavných komponentov aktívnej vrstvy je vypočítaná
+        znova a sú aktualizované informácie o výstupe metódy PCA.
+        """
+        if self.__changed_config and self.__changed_config['used_method'] == 'PCA':
+            self.__active_layer.refit_PCA_basis()
+            self.update_PCA_information()
+
+    def on_truncated_check(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Metóda, ktorá sa zavolá v prípade, ak bolo kliknuté na checkbox truncated. V rámci tejto metódy sa aktualizuje
+        konfiguračná premenná. Ak by niektorá zo zobrazovaných súradníc presahovala počet komponentov, sú zobrazované
+        súradnice nastavené na predvolené hodnoty. Ak je používaná metóda PCA, je vypočítaná znova.
+        """
+        if self.__changed_config and \
+                self.__changed_config['PCA_config']['truncated'] != self.__truncated_cb.isChecked():
+            self.__changed_config['PCA_config']['truncated'] = self.__truncated_cb.isChecked()
+            if max(self.__changed_config['PCA_config']['displayed_cords'], default=-1) >= \
+                    self.get_number_of_possible_PCs():
+                self.__active_layer.initialize_default_PCA_cords()
+            if self.__changed_config['used_method'] == 'PCA':
+                self.on_refit_basis()
+                self.set_cords_entries_according_chosen_method()
+
+    def get_number_of_possible_PCs(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Vráti počet hlavných komponentov, ktoré je možné pre aktívnu vrstvu zobraziť.
+
+        Návratová hodnota
+        ----------------------------------------------------------------------------------------------------------------
+        :return: počet možných hlavných komponentov.
+        """
+        number_of_pcs = min(self.__changed_config['output_dimension'], self.__changed_config['number_of_samples'])
+        if self.__changed_config['PCA_config']['truncated']:
+            number_of_pcs = min(number_of_pcs, TRUNCATED_PCA_COMPONENTS)
+        return number_of_pcs
+
+    def on_cancel_t_sne(self):
+        """
+        Popis
+        ----------------------------------------------------------------------------------------------------------------
+        Metóda, ktorá sa zavolá po kliknutí na tlačidlo cancel t-SNE. Prebiehajúci výpočet metódy t-SNE na aktívnej
+        vrstve je ukončený a zobrazené sú posledné priebežné súradnice.
+        """
+        if self.__active_layer is not None:
+            self.__active_layer.cancel_t_SNE()
+
     def on_lock_view_check(self):
         """
         Popis
@@ -3206,8 +4699,7 @@ class OptionsFrame(QWidget):
             # pretypovaná na int. Ak sa pri pretypovaní neobjaví výnimka, pokraćuje sa ďalej, ak
             # áno je nastavená hodnota err ako text do zobrazovaného vstupu.
             bottom_border = 1
-            top_border = min(self.__changed_config['output_dimension'],
-                             self.__changed_config['number_of_samples']) + 1
+            top_border = self.get_number_of_possible_PCs() + 1
             changed_cords = self.__changed_config['PCA_config']['displayed_cords']
             try:
                 new_value = int(value) - 1
@@ -3279,6 +4771,14 @@ class OptionsFrame(QWidget):
                 if not (test_tuple[0] <= test_tuple[1](value) <= test_tuple[2]):
                     self.__tSNE_parameters_dict[identificator].set_entry_text('err')
                     return False
+
+                # Počet vybraných bodov musí byť 0, teda všetky body, alebo aspoň najmenší počet, pre ktorý je možné
+                # metódu pri zadanom počte komponentov a perplexity vypočítať.
+                if identificator == 'n_landmarks' and \
+                        0 < test_tuple[1](value) < get_min_landmarks(
+                            self.__changed_config['t_SNE_config']['options_config']):
+                    self.__tSNE_parameters_dict[identificator].set_entry_text('err')
+                    return False
                 parameter_label = self.__tSNE_parameters_dict[identificator]
                 parameter_label.set_variable_label(value)
                 parameter_label.show_variable_label()
@@ -42,6 +42,8 @@ class PlottingFrame(QWidget):
         :var self.__n_of_output:  atribút nesie informáciu o tom, koľko môže byť na výstupe dimenzií.
         :var self.__n_of_displ:   udáva počet dimenzií, ktoré sú zobazované.
         :var self.__graph_title:  obsahuje názov grafu, ktoré sa bude zobrazovať nad figúrou.
+        :var self.__progress_txt: text o priebehu výpočtu, ktorý je zobrazený za názvom grafu. Ak je None, nie je
+                                  zobrazený.
         :var self.__axis_labels:  obsahuje označenia jednotlivých osí grafu.
         :var self.__master:       odkaz na nadradenú triedu, ktorej budú odosielané signály o požadovaných zmenách.
         :var self.__pts_config:   odkaz na konfiguráciu načítnaých bodov.
@@ -72,6 +74,7 @@ class PlottingFrame(QWidget):
 
         # Definícia atribútrov ohľadom názvu grafu a označení osí grafu.
         self.__graph_title = 'Graf'
+        self.__progress_txt = None
         self.__axis_labels = ['Label X', 'Label Y', 'Label Z']
 
         # Definícia atribútov ohľadom vzhľadu a zobrazenia načítaných bodov.
@@ -208,7 +211,10 @@ class PlottingFrame(QWidget):
             self.__axis.grid()
 
             # Nastavenie zobrazovaného nadpisu grafu a označenia osi X.
-            self.__axis.set_title(self.__graph_title)
+            if self.__progress_txt is None:
+                self.__axis.set_title(self.__graph_title)
+            else:
+                self.__axis.set_title('{} ({})'.format(self.__graph_title, self.__progress_txt))
             self.__axis.set_xlabel(self.__axis_labels[0])
 
             # Podľa počtu vrstvy výstupov, ktoré má graf zobrazovať sú prípadne pomenované aj ďalšie osi.
@@ -479,6 +485,14 @@ class PlottingFrame(QWidget):
     def graph_title(self, new_title):
         self.__graph_title = new_title
 
+    @property
+    def progress_text(self):
+        return self.__progress_txt
+
+    @progress_text.setter
+    def progress_text(self, new_text):
+        self.__progress_txt = new_text
+
     @property
     def graph_labels(self):
         return self.__axis_labels